@@ -1,4 +1,4 @@
-from typing import Iterable, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 import portan.library as lib
 import portan.source as src
@@ -25,15 +25,31 @@ class Instrument:
         range of dates in ISO format (i.e., [begin, end])
     source: Source
         source of prices (e.g., Yahoo)
+    cache: Optional[str]
+        directory in which to cache the prices fetched from `source`
+        (defaults to None, i.e., no caching)
+    ttl: Optional[float]
+        seconds during which the prices of today cached in memory are
+        served as is, after which they are served while being fetched
+        again in the background (defaults to None, i.e., prices of today
+        are always fetched; ignored when `cache` is None)
+    synthetic: Optional[Dict[str, float]]
+        settings of the synthetic source of prices among seed, drift,
+        volatility, correlation, missing, gaps and gap (e.g.,
+        {"drift": 0.1, "gaps": 0.01}), as per :py:class:`PriceSourceFactory`
+        (defaults to None, i.e., default settings; ignored unless
+        `source` is synthetic)
 
     Raises
     ------
     PortanError
         if `range_` contains values which do not represent dates in ISO format,
         if `range_` contains values which aren't valid dates in the Gregorian
-        calendar, or
+        calendar,
         if the second value in `range_` represents a date prior to the first
-        value in `range_`
+        value in `range_`,
+        if `ttl` is negative, or
+        if `synthetic` contains unknown or invalid settings
     """
 
     def __init__(
@@ -42,11 +58,17 @@ class Instrument:
         range_: Tuple[str, str],
         *,
         source: Source = Source.YAHOO,
+        cache: Optional[str] = None,
+        ttl: Optional[float] = None,
+        synthetic: Optional[Dict[str, float]] = None,
     ):
         self._ticker = ticker
         self._range: src.DateRange = self._convert_range(range_)
-        self._source: src.PriceSource = self._convert_source(source)
+        self._source, self._async_source = self._convert_source(
+            source, cache, ttl, synthetic
+        )
         self._dated: Optional[src.DatedPriceSeries] = None
+        self._report: Optional[src.FetchReport] = None
 
     def _convert_range(self, range_: Tuple[str, str]) -> src.DateRange:
         try:
@@ -60,14 +82,26 @@ class Instrument:
             )
             raise PortanError(msg) from err
 
-    def _convert_source(self, source: Source) -> src.PriceSource:
-        factory = src.PriceSourceFactory()
+    def _convert_source(
+        self,
+        source: Source,
+        cache: Optional[str],
+        ttl: Optional[float],
+        synthetic: Optional[Dict[str, float]],
+    ) -> Tuple[src.PriceSource, src.AsyncPriceSource]:
         try:
-            return factory.get(source.value)
-        except ValueError as err:
+            factory = src.PriceSourceFactory(
+                cache=cache,
+                coalesce=True,
+                ttl=ttl,
+                **(synthetic or {}),
+            )
+            return factory.get(source.value), factory.get_async(source.value)
+        except (TypeError, ValueError) as err:
             msg = (
                 f"cannot instantiate {self.__class__.__name__}; "
-                f"unknown source"
+                f"unknown source, negative ttl, or unknown or invalid "
+                f"synthetic settings"
             )
             raise PortanError(msg) from err
 
@@ -82,11 +116,37 @@ class Instrument:
             if the fetched prices are in an unexpected format (e.g., non-finite
             prices)
         """
-        try:
-            self._dated = self._source.get(self._ticker, self._range)
-        except src.SourceError as err:
-            msg = "cannot fetch prices from source"
-            raise SourceError(msg) from err
+        with src.recording() as recorder:
+            try:
+                self._dated = self._source.get(self._ticker, self._range)
+            except src.SourceError as err:
+                msg = "cannot fetch prices from source"
+                raise SourceError(msg) from err
+            finally:
+                self._report = recorder.report()
+
+    async def fetch_async(self):
+        """Fetch the prices from source for this instrument without
+        blocking the running event loop.
+
+        Raises
+        ------
+        SourceError
+            if there's an unexpected error when fetching prices from this
+            instrument's source, or
+            if the fetched prices are in an unexpected format (e.g., non-finite
+            prices)
+        """
+        with src.recording() as recorder:
+            try:
+                self._dated = await self._async_source.get(
+                    self._ticker, self._range
+                )
+            except src.SourceError as err:
+                msg = "cannot fetch prices from source"
+                raise SourceError(msg) from err
+            finally:
+                self._report = recorder.report()
 
     @property
     def prices(self) -> Iterable[Tuple[str, float]]:
@@ -106,6 +166,22 @@ class Instrument:
         dated = self._get_dated_or_raise_if_none()
         return dated.to_basic()
 
+    @property
+    def report(self) -> Optional[Dict[str, Any]]:
+        """Get the report of the last fetch of prices for this instrument
+        (i.e., seconds spent in each phase, number of prices received and
+        dropped, number of bytes received, and cache status, by ticker).
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            the report of the last fetch, or None if prices were never
+            fetched
+        """
+        if self._report is None:
+            return None
+        return self._report.to_basic()
+
     def mean(self) -> float:
         """Get the annualized mean of the continuous returns
         of this instrument.
@@ -169,7 +245,7 @@ class Instrument:
     @property
     def _prices(self) -> lib.PriceSequence:
         dated = self._get_dated_or_raise_if_none()
-        return lib.PriceSequence.from_float(dated.prices)
+        return lib.PriceSequence.from_float(dated.to_arrays()[1])
 
     def _get_dated_or_raise_if_none(self) -> src.DatedPriceSeries:
         self._raise_if_dated_is_none()
@@ -1,4 +1,4 @@
-from typing import Dict, Iterable, Optional, SupportsFloat, Tuple
+from typing import Any, Dict, Iterable, Optional, SupportsFloat, Tuple
 
 import portan.library as lib
 import portan.source as src
@@ -20,6 +20,9 @@ class MVO:
         self._range: Optional[src.DateRange] = None
         self._minimum: Optional[lib.Rate] = None
         self._source: Optional[src.PriceSource] = None
+        self._async_source: Optional[src.AsyncPriceSource] = None
+        self._dated: Optional[src.DatedPricesSeries] = None
+        self._report: Optional[src.FetchReport] = None
 
     def optimise(
         self,
@@ -28,6 +31,7 @@ class MVO:
         *,
         minimum: SupportsFloat,
         source: Source = Source.YAHOO,
+        cache: Optional[str] = None,
     ) -> Dict[str, int]:
         """Find the optimal allocation between the financial instruments
         identified by `tickers` by using historical prices.
@@ -60,6 +64,9 @@ class MVO:
             minimum acceptable expected annual **continuous** rate of return
         source
             source of prices (e.g., Yahoo)
+        cache
+            directory in which to cache the prices fetched from `source`
+            (defaults to None, i.e., no caching)
 
         Raises
         ------
@@ -93,21 +100,94 @@ class MVO:
             where weights are integers corresponding to percentage
             values (i.e., 25 is 25%)
         """
-        self._setup(tickers, range_, minimum, source)
+        self._setup(tickers, range_, minimum, source, cache)
+        self._dated = self._fetch()
         weights = self._optimise()
         return self._map_to_tickers(weights)
 
+    async def optimise_async(
+        self,
+        tickers: Iterable[str],
+        range_: Tuple[str, str],
+        *,
+        minimum: SupportsFloat,
+        source: Source = Source.YAHOO,
+        cache: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """Find the optimal allocation between the financial instruments
+        identified by `tickers` by using historical prices, without
+        blocking the running event loop while fetching the prices.
+
+        See :py:meth:`optimise` for details.
+
+        Parameters
+        ----------
+        tickers
+            identifiers of financial instruments on which to
+            perform the optimisation, where each ticker must be
+            valid as per `source` (e.g., Apple's stock identifier
+            is `AAPL` for Yahoo)
+        range_
+            ranges of dates in ISO format (i.e., [begin, end])
+        minimum
+            minimum acceptable expected annual **continuous** rate of return
+        source
+            source of prices (e.g., Yahoo)
+        cache
+            directory in which to cache the prices fetched from `source`
+            (defaults to None, i.e., no caching)
+
+        Raises
+        ------
+        PortanError
+            in the same cases as :py:meth:`optimise`
+        InfeasibleError
+            if the problem appears infeasible
+        SourceError
+            if there's an unexpected error when fetching prices, or
+            if the fetched prices are in an unexpected format (e.g., non-finite
+            prices)
+
+        Returns
+        -------
+        Dict[str, int]
+            mapping of tickers to weights (i.e., optimal allocation),
+            where weights are integers corresponding to percentage
+            values (i.e., 25 is 25%)
+        """
+        self._setup(tickers, range_, minimum, source, cache)
+        self._dated = await self._fetch_async()
+        weights = self._optimise()
+        return self._map_to_tickers(weights)
+
+    @property
+    def report(self) -> Optional[Dict[str, Any]]:
+        """Get the report of the last fetch of prices for this optimiser
+        (i.e., seconds spent in each phase, number of prices received and
+        dropped, number of bytes received, and cache status, by ticker).
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            the report of the last fetch, or None if prices were never
+            fetched
+        """
+        if self._report is None:
+            return None
+        return self._report.to_basic()
+
     def _setup(
         self,
         tickers: Iterable[str],
         range_: Tuple[str, str],
         minimum: SupportsFloat,
         source: Source,
+        cache: Optional[str],
     ):
         self._tickers = self._convert_tickers(tickers)
         self._range = self._convert_range(range_)
         self._minimum = self._convert_minimum(minimum)
-        self._source = self._convert_source(source)
+        self._source, self._async_source = self._convert_source(source, cache)
 
     @staticmethod
     def _convert_tickers(tickers: Iterable[str]) -> Tuple[str, ...]:
@@ -138,10 +218,13 @@ class MVO:
             raise PortanError(msg) from err
 
     @staticmethod
-    def _convert_source(source: Source) -> src.PriceSource:
-        factory = src.PriceSourceFactory()
+    def _convert_source(
+        source: Source,
+        cache: Optional[str],
+    ) -> Tuple[src.PriceSource, src.AsyncPriceSource]:
+        factory = src.PriceSourceFactory(cache=cache, coalesce=True)
         try:
-            return factory.get(source.value)
+            return factory.get(source.value), factory.get_async(source.value)
         except ValueError as err:
             msg = "cannot optimise; unknown source"
             raise PortanError(msg) from err
@@ -193,19 +276,30 @@ class MVO:
 
     @property
     def _prices(self) -> lib.PriceMatrix:
-        dated = self._dated  # cache (operation is long)!
-        if len(dated) == 0:  # corner case!
+        if len(self._dated) == 0:  # corner case!
             # we ensure a length match with weights
             return lib.PriceMatrix.empties(len(self._tickers))
-        return lib.PriceMatrix.from_float(dated.prices)
+        return lib.PriceMatrix.from_float(self._dated.prices.to_array())
 
-    @property
-    def _dated(self) -> src.DatedPricesSeries:
-        try:
-            return self._source.get(self._tickers, self._range)
-        except src.SourceError as err:
-            msg = "cannot fetch prices from source"
-            raise SourceError(msg) from err
+    def _fetch(self) -> src.DatedPricesSeries:
+        with src.recording() as recorder:
+            try:
+                return self._source.get(self._tickers, self._range)
+            except src.SourceError as err:
+                msg = "cannot fetch prices from source"
+                raise SourceError(msg) from err
+            finally:
+                self._report = recorder.report()
+
+    async def _fetch_async(self) -> src.DatedPricesSeries:
+        with src.recording() as recorder:
+            try:
+                return await self._async_source.get(self._tickers, self._range)
+            except src.SourceError as err:
+                msg = "cannot fetch prices from source"
+                raise SourceError(msg) from err
+            finally:
+                self._report = recorder.report()
 
     def _map_to_tickers(self, weights: lib.WeightSequence) -> Dict[str, int]:
         return {
@@ -2,9 +2,28 @@ from enum import Enum
 
 
 class Source(Enum):
-    """Source of prices (e.g., Yahoo)."""
+    """Source of prices (e.g., Yahoo).
+
+    The yahoo-chart source fetches the same prices as the yahoo
+    source, but reads the chart endpoint of Yahoo Finance directly (i.e.,
+    without yfinance nor pandas), from the base URL set by the environment
+    variable `PORTAN_YAHOO_BASE_URL` (defaults to Yahoo Finance; e.g., a
+    local stand-in).
+
+    The local source reads the prices of each financial instrument from
+    a CSV or NumPy file named after its ticker in the directory set by the
+    environment variable `PORTAN_LOCAL_DIRECTORY` (defaults to the current
+    directory).
+
+    The synthetic source generates deterministic prices following a
+    geometric Brownian motion for any ticker (i.e., without any network
+    nor file), which is meant for offline benchmarks and tests.
+    """
 
     YAHOO = "yahoo"
+    YAHOO_CHART = "yahoo-chart"
+    LOCAL = "local"
+    SYNTHETIC = "synthetic"
 
     def __str__(self) -> str:
         return self.name
@@ -1,3 +1,4 @@
+from .accumulator import RateAccumulator, RateMatrixAccumulator
 from .converter import BrownianConverter
 from .frequency import Frequency
 from .mvo import MeanVarianceOptimiser
@@ -23,6 +24,8 @@ __all__ = [
     "Rate",
     "RateMatrix",
     "RateSequence",
+    "RateAccumulator",
+    "RateMatrixAccumulator",
     "WeightSequence",
     "BalancedWeights",
     "Weighted",
@@ -0,0 +1,4 @@
+from .matrix import RateMatrixAccumulator
+from .rate import RateAccumulator
+
+__all__ = ["RateAccumulator", "RateMatrixAccumulator"]
@@ -0,0 +1,215 @@
+from typing import Iterable, Optional, Type, TypeVar
+
+import numpy as np
+
+from ..mean import Mean
+from ..mean.sequence import MeanSequence
+from ..price.sequence import PriceSequence
+from ..scatter import CovarianceMatrix
+
+T = TypeVar("T", bound="RateMatrixAccumulator")
+
+
+class RateMatrixAccumulator:
+    """Online accumulator of the continuous growth rates of the prices
+    of financial instruments, fed one price per instrument at a time
+    (e.g., daily closes as they arrive).
+
+    Each sequence of prices added (i.e., a price per instrument, always
+    in the same order) updates the sample means and the sums of
+    products of deviations from the means of the rates in O(n²) time
+    and memory (i.e., Welford's algorithm), while accumulators of
+    consecutive prices are merged exactly (e.g., partial results from
+    workers).
+
+    Parameters
+    ----------
+    prices: Iterable[PriceSequence]
+        sequences of prices to add, in order (defaults to none)
+
+    Raises
+    ------
+    ValueError
+        if the sequences in `prices` are not all of the same length, or
+        if any pair of consecutive prices of an instrument in `prices` is
+        such that their ratio is either very big or very small (i.e.,
+        close or equal to +inf or 0.0)
+    """
+
+    @classmethod
+    def from_float(cls: Type[T], prices: Iterable[Iterable[float]]) -> T:
+        """Create an accumulator from floating-point prices.
+
+        Parameters
+        ----------
+        prices
+            sequences of prices (i.e., a price per instrument) to add,
+            in order
+
+        Raises
+        ------
+        ValueError
+            if the sequences in `prices` are not all of the same length,
+            if any price in `prices` is non-finite,
+            if any price in `prices` is not strictly positive, or
+            if any pair of consecutive prices of an instrument in
+            `prices` is such that their ratio is either very big or very
+            small
+
+        Returns
+        -------
+        T
+            accumulator of `prices`
+        """
+        return cls(PriceSequence.from_float(value) for value in prices)
+
+    def __init__(self, prices: Iterable[PriceSequence] = ()):
+        self._first: Optional[np.ndarray] = None
+        self._last: Optional[np.ndarray] = None
+        self._count = 0
+        self._means = np.empty(0)
+        self._products = np.empty((0, 0))
+        for value in prices:
+            self.add(value)
+
+    @property
+    def count(self) -> int:
+        """Number of rates accumulated per instrument (i.e., one less than
+        the number of sequences of prices added, if any)."""
+        return self._count
+
+    @property
+    def length(self) -> int:
+        """Number of instruments (i.e., zero until prices are added)."""
+        return len(self._means)
+
+    def add(self, prices: PriceSequence):
+        """Add `prices` after the last prices added, in-place.
+
+        Parameters
+        ----------
+        prices
+            price of each instrument following the last prices added
+
+        Raises
+        ------
+        ValueError
+            if the length of `prices` is not equal to the number of
+            instruments, or
+            if the ratio of any price in `prices` over the last price of
+            the instrument is either very big or very small (i.e., close
+            or equal to +inf or 0.0)
+        """
+        values = np.array([float(price) for price in prices])
+        if self._last is None:
+            self._start(values)
+            return
+        self._raise_if_length_mismatch(len(values))
+        self._update(self._growth(self._last, values))
+        self._last = values
+
+    def _start(self, values: np.ndarray):
+        self._first, self._last = values, values
+        self._means = np.zeros(len(values))
+        self._products = np.zeros((len(values), len(values)))
+
+    def _raise_if_length_mismatch(self, length: int):
+        if length != self.length:
+            msg = (
+                "cannot add prices; length of prices must be equal to "
+                "the number of instruments"
+            )
+            raise ValueError(msg)
+
+    @staticmethod
+    def _growth(begin: np.ndarray, end: np.ndarray) -> np.ndarray:
+        return PriceSequence._growth(np.stack([begin, end], axis=1))[:, 0]
+
+    def _update(self, rates: np.ndarray):
+        self._count += 1
+        deviations = rates - self._means
+        self._means = self._means + deviations / self._count
+        self._products = self._products + np.outer(deviations, deviations) * (
+            (self._count - 1) / self._count  # exactly symmetric!
+        )
+
+    def merge(self: T, other: T) -> T:
+        """Merge this accumulator with `other`, whose prices follow the
+        prices of this accumulator (i.e., the rates from the last prices of
+        this accumulator to the first prices of `other` are accumulated).
+
+        This operation is *not* performed in-place.
+
+        Parameters
+        ----------
+        other
+            accumulator of the prices following the prices of this
+            accumulator
+
+        Raises
+        ------
+        ValueError
+            if the number of instruments of `other` is not equal to the
+            number of instruments of this accumulator, or
+            if the ratio of any first price of `other` over the last price
+            of the instrument in this accumulator is either very big or
+            very small (i.e., close or equal to +inf or 0.0)
+
+        Returns
+        -------
+        T
+            accumulator of the prices of both accumulators
+        """
+        merged = self._copy()
+        if other._first is None:
+            return merged
+        if merged._last is None:
+            return other._copy()
+        merged._raise_if_length_mismatch(other.length)
+        merged._update(self._growth(merged._last, other._first))
+        merged._combine(other._count, other._means, other._products)
+        merged._last = other._last
+        return merged
+
+    def _combine(self, count: int, means: np.ndarray, products: np.ndarray):
+        if count == 0:
+            return
+        total = self._count + count
+        deviations = means - self._means
+        self._means = self._means + deviations * count / total
+        self._products = (
+            self._products
+            + products
+            + np.outer(deviations, deviations) * (self._count * count / total)
+        )
+        self._count = total
+
+    def _copy(self: T) -> T:
+        copied = self.__class__()
+        copied.__dict__.update(self.__dict__)  # arrays are never mutated!
+        return copied
+
+    def means(self) -> MeanSequence:
+        """Get the sample mean (i.e., arithmetic) of the rates accumulated
+        for each instrument.
+
+        Returns
+        -------
+        MeanSequence
+            sample mean of the rates of each instrument (in order)
+        """
+        return MeanSequence(Mean(mean) for mean in self._means.tolist())
+
+    def covariances(self) -> CovarianceMatrix:
+        """Get the covariance matrix of the covariances between the rates
+        accumulated for each instrument.
+
+        Returns
+        -------
+        CovarianceMatrix
+            covariance matrix of the covariances between the rates of
+            each instrument
+        """
+        if self._count <= 1:
+            return CovarianceMatrix.from_array(np.zeros(self._products.shape))
+        return CovarianceMatrix.from_array(self._products / (self._count - 1))
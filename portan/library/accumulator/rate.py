@@ -0,0 +1,186 @@
+from math import sqrt
+from typing import Iterable, Optional, Type, TypeVar
+
+import numpy as np
+
+from ..brownian import IArithmeticBrownian
+from ..mean import Mean
+from ..price import Price
+from ..price.sequence import PriceSequence
+from ..scatter import Dispersion
+
+T = TypeVar("T", bound="RateAccumulator")
+
+
+class RateAccumulator(IArithmeticBrownian):
+    """Online accumulator of the continuous growth rates of the prices
+    of a financial instrument, fed one price at a time (e.g., daily
+    closes as they arrive).
+
+    Each price added updates the sample mean and the sum of squared
+    deviations from the mean of the rates in constant time and memory
+    (i.e., Welford's algorithm), while accumulators of consecutive
+    prices are merged exactly (e.g., partial results from workers). The
+    rates and updates are those of :py:class:`RateMatrixAccumulator`,
+    thus both accumulate identical statistics for an instrument.
+
+    Parameters
+    ----------
+    prices: Iterable[Price]
+        prices to add, in order (defaults to none)
+
+    Raises
+    ------
+    ValueError
+        if any pair of consecutive prices in `prices` is such that
+        their ratio is either very big or very small (i.e., close or
+        equal to +inf or 0.0)
+    """
+
+    @classmethod
+    def from_float(cls: Type[T], prices: Iterable[float]) -> T:
+        """Create an accumulator from floating-point prices.
+
+        Parameters
+        ----------
+        prices
+            prices to add, in order
+
+        Raises
+        ------
+        ValueError
+            if any price in `prices` is non-finite,
+            if any price in `prices` is not strictly positive, or
+            if any pair of consecutive prices in `prices` is such that
+            their ratio is either very big or very small
+
+        Returns
+        -------
+        T
+            accumulator of `prices`
+        """
+        return cls(Price(price) for price in prices)
+
+    def __init__(self, prices: Iterable[Price] = ()):
+        self._first: Optional[Price] = None
+        self._last: Optional[Price] = None
+        self._count = 0
+        self._mean = 0.0
+        self._squares = 0.0
+        for price in prices:
+            self.add(price)
+
+    @property
+    def count(self) -> int:
+        """Number of rates accumulated (i.e., one less than the number of
+        prices added, if any)."""
+        return self._count
+
+    def add(self, price: Price):
+        """Add `price` after the last price added, in-place.
+
+        Parameters
+        ----------
+        price
+            price following the last price added
+
+        Raises
+        ------
+        ValueError
+            if the ratio of `price` over the last price added is either
+            very big or very small (i.e., close or equal to +inf or 0.0)
+        """
+        if self._last is None:
+            self._first = price
+        else:
+            self._update(self._growth(self._last, price))
+        self._last = price
+
+    @staticmethod
+    def _growth(begin: Price, end: Price) -> float:
+        prices = np.array([float(begin), float(end)], dtype=np.float64)
+        return float(PriceSequence._growth(prices)[0])
+
+    def _update(self, rate: float):
+        self._count += 1
+        deviation = rate - self._mean
+        self._mean = self._mean + deviation / self._count
+        self._squares = self._squares + deviation * deviation * (
+            (self._count - 1) / self._count
+        )
+
+    def merge(self: T, other: T) -> T:
+        """Merge this accumulator with `other`, whose prices follow the
+        prices of this accumulator (i.e., the rate from the last price of
+        this accumulator to the first price of `other` is accumulated).
+
+        This operation is *not* performed in-place.
+
+        Parameters
+        ----------
+        other
+            accumulator of the prices following the prices of this
+            accumulator
+
+        Raises
+        ------
+        ValueError
+            if the ratio of the first price of `other` over the last price
+            of this accumulator is either very big or very small (i.e.,
+            close or equal to +inf or 0.0)
+
+        Returns
+        -------
+        T
+            accumulator of the prices of both accumulators
+        """
+        merged = self._copy()
+        if other._first is None:
+            return merged
+        if merged._last is None:
+            return other._copy()
+        merged._update(self._growth(merged._last, other._first))
+        merged._combine(other._count, other._mean, other._squares)
+        merged._last = other._last
+        return merged
+
+    def _combine(self, count: int, mean: float, squares: float):
+        if count == 0:
+            return
+        total = self._count + count
+        deviation = mean - self._mean
+        self._mean = self._mean + deviation * count / total
+        self._squares = (
+            self._squares
+            + squares
+            + deviation * deviation * (self._count * count / total)
+        )
+        self._count = total
+
+    def _copy(self: T) -> T:
+        copied = self.__class__()
+        copied.__dict__.update(self.__dict__)
+        return copied
+
+    def mean(self) -> Mean:
+        """Get the sample (i.e., arithmetic) mean of the rates accumulated.
+
+        Returns
+        -------
+        Mean
+            sample mean of the rates accumulated
+        """
+        return Mean(self._mean)
+
+    def dispersion(self) -> Dispersion:
+        """Get the sample dispersion (i.e., standard deviation) of the
+        rates accumulated.
+
+        Returns
+        -------
+        Dispersion
+            sample dispersion of the rates accumulated
+        """
+        if self._count <= 1:
+            return Dispersion(0.0)
+        return Dispersion(sqrt(self._squares / (self._count - 1)))
@@ -1,22 +1,50 @@
-from typing import Iterable, SupportsFloat, SupportsInt, Type, TypeVar
+from typing import (
+    Iterable,
+    SupportsFloat,
+    SupportsInt,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from portan.utilities.collections import Matrix
+import numpy as np
+
+from portan.utilities.collections import BlockMatrix
 
 from ..rate.matrix import RateMatrix
+from .price import Price
 from .sequence import PriceSequence
 
 T = TypeVar("T", bound="PriceMatrix")
 
 
-class PriceMatrix(Matrix[PriceSequence]):
-    """Immutable matrix of prices."""
+class PriceMatrix(BlockMatrix[PriceSequence]):
+    """Immutable matrix of prices.
+
+    The matrix is backed by a two-dimensional block of prices (i.e.,
+    float64) with a row per sequence of prices, and each
+    :py:class:`PriceSequence` is only created when accessed.
+
+    Parameters
+    ----------
+    values: Iterable[PriceSequence]
+        values to create the matrix from
+
+    Raises
+    ------
+    ValueError
+        if the values in `values` are not all of the same length
+    """
+
+    _VALID = "finite, and strictly positive"
 
     @classmethod
     def from_float(
         cls: Type[T],
-        values: Iterable[Iterable[SupportsFloat]],
+        values: Union[Iterable[Iterable[SupportsFloat]], np.ndarray],
     ) -> T:
-        """Create a matrix from floating-point values.
+        """Create a matrix from floating-point values, which are validated
+        all at once (see :py:meth:`from_array`).
 
         Parameters
         ----------
@@ -35,7 +63,16 @@ class PriceMatrix(Matrix[PriceSequence]):
         T
             matrix of prices
         """
-        return cls(PriceSequence.from_float(value) for value in values)
+        if isinstance(values, np.ndarray):
+            return cls.from_array(values)
+        rows = [[float(value) for value in row] for row in values]
+        cls._raise_if_rows_length_mismatch(rows)
+        ncols = len(rows[0]) if len(rows) > 0 else 0
+        return cls.from_array(np.array(rows).reshape(len(rows), ncols))
+
+    @classmethod
+    def _invalid(cls, block: np.ndarray) -> np.ndarray:
+        return ~(np.isfinite(block) & (block > 0.0))
 
     @classmethod
     def empties(cls: Type[T], length: SupportsInt) -> T:
@@ -59,7 +96,7 @@ class PriceMatrix(Matrix[PriceSequence]):
         """
         length_ = int(length)
         cls._raise_if_length_is_negative(length_)
-        return cls(PriceSequence([]) for _ in range(length_))
+        return cls._from_block(np.empty((length_, 0)))
 
     @classmethod
     def _raise_if_length_is_negative(cls, length: int):
@@ -70,10 +107,13 @@ class PriceMatrix(Matrix[PriceSequence]):
             )
             raise ValueError(msg)
 
+    def _to_sequence(self, row: np.ndarray) -> PriceSequence:
+        return PriceSequence(Price._from_valid(v) for v in row.tolist())
+
     def growth(self) -> RateMatrix:
         """Get the continuous growth rates of the prices in
         this matrix by comparing each price to its preceding price
-        for each sequence in this matrix.
+        for each sequence in this matrix, all at once.
 
         Raises
         ------
@@ -88,4 +128,4 @@ class PriceMatrix(Matrix[PriceSequence]):
         RateMatrix
             continuous growth rates of the prices in this matrix
         """
-        return RateMatrix(value.growth() for value in self)
+        return RateMatrix._from_block(PriceSequence._growth(self._block))
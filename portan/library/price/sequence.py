@@ -1,7 +1,10 @@
 from typing import Iterable, SupportsFloat, Type, TypeVar
 
+import numpy as np
+
 from portan.utilities.collections import Sequence
 
+from ..rate.rate import Rate
 from ..rate.sequence import RateSequence
 from .price import Price
 
@@ -49,6 +52,24 @@ class PriceSequence(Sequence[Price]):
         RateSequence
             continuous growth rates of the prices in this sequence
         """
-        return RateSequence(
-            [end.growth(begin) for begin, end in zip(self[:-1], self[1:])],
+        rates = self._growth(
+            np.array([float(v) for v in self], dtype=np.float64)
         )
+        return RateSequence(Rate._from_valid(v) for v in rates.tolist())
+
+    @staticmethod
+    def _growth(prices: np.ndarray) -> np.ndarray:
+        # rates of growth along the last axis, computed all at once!
+        with np.errstate(all="ignore"):
+            rates = np.log(prices[..., 1:] / prices[..., :-1])
+        invalid = ~np.isfinite(rates)
+        if np.any(invalid):
+            *rows, column = np.unravel_index(np.argmax(invalid), rates.shape)
+            of = "".join(f" of row {row}" for row in rows)
+            msg = (
+                f"cannot get growth; ratio of some price over its "
+                f"preceding price is close or equal to +inf or 0.0 "
+                f"(first offending price is {column + 1}{of})"
+            )
+            raise ValueError(msg)
+        return rates
@@ -1,27 +1,61 @@
-from portan.utilities.collections import Matrix
+import numpy as np
+
+from portan.utilities.collections import BlockMatrix
 
 from ..mean.sequence import MeanSequence
 from ..scatter import CorrelationMatrix, CovarianceMatrix
+from .rate import Rate
 from .sequence import RateSequence
 
 
-class RateMatrix(Matrix[RateSequence]):
-    """Immutable matrix of rates."""
+class RateMatrix(BlockMatrix[RateSequence]):
+    """Immutable matrix of rates.
+
+    The matrix is backed by a two-dimensional block of rates (i.e.,
+    float64) with a row per sequence of rates, and each
+    :py:class:`RateSequence` is only created when accessed.
+
+    Parameters
+    ----------
+    values: Iterable[RateSequence]
+        values to create the matrix from
 
-    def means(self) -> MeanSequence:
+    Raises
+    ------
+    ValueError
+        if the values in `values` are not all of the same length
+    """
+
+    def _to_sequence(self, row: np.ndarray) -> RateSequence:
+        return RateSequence(Rate._from_valid(v) for v in row.tolist())
+
+    def means(self, *, exact: bool = False) -> MeanSequence:
         """Get the sample mean (i.e., arithmetic) of each sequence
-        in this matrix.
+        in this matrix (see :py:meth:`RateSequence.mean`).
+
+        Parameters
+        ----------
+        exact
+            whether to get the exact means correctly rounded, which is
+            orders of magnitude slower (defaults to False)
 
         Returns
         -------
         MeanSequence
             sample mean of each sequence in this matrix (in order)
         """
-        return MeanSequence(value.mean() for value in self)
+        return MeanSequence(value.mean(exact=exact) for value in self)
 
     def covariances(self) -> CovarianceMatrix:
         """Get the covariance matrix of the covariances between
-        each sequence in this matrix.
+        each sequence in this matrix, all at once (i.e., by a single
+        product of the deviations from the means).
+
+        Raises
+        ------
+        ValueError
+            if any covariance is undefined (i.e., NaN)
+            (shouldn't happen in practice!)
 
         Returns
         -------
@@ -29,16 +63,22 @@ class RateMatrix(Matrix[RateSequence]):
             covariance matrix of the covariances between each
             sequence in this matrix
         """
-        return CovarianceMatrix.from_iterable(
-            [
-                [sequence.covariance(other) for other in self]
-                for sequence in self
-            ]
+        nrows, ncols = self._block.shape
+        if ncols <= 1:
+            return CovarianceMatrix.from_array(np.zeros((nrows, nrows)))
+        deviations = self._deviations()
+        product = deviations @ deviations.T
+        return CovarianceMatrix.from_array(
+            (product + product.T) / (2.0 * (ncols - 1))  # exactly symmetric!
         )
 
-    def correlations(self) -> CovarianceMatrix:
+    def correlations(self) -> CorrelationMatrix:
         """Get the correlation matrix of the correlations between
-        each sequence in this matrix.
+        each sequence in this matrix, from the covariance matrix (i.e.,
+        by normalizing each covariance by the dispersions of both
+        sequences). The correlation with any sequence of zero dispersion
+        is zero, while other correlations are robust (see
+        :py:meth:`Correlation.robust`).
 
         Raises
         ------
@@ -52,9 +92,17 @@ class RateMatrix(Matrix[RateSequence]):
             correlation matrix of the correlations between each
             sequence in this matrix
         """
-        return CorrelationMatrix.from_iterable(
-            [
-                [sequence.correlation(other) for other in self]
-                for sequence in self
-            ]
+        covariances = self.covariances().to_array()
+        dispersions = np.sqrt(np.diag(covariances))
+        with np.errstate(all="ignore"):
+            correlations = covariances / dispersions[:, None] / dispersions
+        correlations[(dispersions[:, None] == 0.0) | (dispersions == 0.0)] = 0.0
+        return CorrelationMatrix.from_array(
+            np.clip(correlations, -1.0, 1.0)  # robust!
         )
+
+    def _deviations(self) -> np.ndarray:
+        deviations = self._block - self._block.mean(axis=1, keepdims=True)
+        constant = np.all(self._block == self._block[:, :1], axis=1)
+        deviations[constant] = 0.0  # zero dispersion, despite rounding!
+        return deviations
@@ -1,6 +1,6 @@
-import statistics as stats
-from typing import Iterable, SupportsFloat, Type, TypeVar
+from typing import Iterable, List, SupportsFloat, Type, TypeVar
 
+from portan.utilities import kernel
 from portan.utilities.collections import Sequence
 
 from ..brownian import IArithmeticBrownian
@@ -38,9 +38,16 @@ class RateSequence(Sequence[Rate], IArithmeticBrownian):
         """
         return cls(Rate(value) for value in values)
 
-    def mean(self) -> Mean:
+    def mean(self, *, exact: bool = False) -> Mean:
         """Get the sample (i.e., arithmetic) mean of the rates in
-        this sequence.
+        this sequence, within one unit in the last place of the exact
+        mean (see :py:func:`portan.utilities.kernel.mean`).
+
+        Parameters
+        ----------
+        exact
+            whether to get the exact mean correctly rounded, which is
+            orders of magnitude slower (defaults to False)
 
         Returns
         -------
@@ -51,11 +58,18 @@ class RateSequence(Sequence[Rate], IArithmeticBrownian):
             return Mean(0.0)
         elif len(self) == 1:
             return Mean(self[0])
-        return Mean(stats.mean(self._to_floats()))
+        return Mean(kernel.mean(self._to_floats(), exact=exact))
 
-    def dispersion(self) -> Dispersion:
+    def dispersion(self, *, exact: bool = False) -> Dispersion:
         """Get the sample dispersion (i.e., standard deviation) of the
-        rates in this sequence.
+        rates in this sequence, within a few units in the last place of
+        the exact dispersion (see :py:func:`portan.utilities.kernel.stdev`).
+
+        Parameters
+        ----------
+        exact
+            whether to compute the dispersion with fractions, which is
+            orders of magnitude slower (defaults to False)
 
         Returns
         -------
@@ -64,7 +78,7 @@ class RateSequence(Sequence[Rate], IArithmeticBrownian):
         """
         if len(self) <= 1:
             return Dispersion(0.0)
-        return Dispersion(stats.stdev(self._to_floats()))
+        return Dispersion(kernel.stdev(self._to_floats(), exact=exact))
 
     def correlation(self: T, other: T) -> Correlation:
         """Get the sample correlation of the rates in this sequence
@@ -142,5 +156,5 @@ class RateSequence(Sequence[Rate], IArithmeticBrownian):
         )
         return sum_ / (len(self) - 1)
 
-    def _to_floats(self) -> Iterable[float]:
-        return (float(value) for value in self)
+    def _to_floats(self) -> List[float]:
+        return [float(value) for value in self]
@@ -2,7 +2,7 @@ from typing import Iterable, Type, TypeVar
 
 import numpy as np
 
-from portan.utilities.collections.matrix import SymmetricMatrix
+from portan.utilities.collections.matrix import BlockMatrix, SymmetricMatrix
 
 from .correlation import Correlation
 from .sequence import CorrelationSequence
@@ -10,11 +10,33 @@ from .sequence import CorrelationSequence
 T = TypeVar("T", bound="CorrelationMatrix")
 
 
-class CorrelationMatrix(SymmetricMatrix[CorrelationSequence]):
-    """Immutable symmetric matrix of correlations."""
+class CorrelationMatrix(
+    BlockMatrix[CorrelationSequence],
+    SymmetricMatrix[CorrelationSequence],
+):
+    """Immutable symmetric matrix of correlations.
+
+    The matrix is backed by a two-dimensional block of correlations (i.e.,
+    float64), and each :py:class:`CorrelationSequence` is only created
+    when accessed.
+
+    Parameters
+    ----------
+    values: Iterable[CorrelationSequence]
+        values to create the matrix from
+
+    Raises
+    ------
+    ValueError
+        if the values in `values` are not all of the same length,
+        if the length of each value in `values` does not match with the
+        number of values in `values`, or
+        if the values do not form a symmetric matrix
+    """
 
     _SYMMETRY_RTOL: float = 1e-8
     _SYMMETRY_ATOL: float = 1e-12
+    _VALID = "finite, and inside [-1.0, 1.0]"
 
     @classmethod
     def from_iterable(
@@ -43,6 +65,32 @@ class CorrelationMatrix(SymmetricMatrix[CorrelationSequence]):
         """
         return cls(CorrelationSequence(value) for value in values)
 
+    @classmethod
+    def _raise_if_block_is_invalid(cls, block: np.ndarray):
+        if len(block) > 0 and block.shape[0] != block.shape[1]:
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"length of each value must match with the number "
+                f"of values"
+            )
+            raise ValueError(msg)
+        if not cls._is_symmetric(block):
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"values must form a symmetric matrix"
+            )
+            raise ValueError(msg)
+
+    @classmethod
+    def _invalid(cls, block: np.ndarray) -> np.ndarray:
+        with np.errstate(invalid="ignore"):
+            return ~(np.isfinite(block) & (np.abs(block) <= 1.0))
+
+    def _to_sequence(self, row: np.ndarray) -> CorrelationSequence:
+        return CorrelationSequence(
+            Correlation._from_valid(v) for v in row.tolist()
+        )
+
     def is_symmetric(self) -> bool:
         """Verify if this matrix is symmetric.
 
@@ -51,12 +99,15 @@ class CorrelationMatrix(SymmetricMatrix[CorrelationSequence]):
         bool
             True if this matrix is symmetric, else False
         """
-        array = np.array(self, dtype=np.float_)
+        return self._is_symmetric(self._block)
+
+    @classmethod
+    def _is_symmetric(cls, block: np.ndarray) -> bool:
         return np.allclose(
-            array,
-            array.T,
-            rtol=self._SYMMETRY_RTOL,
-            atol=self._SYMMETRY_ATOL,
+            block,
+            block.T,
+            rtol=cls._SYMMETRY_RTOL,
+            atol=cls._SYMMETRY_ATOL,
         )
 
     def to_float(self) -> Iterable[Iterable[float]]:
@@ -67,4 +118,4 @@ class CorrelationMatrix(SymmetricMatrix[CorrelationSequence]):
         Iterable[Iterable[float]]
             this matrix as floating-point numbers
         """
-        return ((float(value) for value in sequence) for sequence in self)
+        return ((value for value in row) for row in self._block.tolist())
@@ -3,7 +3,7 @@ from typing import Iterable, SupportsFloat, Tuple, Type, TypeVar
 
 import numpy as np
 
-from portan.utilities.collections import SymmetricMatrix
+from portan.utilities.collections import BlockMatrix, SymmetricMatrix
 
 from .covariance import Covariance
 from .sequence import CovarianceSequence
@@ -12,11 +12,33 @@ from .variance import Variance
 T = TypeVar("T", bound="CovarianceMatrix")
 
 
-class CovarianceMatrix(SymmetricMatrix[CovarianceSequence]):
-    """Immutable symmetric matrix of covariances."""
+class CovarianceMatrix(
+    BlockMatrix[CovarianceSequence],
+    SymmetricMatrix[CovarianceSequence],
+):
+    """Immutable symmetric matrix of covariances.
+
+    The matrix is backed by a two-dimensional block of covariances (i.e.,
+    float64), and each :py:class:`CovarianceSequence` is only created when
+    accessed.
+
+    Parameters
+    ----------
+    values: Iterable[CovarianceSequence]
+        values to create the matrix from
+
+    Raises
+    ------
+    ValueError
+        if the values in `values` are not all of the same length,
+        if the length of each value in `values` does not match with the
+        number of values in `values`, or
+        if the values do not form a symmetric matrix
+    """
 
     _SYMMETRY_RTOL: float = 1e-8
     _SYMMETRY_ATOL: float = 1e-12
+    _VALID = "non-NaN"
 
     @classmethod
     def from_iterable(
@@ -45,6 +67,31 @@ class CovarianceMatrix(SymmetricMatrix[CovarianceSequence]):
         """
         return cls(CovarianceSequence(value) for value in values)
 
+    @classmethod
+    def _raise_if_block_is_invalid(cls, block: np.ndarray):
+        if len(block) > 0 and block.shape[0] != block.shape[1]:
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"length of each value must match with the number "
+                f"of values"
+            )
+            raise ValueError(msg)
+        if not cls._is_symmetric(block):
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"values must form a symmetric matrix"
+            )
+            raise ValueError(msg)
+
+    @classmethod
+    def _invalid(cls, block: np.ndarray) -> np.ndarray:
+        return np.isnan(block)
+
+    def _to_sequence(self, row: np.ndarray) -> CovarianceSequence:
+        return CovarianceSequence(
+            Covariance._from_valid(v) for v in row.tolist()
+        )
+
     def is_symmetric(self) -> bool:
         """Verify if this matrix is symmetric.
 
@@ -53,12 +100,15 @@ class CovarianceMatrix(SymmetricMatrix[CovarianceSequence]):
         bool
             True if this matrix is symmetric, else False
         """
-        array = np.array(self, dtype=np.float_)
+        return self._is_symmetric(self._block)
+
+    @classmethod
+    def _is_symmetric(cls, block: np.ndarray) -> bool:
         return np.allclose(
-            array,
-            array.T,
-            rtol=self._SYMMETRY_RTOL,
-            atol=self._SYMMETRY_ATOL,
+            block,
+            block.T,
+            rtol=cls._SYMMETRY_RTOL,
+            atol=cls._SYMMETRY_ATOL,
         )
 
     def variance(self, factors: Iterable[SupportsFloat]) -> Covariance:
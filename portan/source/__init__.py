@@ -1,15 +1,21 @@
 from .date.range import DateRange
 from .dated.price.series import DatedPriceSeries
 from .dated.prices.series import DatedPricesSeries
-from .exception import SourceError
+from .exception import SourceError, TransientSourceError
 from .factory import PriceSourceFactory
-from .source import PriceSource
+from .report import FetchReport, TickerReport, recording
+from .source import AsyncPriceSource, PriceSource
 
 __all__ = [
     "DateRange",
     "DatedPriceSeries",
     "DatedPricesSeries",
     "SourceError",
+    "TransientSourceError",
     "PriceSourceFactory",
+    "FetchReport",
+    "TickerReport",
+    "recording",
+    "AsyncPriceSource",
     "PriceSource",
 ]
@@ -0,0 +1,285 @@
+import json
+import os
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from .date import column
+from .date.range import DateRange
+from .dated.price.series import DatedPriceSeries
+from .dated.prices.series import DatedPricesSeries
+from .exception import SourceError
+from .source.multiple import IMultipleSource
+from .source.single import ISingleSource
+
+_DATES_NAME = "dates.npy"
+_PRICES_NAME = "prices.npy"
+_TICKERS_NAME = "tickers.json"
+
+
+class UniverseArchive:
+    """Read-only archive of the prices of a universe of financial
+    instruments.
+
+    The archive is a directory holding a date axis (i.e., `dates.npy`,
+    datetime64[D] sorted in ascending order), a dense block of prices
+    (i.e., `prices.npy`, float64 with a row per ticker and a column per
+    date, where a non-finite price marks a missing price), and a ticker
+    index (i.e., `tickers.json`). The date axis and the block of prices
+    are memory-mapped, thus they are loaded lazily from the page cache
+    and shared between all processes opening the archive.
+
+    Parameters
+    ----------
+    directory: str
+        directory of the archive
+
+    Raises
+    ------
+    ValueError
+        if `directory` is not a valid archive (e.g., missing files,
+        unsorted dates, or shapes mismatch)
+    """
+
+    @classmethod
+    def write(
+        cls,
+        directory: str,
+        prices: Mapping[str, DatedPriceSeries],
+    ) -> "UniverseArchive":
+        """Write the prices of each ticker in `prices` to an archive in
+        `directory`, overwriting any existing archive.
+
+        Parameters
+        ----------
+        directory
+            directory of the archive
+        prices
+            mapping of ticker to the prices of the financial instrument
+
+        Returns
+        -------
+        UniverseArchive
+            written archive
+        """
+        directory = os.path.expanduser(directory)
+        os.makedirs(directory, exist_ok=True)
+        tickers = tuple(prices)
+        columns = [prices[ticker].to_arrays() for ticker in tickers]
+        dates = np.unique(
+            np.concatenate(
+                [np.empty(0, "datetime64[D]")] + [d for d, _ in columns]
+            )
+        )
+        block = np.full((len(tickers), len(dates)), np.nan)
+        for i, (dates_, prices_) in enumerate(columns):
+            block[i, np.searchsorted(dates, dates_)] = prices_
+        np.save(os.path.join(directory, _DATES_NAME), dates)
+        np.save(os.path.join(directory, _PRICES_NAME), block)
+        with open(os.path.join(directory, _TICKERS_NAME), "w") as f:
+            json.dump(list(tickers), f)
+        return cls(directory)
+
+    def __init__(self, directory: str):
+        self._directory = os.path.expanduser(directory)
+        self._dates, self._prices, self._tickers = self._open()
+        self._index: Dict[str, int] = {
+            ticker: i for i, ticker in enumerate(self._tickers)
+        }
+
+    def _open(self) -> Tuple[np.ndarray, np.ndarray, Tuple[str, ...]]:
+        try:
+            dates = self._load(_DATES_NAME)
+            prices = self._load(_PRICES_NAME)
+            with open(os.path.join(self._directory, _TICKERS_NAME)) as f:
+                tickers = tuple(str(ticker) for ticker in json.load(f))
+        except (OSError, ValueError) as err:
+            self._raise_due_to_invalid_archive(err)
+        if not self._is_valid(dates, prices, tickers):
+            self._raise_due_to_invalid_archive()
+        return dates, prices, tickers
+
+    def _load(self, name: str) -> np.ndarray:
+        path = os.path.join(self._directory, name)
+        return np.load(path, mmap_mode="r", allow_pickle=False)
+
+    @staticmethod
+    def _is_valid(
+        dates: np.ndarray,
+        prices: np.ndarray,
+        tickers: Tuple[str, ...],
+    ) -> bool:
+        return (
+            dates.dtype == np.dtype("datetime64[D]")
+            and dates.ndim == 1
+            and bool(np.all(dates[1:] > dates[:-1]))
+            and column.are_valid(dates[[0, -1]] if len(dates) > 0 else dates)
+            and prices.dtype == np.float64
+            and prices.shape == (len(tickers), len(dates))
+            and len(set(tickers)) == len(tickers)
+        )
+
+    def _raise_due_to_invalid_archive(self, err: Optional[Exception] = None):
+        msg = (
+            f"cannot instantiate {self.__class__.__name__}; "
+            f"directory must hold a valid archive"
+        )
+        raise ValueError(msg) from err
+
+    @property
+    def directory(self) -> str:
+        """Directory of this archive."""
+        return self._directory
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Date axis of this archive (memory-mapped and read-only)."""
+        return self._dates
+
+    @property
+    def tickers(self) -> Tuple[str, ...]:
+        """Tickers of the financial instruments in this archive."""
+        return self._tickers
+
+    def select(
+        self,
+        tickers: Iterable[str],
+        range_: DateRange,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Select the prices of `tickers` for dates inside `range_`
+        where every financial instrument in `tickers` has a price.
+        A ticker which is not in this archive has no prices.
+
+        Parameters
+        ----------
+        tickers
+            tickers of financial instruments to select prices for
+        range_
+            range delimiting the dates for which to select prices
+            (both side of the range are inclusive)
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            dates selected (i.e., datetime64[D]), and prices selected
+            with a row per ticker and a column per date selected, which
+            are read-only views of this archive when `tickers` are
+            consecutive in this archive and have prices on all dates
+            inside `range_`
+        """
+        begin, end = self._window(range_)
+        rows = [self._index.get(ticker, -1) for ticker in tickers]
+        if any(row < 0 for row in rows):  # unknown ticker!
+            return self._dates[:0], np.empty((len(rows), 0))
+        block = self._prices[self._rows(rows), begin:end]  # only the window!
+        dates = self._dates[begin:end]
+        available = np.isfinite(block).all(axis=0)
+        if available.all():  # e.g., without holidays, thus views!
+            return dates, block
+        return dates[available], block[:, available]
+
+    @staticmethod
+    def _rows(rows: List[int]) -> Union[slice, List[int]]:
+        if len(rows) > 0 and rows == list(
+            range(rows[0], rows[0] + len(rows))
+        ):  # consecutive, thus a view rather than a copy!
+            return slice(rows[0], rows[0] + len(rows))
+        return rows
+
+    def _window(self, range_: DateRange) -> Tuple[int, int]:
+        begin = np.datetime64(str(range_.begin), "D")
+        end = np.datetime64(str(range_.end), "D")
+        return (
+            int(np.searchsorted(self._dates, begin, side="left")),
+            int(np.searchsorted(self._dates, end, side="right")),
+        )
+
+
+class ArchiveSource(ISingleSource):
+    """Source of prices for a single financial instrument reading from
+    a :py:class:`UniverseArchive`.
+
+    Parameters
+    ----------
+    archive: UniverseArchive
+        archive from which to read the prices
+    """
+
+    def __init__(self, archive: UniverseArchive):
+        self._archive = archive
+
+    @property
+    def archive(self) -> UniverseArchive:
+        """Archive from which to read the prices."""
+        return self._archive
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        """Get prices of `ticker` for business days inside `range_`.
+
+        Parameters
+        ----------
+        ticker
+            ticker of financial instrument to extract prices for
+        range_
+            range delimiting the business days for which to extract prices
+            (both side of the range are inclusive)
+
+        Raises
+        ------
+        SourceError
+            if the prices read are in an unexpected format (e.g., negative
+            prices)
+
+        Returns
+        -------
+        DatedPriceSeries
+            prices read
+        """
+        dates, prices = self._archive.select([ticker], range_)
+        if not _are_positive(prices):
+            _raise_due_to_unexpected_format(ticker)
+        # dates are valid and sorted, and prices finite, thus unchecked!
+        return DatedPriceSeries._from_columns(dates, prices[0])
+
+
+class ArchiveMultipleSource(IMultipleSource):
+    """Source of prices for multiple financial instruments reading from
+    a :py:class:`UniverseArchive` all at once.
+
+    Parameters
+    ----------
+    archive: UniverseArchive
+        archive from which to read the prices
+    """
+
+    def __init__(self, archive: UniverseArchive):
+        self._archive = archive
+
+    @property
+    def archive(self) -> UniverseArchive:
+        """Archive from which to read the prices."""
+        return self._archive
+
+    def _get(
+        self,
+        tickers: Tuple[str, ...],
+        range_: DateRange,
+    ) -> DatedPricesSeries:
+        dates, prices = self._archive.select(tickers, range_)
+        if not _are_positive(prices):
+            _raise_due_to_unexpected_format(", ".join(tickers))
+        # dates are valid and sorted, and prices finite, thus unchecked!
+        return DatedPricesSeries._from_columns(dates, prices)
+
+
+def _are_positive(prices: np.ndarray) -> bool:
+    return bool(np.all(prices > 0.0))
+
+
+def _raise_due_to_unexpected_format(tickers: str):
+    msg = (
+        f"cannot source prices from archive for {tickers}; "
+        f"data read is in an unexpected format, likely cause is "
+        f"some prices which are negative or zero"
+    )
+    raise SourceError(msg)
@@ -0,0 +1,211 @@
+import json
+import socket
+from typing import Any, Iterable, List, Mapping, Optional
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote, urlencode
+from urllib.request import Request, urlopen
+
+import numpy as np
+
+from . import report
+from .date import Date, column
+from .date.range import DateRange
+from .dated.price.series import DatedPriceSeries
+from .exception import SourceError, TransientSourceError
+from .source.single import ISingleSource
+
+DEFAULT_BASE_URL = "https://query2.finance.yahoo.com"
+CHART_PATH = "/v8/finance/chart/"
+_USER_AGENT = "Mozilla/5.0"  # the endpoint rejects unidentified clients!
+_EVENT_NAMES = ("dividends", "splits")
+_SECONDS_PER_DAY = 86400
+_TRANSIENT_ERRORS = (socket.timeout, TimeoutError, ConnectionError)
+
+
+class YahooChart(ISingleSource):
+    """Source of prices for a single financial instrument fetching from
+    the chart endpoint of Yahoo Finance directly (i.e., without yfinance
+    nor pandas).
+
+    Only the timestamps, the adjusted closes, and the dates of the splits
+    and dividends are decoded from the response. As with
+    :py:class:`Yahoo`, the prices are adjusted for splits and dividends,
+    and a missing price on the date of a split or a dividend is ignored.
+
+    Parameters
+    ----------
+    base_url: str
+        base URL of the chart endpoint (defaults to Yahoo Finance, but
+        may be a local stand-in)
+    timeout: float
+        seconds to wait for a response before giving up (defaults to 30.0)
+
+    Raises
+    ------
+    ValueError
+        if `timeout` is negative or zero
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = 30.0,
+    ):
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._raise_if_timeout_is_negative_or_zero()
+
+    def _raise_if_timeout_is_negative_or_zero(self):
+        if not self._timeout > 0.0:
+            msg = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"timeout must be strictly positive"
+            )
+            raise ValueError(msg)
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the chart endpoint."""
+        return self._base_url
+
+    @property
+    def timeout(self) -> float:
+        """Seconds to wait for a response before giving up."""
+        return self._timeout
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        """Get prices of `ticker` for business days inside `range_`.
+
+        Parameters
+        ----------
+        ticker
+            ticker of financial instrument to extract prices for
+            (must match with tickers from Yahoo Finance)
+        range_
+            range delimiting the business days for which to extract prices
+            (both side of the range are inclusive)
+
+        Raises
+        ------
+        SourceError
+            if there's an unexpected error when fetching prices from the
+            source, or
+            if the fetched prices are in an unexpected format (e.g., non-finite
+            prices)
+
+        Returns
+        -------
+        DatedPriceSeries
+            fetched prices
+        """
+        chart = self._fetch(ticker, range_)
+        if chart is None or len(chart.get("timestamp") or ()) == 0:
+            return DatedPriceSeries([])
+        try:
+            with report.timed(ticker, report.PARSE):
+                return self._to_dated(chart, range_)
+        except (KeyError, IndexError, TypeError, ValueError):
+            msg = (
+                f"cannot source prices from Yahoo for {ticker}; "
+                f"data fetched is in an unexpected format, likely "
+                f"cause is some prices which are non-finite "
+                f"(i.e., NaN, inf or -inf), negative or zero, "
+                f"or duplicated dates"
+            )
+            raise SourceError(msg)
+
+    def _fetch(
+        self,
+        ticker: str,
+        range_: DateRange,
+    ) -> Optional[Mapping[str, Any]]:
+        try:
+            with report.timed(ticker, report.NETWORK), urlopen(
+                self._request(ticker, range_),
+                timeout=self._timeout,
+            ) as response:
+                payload = response.read()
+            report.count(ticker, bytes_=len(payload))
+            with report.timed(ticker, report.PARSE):
+                chart = json.loads(payload)["chart"]
+            if chart.get("error") is not None:
+                raise ValueError(chart["error"])
+            return (chart.get("result") or [None])[0]
+        except HTTPError as err:
+            if err.code == 404:  # unknown ticker!
+                return None
+            self._raise_due_to_unexpected_error(ticker, err)
+        except (OSError, ValueError, KeyError, TypeError, IndexError) as err:
+            self._raise_due_to_unexpected_error(ticker, err)
+
+    def _request(self, ticker: str, range_: DateRange) -> Request:
+        # widened by a day on each side, as the local date of a price
+        # may differ from its date in UTC
+        begin, end = self._to_seconds([range_.begin, range_.end])
+        query = urlencode(
+            {
+                "period1": begin - _SECONDS_PER_DAY,
+                "period2": end + 2 * _SECONDS_PER_DAY,
+                "interval": "1d",
+                "events": ",".join(_EVENT_NAMES),
+                "includeAdjustedClose": "true",
+            }
+        )
+        return Request(
+            f"{self._base_url}{CHART_PATH}{quote(ticker, safe='')}?{query}",
+            headers={"User-Agent": _USER_AGENT},
+        )
+
+    @staticmethod
+    def _to_seconds(dates: Iterable[Date]) -> List[int]:
+        seconds = column.from_dates(dates).astype("datetime64[s]")
+        return seconds.astype(np.int64).tolist()
+
+    @staticmethod
+    def _raise_due_to_unexpected_error(ticker: str, err: Exception):
+        msg = (
+            f"cannot source prices from Yahoo for {ticker}; "
+            f"an unexpected error occurred when fetching prices"
+        )
+        if _is_transient(err):
+            raise TransientSourceError(msg) from err
+        raise SourceError(msg) from err
+
+    def _to_dated(
+        self,
+        chart: Mapping[str, Any],
+        range_: DateRange,
+    ) -> DatedPriceSeries:
+        offset = int(chart["meta"].get("gmtoffset") or 0)
+        days = self._to_days(chart["timestamp"], offset)
+        closes = np.array(
+            chart["indicators"]["adjclose"][0]["adjclose"],
+            dtype=np.float64,  # None is NaN!
+        )
+        events = chart.get("events") or {}
+        actions = self._to_days(
+            [
+                event["date"]
+                for name in _EVENT_NAMES
+                for event in (events.get(name) or {}).values()
+            ],
+            offset,
+        )
+        extraneous = np.isin(days, actions) & np.isnan(closes)
+        begin, end = column.from_dates([range_.begin, range_.end])
+        kept = ~extraneous & (days >= begin) & (days <= end)
+        return DatedPriceSeries.from_unsorted_arrays(days[kept], closes[kept])
+
+    @staticmethod
+    def _to_days(timestamps: Iterable[int], offset: int) -> np.ndarray:
+        seconds = np.array(timestamps, dtype=np.int64) + offset
+        return seconds.astype("datetime64[s]").astype("datetime64[D]")
+
+
+def _is_transient(err: Exception) -> bool:
+    if isinstance(err, HTTPError):  # throttled or unavailable!
+        return err.code == 429 or err.code >= 500
+    if isinstance(err, URLError):
+        return isinstance(err.reason, _TRANSIENT_ERRORS)
+    return isinstance(err, _TRANSIENT_ERRORS)
@@ -0,0 +1,171 @@
+from typing import Iterable
+
+import numpy as np
+
+from .date import MAX_YEAR, MIN_YEAR, Date
+
+_EPOCH = Date("1970-01-01").to_ordinal()  # ordinal of datetime64's epoch!
+_MIN = np.datetime64(f"{str(MIN_YEAR).zfill(4)}-01-01", "D")
+_MAX = np.datetime64(f"{str(MAX_YEAR).zfill(4)}-12-31", "D")
+
+# layout of a date in ISO format (i.e., YYYY-MM-DD)
+_LENGTH = 10
+_DIGITS = [0, 1, 2, 3, 5, 6, 8, 9]
+_DASHES = [4, 7]
+_ZERO, _DASH = ord("0"), ord("-")
+_DAYS_IN_MONTH = np.array(
+    [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+    dtype=np.int64,
+)
+
+
+def from_dates(dates: Iterable[Date]) -> np.ndarray:
+    """Convert `dates` to a column of dates (i.e., datetime64[D]).
+
+    Parameters
+    ----------
+    dates
+        dates to convert
+
+    Returns
+    -------
+    np.ndarray
+        column of dates
+    """
+    return from_ordinals([date.to_ordinal() for date in dates])
+
+
+def from_strings(values: Iterable[str]) -> np.ndarray:
+    """Convert strings representing dates in ISO format (i.e.,
+    YYYY-MM-DD) to a column of dates (i.e., datetime64[D]), without
+    creating any :py:class:`Date`.
+
+    Parameters
+    ----------
+    values
+        strings to convert
+
+    Raises
+    ------
+    ValueError
+        if any string in `values` is not a date in ISO format, or
+        if any string in `values` is not a valid date (see :py:class:`Date`
+        for the definition of a valid date)
+
+    Returns
+    -------
+    np.ndarray
+        column of dates
+    """
+    strings = list(values)
+    try:
+        raw = np.array(strings, dtype=f"S{_LENGTH + 1}")  # detect longer!
+    except (UnicodeError, TypeError, ValueError):
+        _raise_due_to_invalid_string(_find_unencodable(strings))
+    chars = raw.view(np.uint8).reshape(len(strings), _LENGTH + 1)
+    digits = chars[:, _DIGITS] - _ZERO  # wraps when not a digit!
+    valid = np.all(digits < 10, axis=1)
+    valid &= np.all(chars[:, _DASHES] == _DASH, axis=1) & (chars[:, -1] == 0)
+    d = digits.astype(np.int64)
+    years = d[:, 0] * 1000 + d[:, 1] * 100 + d[:, 2] * 10 + d[:, 3]
+    months = d[:, 4] * 10 + d[:, 5]
+    days = d[:, 6] * 10 + d[:, 7]
+    valid &= (years >= MIN_YEAR) & (months >= 1) & (months <= 12)
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    valid &= (days >= 1) & (
+        days <= _DAYS_IN_MONTH[np.clip(months, 1, 12)] + (leap & (months == 2))
+    )
+    if not np.all(valid):
+        _raise_due_to_invalid_string(int(np.argmin(valid)))
+    first = ((years - 1970) * 12 + months - 1).astype("datetime64[M]")
+    return first.astype("datetime64[D]") + (days - 1)
+
+
+def _find_unencodable(strings: Iterable[str]) -> int:
+    for row, string in enumerate(strings):
+        try:
+            np.array(string, dtype=f"S{_LENGTH + 1}")
+        except (UnicodeError, TypeError, ValueError):
+            return row
+    return 0
+
+
+def _raise_due_to_invalid_string(row: int):
+    msg = (
+        f"cannot convert strings to dates; "
+        f"strings must be dates in ISO format, with a year in "
+        f"[{MIN_YEAR}, {MAX_YEAR}], a month in [1, 12], and "
+        f"a day in [1, days in month for year] (first offending "
+        f"row is {row})"
+    )
+    raise ValueError(msg)
+
+
+def from_ordinals(ordinals: Iterable[int]) -> np.ndarray:
+    """Convert proleptic Gregorian ordinals to a column of dates
+    (i.e., datetime64[D]).
+
+    Parameters
+    ----------
+    ordinals
+        ordinals to convert
+
+    Returns
+    -------
+    np.ndarray
+        column of dates
+    """
+    days = np.array(ordinals, dtype=np.int64) - _EPOCH
+    return days.astype("datetime64[D]")
+
+
+def to_ordinals(column: np.ndarray) -> np.ndarray:
+    """Convert a column of dates (i.e., datetime64[D]) to proleptic
+    Gregorian ordinals.
+
+    Parameters
+    ----------
+    column
+        column of dates to convert
+
+    Returns
+    -------
+    np.ndarray
+        ordinals (i.e., int64)
+    """
+    return column.astype(np.int64) + _EPOCH
+
+
+def are_valid(column: np.ndarray) -> bool:
+    """Verify if the dates in `column` are all valid dates (see
+    :py:class:`Date` for the definition of a valid date).
+
+    Parameters
+    ----------
+    column
+        column of dates (i.e., datetime64[D]) to verify
+
+    Returns
+    -------
+    bool
+        True if the dates in `column` are all valid dates, else False
+    """
+    return not np.any(invalid(column))
+
+
+def invalid(column: np.ndarray) -> np.ndarray:
+    """Flag the dates in `column` which are not valid dates (see
+    :py:class:`Date` for the definition of a valid date).
+
+    Parameters
+    ----------
+    column
+        column of dates (i.e., datetime64[D]) to verify
+
+    Returns
+    -------
+    np.ndarray
+        True where the date in `column` is not a valid date, else False
+        (i.e., bool)
+    """
+    return np.isnat(column) | (column < _MIN) | (column > _MAX)
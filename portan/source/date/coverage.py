@@ -0,0 +1,128 @@
+from typing import Iterable, List, Type, TypeVar
+
+from portan.utilities.collections import Sequence
+
+from .range import DateRange
+
+T = TypeVar("T", bound="DateCoverage")
+
+
+class DateCoverage(Sequence[DateRange]):
+    """Immutable sequence of disjoint and non-adjacent ranges of dates
+    sorted in ascending order.
+
+    Parameters
+    ----------
+    values: Iterable[DateRange]
+        values to create the coverage from
+
+    Raises
+    ------
+    ValueError
+        if `values` is not sorted in ascending order, or
+        if any two ranges in `values` overlap or are adjacent
+    """
+
+    @classmethod
+    def from_unsorted(cls: Type[T], values: Iterable[DateRange]) -> T:
+        """Create a coverage from ranges of dates in any order,
+        merging the ranges which overlap or are adjacent.
+
+        Parameters
+        ----------
+        values
+            values to create the coverage from
+
+        Returns
+        -------
+        T
+            coverage of the ranges in `values`
+        """
+        merged: List[DateRange] = []
+        for range_ in sorted(values, key=lambda x: (x.begin, x.end)):
+            if len(merged) > 0 and cls._touch(merged[-1], range_):
+                last = merged.pop()
+                range_ = DateRange(last.begin, max(last.end, range_.end))
+            merged.append(range_)
+        return cls(merged)
+
+    @staticmethod
+    def _touch(left: DateRange, right: DateRange) -> bool:
+        # decrementing is safe since right.begin is after left.end here
+        return right.begin <= left.end or right.begin.decrement() == left.end
+
+    def __init__(self, values: Iterable[DateRange]):
+        super().__init__(values)
+        self._raise_if_overlapping_or_unsorted()
+
+    def _raise_if_overlapping_or_unsorted(self):
+        if any(
+            self._touch(left, right)  # also true when unsorted!
+            for left, right in zip(self._values[:-1], self._values[1:])
+        ):
+            msg = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"values must be sorted in ascending order, and must "
+                f"neither overlap nor be adjacent"
+            )
+            raise ValueError(msg)
+
+    def includes(self, range_: DateRange) -> bool:
+        """Verify if `range_` is entirely inside this coverage.
+
+        Parameters
+        ----------
+        range_
+            range to verify for inclusion in this coverage
+
+        Returns
+        -------
+        bool
+            True if `range_` is entirely inside this coverage, else False
+        """
+        return any(value.includes(range_) for value in self)
+
+    def missing(self: T, range_: DateRange) -> T:
+        """Get the segments of `range_` which are not inside this
+        coverage.
+
+        Parameters
+        ----------
+        range_
+            range for which to get the segments outside this coverage
+
+        Returns
+        -------
+        T
+            segments of `range_` outside this coverage (in order)
+        """
+        segments, begin = [], range_.begin
+        for value in self:
+            if value.end < begin:
+                continue
+            if value.begin > range_.end:
+                break
+            if value.begin > begin:
+                segments.append(DateRange(begin, value.begin.decrement()))
+            if value.end >= range_.end:
+                return self.__class__(segments)
+            begin = value.end.increment()
+        segments.append(DateRange(begin, range_.end))
+        return self.__class__(segments)
+
+    def add(self: T, range_: DateRange) -> T:
+        """Add `range_` to this coverage.
+
+        This operation is **not** performed in-place.
+
+        Parameters
+        ----------
+        range_
+            range to add to this coverage
+
+        Returns
+        -------
+        T
+            new coverage including `range_`
+        """
+        return self.from_unsorted((*self, range_))
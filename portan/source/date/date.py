@@ -1,14 +1,24 @@
-from datetime import MAXYEAR, MINYEAR, date, timedelta
-from typing import Type, TypeVar
+from datetime import MAXYEAR, MINYEAR, date
+from operator import index
+from typing import Dict, Tuple, Type, TypeVar
 
 T = TypeVar("T", bound="Date")
 MIN_YEAR: int = MINYEAR
 MAX_YEAR: int = MAXYEAR
+_MIN_ORDINAL: int = date.min.toordinal()
+_MAX_ORDINAL: int = date.max.toordinal()
+
+# dates are immutable, thus identical dates share the same instance!
+_INTERNED: Dict[Tuple[type, int], "Date"] = {}
 
 
 class Date:
     """A date (year, month, day) in the Gregorian calendar.
 
+    The date is stored as its proleptic Gregorian ordinal (i.e., January 1
+    of year 1 has ordinal 1), and identical dates are interned such that
+    they share the same instance.
+
     Parameters
     ----------
     value: str
@@ -23,6 +33,8 @@ class Date:
         or a year outside [MIN_YEAR, MAX_YEAR])
     """
 
+    __slots__ = ("_ordinal",)
+
     @classmethod
     def today(cls: Type[T]) -> T:
         """Get the current local date.
@@ -32,17 +44,58 @@ class Date:
         T
             today's date
         """
-        return cls(date.today().isoformat())
+        return cls._intern(date.today().toordinal())
+
+    @classmethod
+    def from_ordinal(cls: Type[T], ordinal: int) -> T:
+        """Create a date from its proleptic Gregorian ordinal (i.e.,
+        January 1 of year 1 has ordinal 1), without parsing any string.
+
+        Parameters
+        ----------
+        ordinal
+            proleptic Gregorian ordinal of the date
+
+        Raises
+        ------
+        TypeError
+            if `ordinal` is not an integer (e.g., a float)
+        ValueError
+            if `ordinal` is outside [1, ordinal of December 31 of MAX_YEAR]
+
+        Returns
+        -------
+        T
+            date
+        """
+        ordinal_ = index(ordinal)  # never truncates!
+        if not _MIN_ORDINAL <= ordinal_ <= _MAX_ORDINAL:
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"ordinal must be in [{_MIN_ORDINAL}, {_MAX_ORDINAL}]"
+            )
+            raise ValueError(msg)
+        return cls._intern(ordinal_)
 
-    def __init__(self, value: str):
-        self._value: date = self._convert(value)
+    @classmethod
+    def _intern(cls: Type[T], ordinal: int) -> T:
+        try:
+            return _INTERNED[(cls, ordinal)]
+        except KeyError:
+            instance = object.__new__(cls)
+            instance._ordinal = ordinal
+            return _INTERNED.setdefault((cls, ordinal), instance)
 
-    def _convert(self, value: str) -> date:
+    def __new__(cls: Type[T], value: str) -> T:
+        return cls._intern(cls._convert(value))
+
+    @classmethod
+    def _convert(cls, value: str) -> int:
         try:
-            return date.fromisoformat(value)
+            return date.fromisoformat(value).toordinal()
         except Exception:
             msg = (
-                f"cannot instantiate {self.__class__.__name__}; "
+                f"cannot instantiate {cls.__name__}; "
                 f"value must be a date in ISO format, "
                 f"with a year in [{MIN_YEAR}, {MAX_YEAR}], "
                 f"a month in [1, 12], and "
@@ -50,6 +103,20 @@ class Date:
             )
             raise ValueError(msg)
 
+    def __reduce__(self):
+        return self.__class__.from_ordinal, (self._ordinal,)
+
+    def to_ordinal(self) -> int:
+        """Get the proleptic Gregorian ordinal of this date (i.e.,
+        January 1 of year 1 has ordinal 1).
+
+        Returns
+        -------
+        int
+            proleptic Gregorian ordinal of this date
+        """
+        return self._ordinal
+
     def increment(self: T, *, by: int = 1) -> T:
         """Increment this date by `by` days. This operation
         is not performed in-place.
@@ -107,49 +174,45 @@ class Date:
             raise ValueError(msg)
 
     def _increment(self: T, by: int) -> T:
-        incremented = self._increment_value(by)
-        return self.__class__(incremented.isoformat())
-
-    def _increment_value(self, by: int) -> date:
-        try:
-            return self._value + timedelta(days=by)
-        except OverflowError:
+        incremented = self._ordinal + by
+        if not _MIN_ORDINAL <= incremented <= _MAX_ORDINAL:
             msg = (
                 f"cannot increment(decrement) {self.__class__.__name__}; "
                 f"by's magnitude is too high"
             )
             raise OverflowError(msg)
+        return self._intern(incremented)
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return NotImplemented
-        return self._value < other._value
+        return self._ordinal < other._ordinal
 
     def __le__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return NotImplemented
-        return self._value <= other._value
+        return self._ordinal <= other._ordinal
 
     def __gt__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return NotImplemented
-        return self._value > other._value
+        return self._ordinal > other._ordinal
 
     def __ge__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return NotImplemented
-        return self._value >= other._value
+        return self._ordinal >= other._ordinal
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return NotImplemented
-        return self._value == other._value
+        return self._ordinal == other._ordinal
 
     def __hash__(self) -> int:
-        return hash(self._value)
+        return hash(self._ordinal)
 
     def __str__(self) -> str:
-        return self._value.isoformat()
+        return date.fromordinal(self._ordinal).isoformat()
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}({self})>"
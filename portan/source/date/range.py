@@ -1,6 +1,7 @@
-from typing import Type, TypeVar
+from datetime import date
+from typing import Tuple, Type, TypeVar
 
-from .date import Date
+from .date import MAX_YEAR, Date
 
 T = TypeVar("T", bound="DateRange")
 
@@ -71,6 +72,64 @@ class DateRange:
         """End of range."""
         return self._end
 
+    def includes(self, other: "DateRange") -> bool:
+        """Verify if `other` is entirely inside this range.
+
+        Parameters
+        ----------
+        other
+            range to verify for inclusion in this range
+
+        Returns
+        -------
+        bool
+            True if `other` is entirely inside this range, else False
+        """
+        return self._begin <= other._begin and other._end <= self._end
+
+    def split(self: T, *, years: int = 1) -> Tuple[T, ...]:
+        """Split this range into consecutive ranges spanning `years`
+        calendar years each (i.e., aligned on January 1), except for the
+        first and last ranges which are delimited by this range.
+
+        Parameters
+        ----------
+        years
+            number of calendar years spanned by each range (defaults to 1)
+
+        Raises
+        ------
+        ValueError
+            if `years` is negative or zero
+
+        Returns
+        -------
+        Tuple[T, ...]
+            consecutive ranges covering this range (in order)
+        """
+        if years <= 0:
+            msg = "cannot split range; years must be strictly positive"
+            raise ValueError(msg)
+        ranges = []
+        begin = self._begin
+        year = date.fromordinal(begin.to_ordinal()).year
+        while True:
+            year = year - (year - 1) % years + years  # next aligned year!
+            if year > MAX_YEAR:
+                break
+            next_ = Date.from_ordinal(date(year, 1, 1).toordinal())
+            if next_ > self._end:
+                break
+            ranges.append(self.__class__(begin, next_.decrement()))
+            begin = next_
+        ranges.append(self.__class__(begin, self._end))
+        return tuple(ranges)
+
+    def __contains__(self, date: object) -> bool:
+        if not isinstance(date, Date):
+            return False
+        return self._begin <= date <= self._end
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return NotImplemented
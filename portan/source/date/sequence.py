@@ -33,6 +33,29 @@ class DateSequence(Sequence[Date]):
         """
         return cls(Date(value) for value in values)
 
+    @classmethod
+    def from_ordinal(cls: Type[T], values: Iterable[int]) -> T:
+        """Create a sequence from proleptic Gregorian ordinals (i.e.,
+        January 1 of year 1 has ordinal 1), without parsing any string.
+
+        Parameters
+        ----------
+        values
+            values to create the sequence from
+
+        Raises
+        ------
+        ValueError
+            if any value in `values` is not the ordinal of a valid date
+            (see :py:class:`Date` for the definition of a valid date)
+
+        Returns
+        -------
+        T
+            sequence of dates
+        """
+        return cls(Date.from_ordinal(value) for value in values)
+
     def is_ascending(self) -> bool:
         """Verify if this sequence is sorted in ascending order.
 
@@ -68,4 +91,5 @@ class DateSequence(Sequence[Date]):
         T
             intersection between this sequence and `other`
         """
-        return self.__class__(value for value in self if value in other)
+        lookup = set(other)  # constant time membership!
+        return self.__class__(value for value in self if value in lookup)
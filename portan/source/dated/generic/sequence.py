@@ -2,6 +2,7 @@ from typing import TypeVar
 
 from portan.utilities.collections import Sequence
 
+from ...date.range import DateRange
 from ...date.sequence import DateSequence
 from .dated import Dated
 
@@ -58,4 +59,25 @@ class DatedSequence(Sequence[T_co]):
         S
             new compressed sequence
         """
-        return self.__class__(value for value in self if value.date in dates)
+        lookup = set(dates)  # constant time membership!
+        return self.__class__(value for value in self if value.date in lookup)
+
+    def restrict(self: S, range_: DateRange) -> S:
+        """Restrict this sequence by removing the dated which
+        date is outside `range_`. The order of this sequence is
+        preserved.
+
+        This operation is **not** performed in-place.
+
+        Parameters
+        ----------
+        range_
+            range delimiting the dated to keep (both side of
+            the range are inclusive)
+
+        Returns
+        -------
+        S
+            new restricted sequence
+        """
+        return self.__class__(value for value in self if value.date in range_)
@@ -1,3 +1,4 @@
+from itertools import chain
 from typing import Iterable, Type, TypeVar
 
 from .dated import Dated
@@ -66,3 +67,24 @@ class DatedSeries(DatedSequence[T_co]):
                 f"date"
             )
             raise ValueError(msg)
+
+    def merge(self: S, other: S) -> S:
+        """Merge this series with `other`. The dated of `other` take
+        precedence over the dated of this series with the same date.
+
+        This operation is **not** performed in-place.
+
+        Parameters
+        ----------
+        other
+            series to merge with this series
+
+        Returns
+        -------
+        S
+            new merged series
+        """
+        dates = set(other.dates)
+        return self.from_unsorted(
+            chain((value for value in self if value.date not in dates), other)
+        )
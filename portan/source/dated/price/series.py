@@ -1,5 +1,21 @@
-from typing import Iterable, SupportsFloat, Tuple, Type, TypeVar
+from operator import index
+from typing import (
+    Iterable,
+    Iterator,
+    SupportsFloat,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ...date import MAX_YEAR, MIN_YEAR, Date, column
+from ...date.range import DateRange
+from ...date.sequence import DateSequence
+from ...price import Price
 from ...price.sequence import PriceSequence
 from ..generic.series import DatedSeries
 from .dated import DatedPrice
@@ -8,7 +24,23 @@ T = TypeVar("T", bound="DatedPriceSeries")
 
 
 class DatedPriceSeries(DatedSeries[DatedPrice]):
-    """An immutable series of :py:class:`DatedPrice`."""
+    """An immutable series of :py:class:`DatedPrice`.
+
+    The series is backed by a column of dates (i.e., datetime64[D]) and
+    a column of prices (i.e., float64), and each :py:class:`DatedPrice`
+    is only created when accessed.
+
+    Parameters
+    ----------
+    values: Iterable[DatedPrice]
+        values to create the series from
+
+    Raises
+    ------
+    ValueError
+        if `values` is not sorted in ascending order, or
+        if `values` contains multiple values with the same date
+    """
 
     @classmethod
     def from_basic(
@@ -43,7 +75,7 @@ class DatedPriceSeries(DatedSeries[DatedPrice]):
         T
             series of dated
         """
-        return cls(cls._from_basic(values))
+        return cls.from_arrays(*cls._parse(values))
 
     @classmethod
     def from_unsorted_basic(
@@ -78,18 +110,339 @@ class DatedPriceSeries(DatedSeries[DatedPrice]):
         T
             series of dated
         """
-        return cls.from_unsorted(cls._from_basic(values))
+        return cls.from_unsorted_arrays(*cls._parse(values))
 
     @staticmethod
-    def _from_basic(
+    def _parse(
         values: Iterable[Tuple[str, SupportsFloat]],
-    ) -> Iterable[DatedPrice]:
-        return (DatedPrice.from_basic(*value) for value in values)
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        values_ = tuple(values)
+        dates = column.from_strings([date for date, _ in values_])
+        prices = np.array([price for _, price in values_], dtype=np.float64)
+        return dates, prices
+
+    @classmethod
+    def from_unsorted(cls: Type[T], values: Iterable[DatedPrice]) -> T:
+        """Create a series by sorting `values` per date in ascending
+        order.
+
+        Parameters
+        ----------
+        values
+            values to create the series from
+
+        Raises
+        ------
+        ValueError
+            if `values` contains multiple values with the same date
+
+        Returns
+        -------
+        T
+            dated series
+        """
+        return cls.from_unsorted_arrays(*cls._split(values))
+
+    @classmethod
+    def from_arrays(cls: Type[T], dates: ArrayLike, prices: ArrayLike) -> T:
+        """Create a series from a column of dates and a column of prices,
+        without creating any :py:class:`DatedPrice`. The columns are
+        copied.
+
+        Parameters
+        ----------
+        dates
+            dates of the series (i.e., convertible to datetime64[D])
+        prices
+            price as of each date in `dates` (i.e., convertible to float64)
+
+        Raises
+        ------
+        ValueError
+            if `dates` and `prices` are not one-dimensional columns of the
+            same length,
+            if any date in `dates` is not a valid date (see :py:class:`Date`
+            for the definition of a valid date),
+            if any price in `prices` is non-finite,
+            if any price in `prices` is not strictly positive,
+            if `dates` is not sorted in ascending order, or
+            if `dates` contains duplicates
+
+        Returns
+        -------
+        T
+            series of dated
+        """
+        dates_ = np.array(dates, dtype="datetime64[D]")  # copy!
+        prices_ = np.array(prices, dtype=np.float64)  # copy!
+        cls._raise_if_invalid_columns(dates_, prices_)
+        return cls._from_columns(dates_, prices_)
+
+    @classmethod
+    def from_unsorted_arrays(
+        cls: Type[T],
+        dates: ArrayLike,
+        prices: ArrayLike,
+    ) -> T:
+        """Create a series from a column of dates and a column of prices,
+        without creating any :py:class:`DatedPrice`. The columns are sorted
+        by date in ascending order prior to creating the series.
+
+        Parameters
+        ----------
+        dates
+            dates of the series (i.e., convertible to datetime64[D])
+        prices
+            price as of each date in `dates` (i.e., convertible to float64)
+
+        Raises
+        ------
+        ValueError
+            if `dates` and `prices` are not one-dimensional columns of the
+            same length,
+            if any date in `dates` is not a valid date (see :py:class:`Date`
+            for the definition of a valid date),
+            if any price in `prices` is non-finite,
+            if any price in `prices` is not strictly positive, or
+            if `dates` contains duplicates
+
+        Returns
+        -------
+        T
+            series of dated
+        """
+        dates_ = np.asarray(dates, dtype="datetime64[D]")
+        prices_ = np.asarray(prices, dtype=np.float64)
+        cls._raise_if_invalid_columns(dates_, prices_)
+        order = np.argsort(dates_, kind="stable")  # sorting copies!
+        dates_ = dates_[order]
+        duplicated = dates_[1:] == dates_[:-1]
+        if np.any(duplicated):  # name the row in `dates`, not once sorted!
+            cls._raise_due_to_duplicated_dates(
+                int(np.min(order[1:][duplicated]))
+            )
+        return cls._from_columns(dates_, prices_[order])
+
+    @classmethod
+    def _raise_if_invalid_columns(cls, dates: np.ndarray, prices: np.ndarray):
+        if dates.ndim != 1 or dates.shape != prices.shape:
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"dates and prices must be one-dimensional, and of the "
+                f"same length"
+            )
+            raise ValueError(msg)
+        invalid = column.invalid(dates)
+        if np.any(invalid):
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"dates must all be valid dates, with a year in "
+                f"[{MIN_YEAR}, {MAX_YEAR}] (first offending row is "
+                f"{np.argmax(invalid)})"
+            )
+            raise ValueError(msg)
+        invalid = ~(np.isfinite(prices) & (prices > 0.0))
+        if np.any(invalid):
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"prices must all be finite, and strictly positive "
+                f"(first offending row is {np.argmax(invalid)})"
+            )
+            raise ValueError(msg)
+
+    @classmethod
+    def _raise_due_to_duplicated_dates(cls, row: int):
+        msg = (
+            f"cannot instantiate {cls.__name__}; "
+            f"values must not contain multiple values with the same "
+            f"date (first offending row is {row})"
+        )
+        raise ValueError(msg)
+
+    @classmethod
+    def _from_columns(cls: Type[T], dates: np.ndarray, prices: np.ndarray) -> T:
+        instance = cls.__new__(cls)
+        instance._set(dates, prices)
+        return instance
+
+    def __init__(self, values: Iterable[DatedPrice]):
+        self._set(*self._split(values))
+
+    @staticmethod
+    def _split(values: Iterable[DatedPrice]) -> Tuple[np.ndarray, np.ndarray]:
+        values_ = tuple(values)
+        ordinals = [value.date.to_ordinal() for value in values_]
+        prices = [float(value.value) for value in values_]
+        return column.from_ordinals(ordinals), np.array(
+            prices, dtype=np.float64
+        )
+
+    def _set(self, dates: np.ndarray, prices: np.ndarray):
+        dates.setflags(write=False)
+        prices.setflags(write=False)
+        self._dates = dates
+        self._prices = prices
+        self._raise_if_has_non_ascending_or_duplicated_dates()
+
+    def _raise_if_has_non_ascending_or_duplicated_dates(self):
+        steps = self._dates[1:] - self._dates[:-1]
+        if np.all(steps > np.timedelta64(0, "D")):
+            return
+        descending = steps < np.timedelta64(0, "D")
+        if np.any(descending):
+            msg = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"values must be sorted by dates in ascending order "
+                f"(first offending row is {np.argmax(descending) + 1})"
+            )
+            raise ValueError(msg)
+        duplicated = steps == np.timedelta64(0, "D")
+        self._raise_due_to_duplicated_dates(int(np.argmax(duplicated)) + 1)
+
+    def __getitem__(
+        self: T,
+        item: Union[slice, int],
+    ) -> Union[T, DatedPrice]:
+        if isinstance(item, slice):
+            return self._from_columns(self._dates[item], self._prices[item])
+        i = index(item)
+        return DatedPrice(
+            Date.from_ordinal(int(column.to_ordinals(self._dates[i]))),
+            Price(self._prices[i]),
+        )
+
+    def __iter__(self) -> Iterator[DatedPrice]:
+        ordinals = column.to_ordinals(self._dates).tolist()
+        prices = self._prices.tolist()
+        for ordinal, price in zip(ordinals, prices):
+            yield DatedPrice(Date.from_ordinal(ordinal), Price(price))
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return np.array_equal(self._dates, other._dates) and np.array_equal(
+            self._prices, other._prices
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._dates.tobytes(), self._prices.tobytes()))
+
+    @property
+    def dates(self) -> DateSequence:
+        """Date of each dated in this series (in order)."""
+        return DateSequence.from_ordinal(
+            column.to_ordinals(self._dates).tolist()
+        )
 
     @property
     def prices(self) -> PriceSequence:
         """Price of each dated in this series (in order)."""
-        return PriceSequence(value.value for value in self)
+        return PriceSequence.from_array(self._prices)
+
+    def has_ascending_dates(self) -> bool:
+        """Verify if the dates in this series are in ascending
+        order.
+
+        Returns
+        -------
+        bool
+            True if the dates in this series are in ascending order,
+            else False
+        """
+        return bool(np.all(self._dates[1:] >= self._dates[:-1]))
+
+    def has_duplicated_dates(self) -> bool:
+        """Verify if the dates in this series contain duplicates.
+
+        Returns
+        -------
+        bool
+            True if the dates in this series contain duplicates,
+            else False
+        """
+        return bool(np.any(self._dates[1:] == self._dates[:-1]))  # sorted!
+
+    def compress(self: T, dates: DateSequence) -> T:
+        """Compress this series by removing the dated which
+        date is not in `dates`. The order of this series is
+        preserved.
+
+        This operation is **not** performed in-place.
+
+        Parameters
+        ----------
+        dates
+            dates to use to determine which dated from this series
+            to remove
+
+        Returns
+        -------
+        T
+            new compressed series
+        """
+        kept = column.from_dates(dates)
+        return self._select(np.isin(self._dates, kept))
+
+    def restrict(self: T, range_: DateRange) -> T:
+        """Restrict this series by removing the dated which
+        date is outside `range_`. The order of this series is
+        preserved.
+
+        This operation is **not** performed in-place.
+
+        Parameters
+        ----------
+        range_
+            range delimiting the dated to keep (both side of
+            the range are inclusive)
+
+        Returns
+        -------
+        T
+            new restricted series
+        """
+        begin, end = column.from_dates([range_.begin, range_.end])
+        return self._select((self._dates >= begin) & (self._dates <= end))
+
+    def _select(self: T, mask: np.ndarray) -> T:
+        return self._from_columns(self._dates[mask], self._prices[mask])
+
+    def merge(self: T, other: T) -> T:
+        """Merge this series with `other`. The dated of `other` take
+        precedence over the dated of this series with the same date.
+
+        This operation is **not** performed in-place.
+
+        Parameters
+        ----------
+        other
+            series to merge with this series
+
+        Returns
+        -------
+        T
+            new merged series
+        """
+        kept = ~np.isin(self._dates, other._dates)
+        dates = np.concatenate([self._dates[kept], other._dates])
+        prices = np.concatenate([self._prices[kept], other._prices])
+        order = np.argsort(dates, kind="stable")
+        return self._from_columns(dates[order], prices[order])
+
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the columns backing this series, without creating any
+        :py:class:`DatedPrice`. The columns are read-only.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            dates (i.e., datetime64[D]) and prices (i.e., float64) of this
+            series
+        """
+        return self._dates, self._prices
 
     def to_basic(self) -> Iterable[Tuple[str, float]]:
         """Get this series as basic Python types.
@@ -104,4 +457,7 @@ class DatedPriceSeries(DatedSeries[DatedPrice]):
         Iterable[Tuple[str, float]]
             this series as basic Python types
         """
-        return (value.to_basic() for value in self)
+        return zip(
+            np.datetime_as_string(self._dates, unit="D").tolist(),
+            self._prices.tolist(),
+        )
@@ -1,5 +1,8 @@
-from typing import Optional
+from typing import List, Optional
 
+import numpy as np
+
+from ... import report
 from ..price.series import DatedPriceSeries
 from .series import DatedPricesSeries
 
@@ -9,12 +12,26 @@ class DatedPricesSeriesBuilder:
     :py:class:`DatedPriceSeries`. The builder creates a
     :py:class:`DatedPricesSeries` from all intersecting
     dates in the :py:class:`DatedPriceSeries` added.
+
+    The series added are aligned once, when getting the
+    :py:class:`DatedPricesSeries` built, in a block of prices with a column
+    per date in the calendar of all their dates. Hence, building never
+    creates any intermediate :py:class:`DatedPrices`. The series built is
+    kept until another series is added, thus getting it again neither
+    aligns the series nor records the prices dropped again.
     """
 
     def __init__(self):
-        self._series: Optional[DatedPricesSeries] = None
+        self._singles: List[DatedPriceSeries] = []
+        self._tickers: List[Optional[str]] = []
+        self._built: Optional[DatedPricesSeries] = None
+
+    @property
+    def count(self) -> int:
+        """Number of :py:class:`DatedPriceSeries` added to this builder."""
+        return len(self._singles)
 
-    def add(self, single: DatedPriceSeries):
+    def add(self, single: DatedPriceSeries, *, ticker: Optional[str] = None):
         """Add a :py:class:`DatedPriceSeries` to the
         :py:class:`DatedPricesSeries` being built.
 
@@ -24,17 +41,14 @@ class DatedPricesSeriesBuilder:
             series of single financial instrument prices
             to add to the :py:class:`DatedPricesSeries`
             being built
+        ticker
+            ticker of the financial instrument, under which the
+            number of prices dropped when aligning is recorded
+            (defaults to None, i.e., not recorded)
         """
-        if self._series is None:
-            self._series = DatedPricesSeries.from_single(single)
-        else:
-            self._add(single)
-
-    def _add(self, single: DatedPriceSeries):
-        intersection = self._series.dates.intersect(single.dates)
-        new = self._series.compress(intersection)
-        compressed = single.compress(intersection)
-        self._series = new.add(compressed)
+        self._singles.append(single)
+        self._tickers.append(ticker)
+        self._built = None  # i.e., must be aligned again!
 
     def get(self) -> DatedPricesSeries:
         """Get the :py:class:`DatedPricesSeries` built using this
@@ -50,10 +64,31 @@ class DatedPricesSeriesBuilder:
         DatedPricesSeries
             built series
         """
-        self._raise_if_series_is_none()
-        return self._series
+        self._raise_if_singles_is_empty()
+        if self._built is None:
+            self._built = self._align()
+        return self._built
+
+    def _align(self) -> DatedPricesSeries:
+        with report.timed(None, report.ALIGN):
+            columns = [single.to_arrays() for single in self._singles]
+            calendar = np.unique(
+                np.concatenate([dates for dates, _ in columns])
+            )
+            block = np.full((len(columns), len(calendar)), np.nan)
+            for row, (dates, prices) in zip(block, columns):
+                row[np.searchsorted(calendar, dates)] = prices
+            available = np.isfinite(block).all(axis=0)  # NaN where missing!
+            kept = int(available.sum())
+            for ticker, (dates, _) in zip(self._tickers, columns):
+                if ticker is not None:
+                    report.count(ticker, dropped=len(dates) - kept)
+            return DatedPricesSeries.from_arrays(
+                calendar[available],
+                block[:, available],
+            )
 
-    def _raise_if_series_is_none(self):
-        if self._series is None:
+    def _raise_if_singles_is_empty(self):
+        if len(self._singles) == 0:
             msg = "cannot get; must add singles before"
             raise RuntimeError(msg)
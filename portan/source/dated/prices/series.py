@@ -1,6 +1,14 @@
-from typing import Iterable, Tuple, Type, TypeVar
+from operator import index
+from typing import Iterable, Iterator, List, Tuple, Type, TypeVar, Union
 
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ...date import MAX_YEAR, MIN_YEAR, Date, column
+from ...date.range import DateRange
+from ...date.sequence import DateSequence
 from ...price.matrix import PriceMatrix
+from ...price.sequence import PriceSequence
 from ..generic.series import DatedSeries
 from ..price.series import DatedPriceSeries
 from .dated import DatedPrices
@@ -11,6 +19,11 @@ T = TypeVar("T", bound="DatedPricesSeries")
 class DatedPricesSeries(DatedSeries[DatedPrices]):
     """Immutable series of :py:class:`DatedPrices`.
 
+    The series is stored in columns, that is a column of dates (i.e.,
+    datetime64[D]) and a contiguous block of prices (i.e., float64) with
+    a row per financial instrument and a column per date. Each
+    :py:class:`DatedPrices` is only created when accessed.
+
     Parameters
     ----------
     values: Iterable[DatedPrices]
@@ -38,30 +51,246 @@ class DatedPricesSeries(DatedSeries[DatedPrices]):
         T
             dated prices series
         """
-        return cls(DatedPrices.from_single(value) for value in single)
+        dates, prices = single.to_arrays()
+        return cls._from_columns(dates, prices[np.newaxis, :])
+
+    @classmethod
+    def from_arrays(cls: Type[T], dates: ArrayLike, prices: ArrayLike) -> T:
+        """Create a series from a column of dates and a block of prices,
+        without creating any :py:class:`DatedPrices`. The column and the
+        block are copied.
+
+        Parameters
+        ----------
+        dates
+            dates of the series (i.e., convertible to datetime64[D])
+        prices
+            block of prices (i.e., convertible to float64) with a row per
+            financial instrument and a column per date in `dates`
+
+        Raises
+        ------
+        ValueError
+            if `dates` is not one-dimensional,
+            if `prices` is not two-dimensional with a column per date in
+            `dates`,
+            if any date in `dates` is not a valid date (see :py:class:`Date`
+            for the definition of a valid date),
+            if any price in `prices` is non-finite,
+            if any price in `prices` is not strictly positive,
+            if `dates` is not sorted in ascending order, or
+            if `dates` contains duplicates
+
+        Returns
+        -------
+        T
+            dated prices series
+        """
+        dates_ = np.array(dates, dtype="datetime64[D]")  # copy!
+        prices_ = np.array(prices, dtype=np.float64, order="C")  # copy!
+        cls._raise_if_invalid_columns(dates_, prices_)
+        return cls._from_columns(dates_, prices_)
+
+    @classmethod
+    def _raise_if_invalid_columns(cls, dates: np.ndarray, prices: np.ndarray):
+        if (
+            dates.ndim != 1
+            or prices.ndim != 2
+            or prices.shape[1] != dates.shape[0]
+        ):
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"dates must be one-dimensional, and prices must be "
+                f"two-dimensional with a column per date"
+            )
+            raise ValueError(msg)
+        if not column.are_valid(dates):
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"dates must all be valid dates, with a year in "
+                f"[{MIN_YEAR}, {MAX_YEAR}]"
+            )
+            raise ValueError(msg)
+        if not np.all(np.isfinite(prices) & (prices > 0.0)):
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"prices must all be finite, and strictly positive"
+            )
+            raise ValueError(msg)
+
+    @classmethod
+    def _from_columns(cls: Type[T], dates: np.ndarray, prices: np.ndarray) -> T:
+        instance = cls.__new__(cls)
+        instance._set(dates, prices)
+        return instance
 
     def __init__(self, values: Iterable[DatedPrices]):
-        super().__init__(values)
-        self._raise_if_number_of_prices_mismatch()
+        values_ = tuple(values)
+        rows = [[float(price) for price in value.value] for value in values_]
+        self._raise_if_number_of_prices_mismatch(rows)
+        width = len(rows[0]) if len(rows) > 0 else 0
+        self._set(
+            column.from_dates(value.date for value in values_),
+            np.array(rows, dtype=np.float64).reshape(len(rows), width).T,
+        )
 
-    def _raise_if_number_of_prices_mismatch(self):
-        if self._is_number_of_prices_mismatch():
+    def _raise_if_number_of_prices_mismatch(self, rows: List[List[float]]):
+        if len(set(len(row) for row in rows)) > 1:
             msg = (
                 f"cannot instantiate {self.__class__.__name__}; "
                 f"values must all have the same number of prices."
             )
             raise ValueError(msg)
 
-    def _is_number_of_prices_mismatch(self) -> bool:
-        return len(set(len(value.value) for value in self)) > 1
+    def _set(self, dates: np.ndarray, prices: np.ndarray):
+        if len(dates) == 0:  # without dates, there are no instruments!
+            prices = np.empty((0, 0))
+        prices = np.ascontiguousarray(prices)
+        dates.setflags(write=False)
+        prices.setflags(write=False)
+        self._dates = dates
+        self._prices = prices
+        self._raise_if_has_non_ascending_dates()
+        self._raise_if_has_duplicated_dates()
+
+    def __getitem__(
+        self: T,
+        item: Union[slice, int],
+    ) -> Union[T, DatedPrices]:
+        if isinstance(item, slice):
+            return self._from_columns(
+                self._dates[item],
+                self._prices[:, item],
+            )
+        i = index(item)
+        return DatedPrices(
+            Date.from_ordinal(int(column.to_ordinals(self._dates[i]))),
+            PriceSequence.from_float(self._prices[:, i].tolist()),
+        )
+
+    def __iter__(self) -> Iterator[DatedPrices]:
+        ordinals = column.to_ordinals(self._dates).tolist()
+        prices = self._prices.T.tolist()
+        for ordinal, value in zip(ordinals, prices):
+            yield DatedPrices(
+                Date.from_ordinal(ordinal),
+                PriceSequence.from_float(value),
+            )
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return np.array_equal(self._dates, other._dates) and np.array_equal(
+            self._prices, other._prices
+        )
+
+    def __hash__(self) -> int:
+        return hash(
+            (
+                self._dates.tobytes(),
+                self._prices.shape,
+                self._prices.tobytes(),
+            )
+        )
+
+    @property
+    def dates(self) -> DateSequence:
+        """Date of each dated in this series (in order)."""
+        return DateSequence.from_ordinal(
+            column.to_ordinals(self._dates).tolist()
+        )
 
     @property
     def prices(self) -> PriceMatrix:
         """Prices of each dated in this series (in order)
-        in matrix format, where each sequence of price is a column."""
-        return PriceMatrix(
-            (value.value for value in self),
-        ).transpose()
+        in matrix format, where each sequence of price is a column.
+
+        The matrix is a view of this series (i.e., the prices
+        are not copied)."""
+        return PriceMatrix.from_array(self._prices)
+
+    def has_ascending_dates(self) -> bool:
+        """Verify if the dates in this series are in ascending
+        order.
+
+        Returns
+        -------
+        bool
+            True if the dates in this series are in ascending order,
+            else False
+        """
+        return bool(np.all(self._dates[1:] >= self._dates[:-1]))
+
+    def has_duplicated_dates(self) -> bool:
+        """Verify if the dates in this series contain duplicates.
+
+        Returns
+        -------
+        bool
+            True if the dates in this series contain duplicates,
+            else False
+        """
+        return len(np.unique(self._dates)) != len(self._dates)
+
+    def compress(self: T, dates: DateSequence) -> T:
+        """Compress this series by removing the dated which
+        date is not in `dates`. The order of this series is
+        preserved.
+
+        This operation is **not** performed in-place.
+
+        Parameters
+        ----------
+        dates
+            dates to use to determine which dated from this series
+            to remove
+
+        Returns
+        -------
+        T
+            new compressed series
+        """
+        return self._select(np.isin(self._dates, column.from_dates(dates)))
+
+    def restrict(self: T, range_: DateRange) -> T:
+        """Restrict this series by removing the dated which
+        date is outside `range_`. The order of this series is
+        preserved.
+
+        This operation is **not** performed in-place.
+
+        Parameters
+        ----------
+        range_
+            range delimiting the dated to keep (both side of
+            the range are inclusive)
+
+        Returns
+        -------
+        T
+            new restricted series
+        """
+        begin, end = column.from_dates([range_.begin, range_.end])
+        return self._select((self._dates >= begin) & (self._dates <= end))
+
+    def _select(self: T, mask: np.ndarray) -> T:
+        return self._from_columns(self._dates[mask], self._prices[:, mask])
+
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the column of dates and the block of prices backing this
+        series, without creating any :py:class:`DatedPrices`. Both are
+        read-only.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            dates (i.e., datetime64[D]), and prices (i.e., float64) with
+            a row per financial instrument and a column per date
+        """
+        return self._dates, self._prices
 
     def to_basic(self) -> Iterable[Tuple[str, Iterable[float]]]:
         """Get this series as basic Python types.
@@ -77,9 +306,9 @@ class DatedPricesSeries(DatedSeries[DatedPrices]):
         Iterable[Tuple[str, Iterable[float]]]
             this series as basic Python types
         """
-        return (
-            (str(value.date), (float(price) for price in value.value))
-            for value in self
+        return zip(
+            np.datetime_as_string(self._dates, unit="D").tolist(),
+            self._prices.T.tolist(),
         )
 
     def add(self: T, single: DatedPriceSeries) -> T:
@@ -103,10 +332,14 @@ class DatedPricesSeries(DatedSeries[DatedPrices]):
         T
             new series with concatenated prices
         """
-        self._raise_if_dates_mismatch(single)
-        return self.__class__(m.add(s.value) for m, s in zip(self, single))
+        dates, prices = single.to_arrays()
+        self._raise_if_dates_mismatch(dates)
+        return self._from_columns(
+            self._dates,
+            np.vstack([self._prices, prices]),
+        )
 
-    def _raise_if_dates_mismatch(self, single: DatedPriceSeries):
-        if self.dates != single.dates:
+    def _raise_if_dates_mismatch(self, dates: np.ndarray):
+        if not np.array_equal(self._dates, dates):
             msg = "cannot add; single must have the same dates as this instance"
             raise ValueError(msg)
@@ -2,3 +2,10 @@ class SourceError(Exception):
     """Exception for errors related to a source of prices."""
 
     pass
+
+
+class TransientSourceError(SourceError):
+    """Exception for transient errors related to a source of prices (e.g.,
+    throttling or timeouts), which may not occur when retrying."""
+
+    pass
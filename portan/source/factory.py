@@ -1,14 +1,179 @@
-from .source import PriceSource
-from .source.multiple import MultipleSource
-from .yahoo import Yahoo
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+from .chart import DEFAULT_BASE_URL, YahooChart
+from .local import Local
+from .source import AsyncPriceSource, PriceSource
+from .source.cache import CachedSource
+from .source.chunked import ChunkedSource
+from .source.coalescing import AsyncCoalescingSource, CoalescingSource
+from .source.multiple import (
+    AsyncMultipleSource,
+    ConcurrentMultipleSource,
+    IMultipleSource,
+    MultipleSource,
+)
+from .source.scheduler import AdaptiveLimiter, ScheduledSource, TokenBucket
+from .source.single import AsyncSingleSource, IAsyncSingleSource, ISingleSource
+from .synthetic import Synthetic
+
+LOCAL_DIRECTORY_VARIABLE = "PORTAN_LOCAL_DIRECTORY"
+YAHOO_BASE_URL_VARIABLE = "PORTAN_YAHOO_BASE_URL"
+
+# coalescing sources are shared by all factories, such that the fetches
+# of all instruments, portfolios and optimisers of the process coalesce!
+# Only the most recently used are kept, since each may hold the prices
+# cached in memory of many instruments.
+_COALESCING_MAXIMUM = 32
+_COALESCING: OrderedDict[
+    Tuple[
+        str,
+        Optional[str],
+        str,
+        Optional[float],
+        Optional[float],
+        Optional[int],
+        Optional[float],
+        Optional[int],
+        str,
+        Tuple[Tuple[str, float], ...],
+    ],
+    Tuple[CoalescingSource, AsyncCoalescingSource],
+] = OrderedDict()
+_COALESCING_LOCK = Lock()
 
 
 class PriceSourceFactory:
-    """Simple factory of :py:class:`PriceSource`."""
+    """Simple factory of :py:class:`PriceSource`.
+
+    Parameters
+    ----------
+    cache: Optional[str]
+        directory in which to cache the prices fetched by the constructed
+        :py:class:`PriceSource` (defaults to None, i.e., no caching)
+    workers: Optional[int]
+        maximum number of instruments for which the constructed
+        :py:class:`PriceSource` (or :py:class:`AsyncPriceSource`) fetches
+        prices concurrently, sharing a single HTTP session when the source
+        is yahoo (defaults to None, i.e., prices are fetched sequentially,
+        or all concurrently when asynchronous)
+    directory: Optional[str]
+        directory from which the constructed :py:class:`PriceSource` reads
+        the prices when the source is local (defaults to None, i.e., the
+        directory in the environment variable `PORTAN_LOCAL_DIRECTORY`,
+        or the current directory if the variable is not set)
+    coalesce: bool
+        whether the constructed :py:class:`PriceSource` coalesces its
+        fetches of a single instrument with the concurrent fetches of
+        any other :py:class:`PriceSource` constructed with the same
+        arguments in the process (defaults to False, i.e., no coalescing)
+    rate: Optional[float]
+        maximum number of fetches of a single instrument per second of the
+        constructed :py:class:`PriceSource`, which are then scheduled to
+        adapt their concurrency to throttling, and retried on transient
+        errors (defaults to None, i.e., no scheduling unless `latency` is
+        provided)
+    latency: Optional[float]
+        seconds above which a fetch of a single instrument is deemed
+        throttled when scheduled, which schedules the fetches even
+        without `rate` (defaults to None, i.e., only transient errors are
+        deemed throttled). Scheduling adapts the number of concurrent
+        fetches, thus it only matters when fetching concurrently (i.e.,
+        with `workers`, `chunk`, or asynchronously)
+    ttl: Optional[float]
+        seconds during which the prices of today cached in memory are served
+        without being revalidated, after which they are served while being
+        revalidated in the background (defaults to None, i.e., prices of
+        today are always fetched; ignored when caching is disabled)
+    chunk: Optional[int]
+        number of calendar years spanned by each chunk of a range of dates,
+        whose prices the constructed :py:class:`PriceSource` fetches
+        concurrently for a single instrument, and caches individually
+        when caching is enabled (defaults to None, i.e., no chunking)
+    base_url: Optional[str]
+        base URL of the chart endpoint from which the constructed
+        :py:class:`PriceSource` fetches the prices when the source is
+        yahoo-chart, such as a local :py:class:`StandIn` (defaults to None,
+        i.e., the base URL in the environment variable
+        `PORTAN_YAHOO_BASE_URL`, or Yahoo Finance if the variable is not
+        set)
+    seed: Optional[int]
+        seed from which all prices are generated when the source is
+        synthetic (defaults to None, i.e., the default of
+        :py:class:`Synthetic`)
+    drift: Optional[float]
+        annualized drift of the prices when the source is synthetic
+        (defaults to None, i.e., the default of :py:class:`Synthetic`)
+    volatility: Optional[float]
+        annualized volatility of the prices when the source is synthetic
+        (defaults to None, i.e., the default of :py:class:`Synthetic`)
+    correlation: Optional[float]
+        correlation between the returns of any two instruments when the
+        source is synthetic (defaults to None, i.e., the default of
+        :py:class:`Synthetic`)
+    missing: Optional[float]
+        probability of a business day without price when the source is
+        synthetic (defaults to None, i.e., the default of
+        :py:class:`Synthetic`)
+    gaps: Optional[float]
+        probability of a gap starting on a business day when the source
+        is synthetic (defaults to None, i.e., the default of
+        :py:class:`Synthetic`)
+    gap: Optional[int]
+        number of consecutive business days without price in a gap when
+        the source is synthetic (defaults to None, i.e., the default of
+        :py:class:`Synthetic`)
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: Optional[str] = None,
+        workers: Optional[int] = None,
+        directory: Optional[str] = None,
+        coalesce: bool = False,
+        rate: Optional[float] = None,
+        latency: Optional[float] = None,
+        ttl: Optional[float] = None,
+        chunk: Optional[int] = None,
+        base_url: Optional[str] = None,
+        seed: Optional[int] = None,
+        drift: Optional[float] = None,
+        volatility: Optional[float] = None,
+        correlation: Optional[float] = None,
+        missing: Optional[float] = None,
+        gaps: Optional[float] = None,
+        gap: Optional[int] = None,
+    ):
+        self._cache = cache
+        self._workers = workers
+        self._directory = directory
+        self._coalesce = coalesce
+        self._rate = rate
+        self._latency = latency
+        self._ttl = ttl
+        self._chunk = chunk
+        self._base_url = base_url
+        # only the settings given override the defaults of Synthetic!
+        settings = dict(
+            seed=seed,
+            drift=drift,
+            volatility=volatility,
+            correlation=correlation,
+            missing=missing,
+            gaps=gaps,
+            gap=gap,
+        )
+        self._synthetic: Dict[str, Any] = {
+            key: value for key, value in settings.items() if value is not None
+        }
+        self._session: Optional[Any] = None
 
     def get(self, name: str) -> PriceSource:
         """Get a :py:class:`PriceSource` which fetches all prices
-        from `name` (e.g., yahoo).
+        from `name` (e.g., yahoo, yahoo-chart, local or synthetic).
 
         Parameters
         ----------
@@ -19,21 +184,170 @@ class PriceSourceFactory:
         Raises
         ------
         ValueError
-            if `name` is an unknown source of prices
+            if `name` is an unknown source of prices,
+            if `workers` is not strictly positive,
+            if `rate` is not strictly positive,
+            if `latency` is not strictly positive,
+            if `ttl` is negative,
+            if `chunk` is not strictly positive, or
+            if the settings of the synthetic source are invalid (see
+            :py:class:`Synthetic`)
 
         Returns
         -------
         PriceSource
             source of price
         """
+        self._raise_if_ttl_is_negative()
         single = self._get_single(name)
-        return PriceSource(single, MultipleSource(single))
+        return PriceSource(single, self._get_multiple(single))
+
+    def get_async(self, name: str) -> AsyncPriceSource:
+        """Get a :py:class:`AsyncPriceSource` which fetches all prices
+        from `name` (e.g., yahoo).
+
+        The prices of multiple financial instruments are always fetched
+        concurrently, at most `workers` at once when provided.
+
+        Parameters
+        ----------
+        name: str
+            name of source of prices for the constructed
+            :py:class:`AsyncPriceSource`
+
+        Raises
+        ------
+        ValueError
+            if `name` is an unknown source of prices,
+            if `workers` is not strictly positive,
+            if `rate` is not strictly positive,
+            if `latency` is not strictly positive,
+            if `ttl` is negative,
+            if `chunk` is not strictly positive, or
+            if the settings of the synthetic source are invalid (see
+            :py:class:`Synthetic`)
+
+        Returns
+        -------
+        AsyncPriceSource
+            asynchronous source of price
+        """
+        self._raise_if_ttl_is_negative()
+        single = self._get_async_single(name)
+        return AsyncPriceSource(
+            single,
+            AsyncMultipleSource(single, concurrency=self._workers),
+        )
+
+    def _raise_if_ttl_is_negative(self):
+        if self._ttl is not None and self._ttl < 0.0:
+            msg = "cannot create source; ttl must be non-negative"
+            raise ValueError(msg)
+
+    def _get_async_single(self, name: str) -> IAsyncSingleSource:
+        if self._coalesce:
+            return self._get_coalescing(name)[1]
+        return AsyncSingleSource(self._get_single(name))
+
+    def _get_multiple(self, single: ISingleSource) -> IMultipleSource:
+        if self._workers is not None:
+            return ConcurrentMultipleSource(single, workers=self._workers)
+        return MultipleSource(single)
+
+    def _get_single(self, name: str) -> ISingleSource:
+        if self._coalesce:
+            return self._get_coalescing(name)[0]
+        return self._get_uncoalesced_single(name)
 
-    def _get_single(self, name: str):
+    def _get_coalescing(
+        self,
+        name: str,
+    ) -> Tuple[CoalescingSource, AsyncCoalescingSource]:
+        key = (
+            name,
+            self._cache,
+            self._get_directory(),
+            self._rate,
+            self._latency,
+            self._workers,
+            self._ttl,
+            self._chunk,
+            self._get_base_url(),
+            tuple(sorted(self._synthetic.items())),
+        )
+        with _COALESCING_LOCK:
+            if key not in _COALESCING:
+                single = CoalescingSource(self._get_uncoalesced_single(name))
+                _COALESCING[key] = (
+                    single,
+                    AsyncCoalescingSource(AsyncSingleSource(single)),
+                )
+            _COALESCING.move_to_end(key)  # most recently used!
+            while len(_COALESCING) > _COALESCING_MAXIMUM:
+                _COALESCING.popitem(last=False)
+            return _COALESCING[key]
+
+    def _get_uncoalesced_single(self, name: str) -> ISingleSource:
+        single = self._get_unscheduled_single(name)
+        if self._rate is not None or self._latency is not None:
+            single = self._schedule(single)
+        if self._cache is not None:
+            single = CachedSource(single, self._cache, name, ttl=self._ttl)
+        if self._chunk is not None:
+            single = ChunkedSource(single, years=self._chunk)
+        return single
+
+    def _schedule(self, single: ISingleSource) -> ScheduledSource:
+        maximum = 32 if self._workers is None else max(self._workers, 1)
+        bucket = None
+        if self._rate is not None:
+            bucket = TokenBucket(self._rate, max(int(self._rate), 1))
+        return ScheduledSource(
+            single,
+            bucket=bucket,
+            limiter=AdaptiveLimiter(
+                min(4, maximum),
+                maximum=maximum,
+                latency=self._latency,
+            ),
+        )
+
+    def _get_unscheduled_single(self, name: str) -> ISingleSource:
         if name == "yahoo":
-            return Yahoo()
+            from .yahoo import Yahoo  # imports pandas lazily!
+
+            return Yahoo(session=self._get_session())
+        if name == "yahoo-chart":
+            return YahooChart(base_url=self._get_base_url())
+        if name == "local":
+            return Local(self._get_directory())
+        if name == "synthetic":
+            return Synthetic(**self._synthetic)
         self._raise_due_to_unknown_source()
 
+    def _get_session(self) -> Optional[Any]:
+        if self._workers is None:
+            return None  # i.e., managed by yfinance
+        if self._session is None:  # shared by all workers!
+            from requests import Session
+            from requests.adapters import HTTPAdapter
+
+            size = max(self._workers, 1)
+            adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+            self._session = Session()
+            self._session.mount("https://", adapter)
+        return self._session
+
+    def _get_directory(self) -> str:
+        if self._directory is not None:
+            return self._directory
+        return os.environ.get(LOCAL_DIRECTORY_VARIABLE, os.curdir)
+
+    def _get_base_url(self) -> str:
+        if self._base_url is not None:
+            return self._base_url
+        return os.environ.get(YAHOO_BASE_URL_VARIABLE, DEFAULT_BASE_URL)
+
     @staticmethod
     def _raise_due_to_unknown_source():
         msg = "cannot create source; unknown source"
@@ -0,0 +1,162 @@
+import os
+from typing import List, TextIO
+from urllib.parse import quote
+
+import numpy as np
+
+from . import report
+from .date import column
+from .date.range import DateRange
+from .dated.price.series import DatedPriceSeries
+from .exception import SourceError
+from .source.single import ISingleSource
+
+_DTYPE = np.dtype([("date", "datetime64[D]"), ("price", np.float64)])
+_NUMPY_EXTENSION = ".npy"
+_CSV_EXTENSION = ".csv"
+
+
+class Local(ISingleSource):
+    """Source of prices for a single financial instrument reading from
+    files on the local disk.
+
+    The prices of each financial instrument are read from a file in
+    `directory` named after its ticker. The file is either a NumPy
+    file (i.e., `<ticker>.npy`) holding a structured array with a
+    `date` field (i.e., datetime64[D]) and a `price` field (i.e.,
+    float64), or a CSV file (i.e., `<ticker>.csv`) with a date in ISO
+    format and a price on each line, and an optional header. The NumPy
+    file takes precedence when both exist, and a financial instrument
+    without any file has no prices.
+
+    Parameters
+    ----------
+    directory: str
+        directory from which to read the prices
+    """
+
+    def __init__(self, directory: str):
+        self._directory = os.path.expanduser(directory)
+
+    @property
+    def directory(self) -> str:
+        """Directory from which to read the prices."""
+        return self._directory
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        """Get prices of `ticker` for business days inside `range_`.
+
+        Parameters
+        ----------
+        ticker
+            ticker of financial instrument to extract prices for
+            (must match with the name of a file in the directory)
+        range_
+            range delimiting the business days for which to extract prices
+            (both side of the range are inclusive)
+
+        Raises
+        ------
+        SourceError
+            if the file of `ticker` cannot be read or parsed, or
+            if the prices read are in an unexpected format (e.g., non-finite
+            prices)
+
+        Returns
+        -------
+        DatedPriceSeries
+            prices read
+        """
+        with report.timed(ticker, report.READ):
+            records = self._read(ticker)
+        with report.timed(ticker, report.PARSE):
+            begin = np.datetime64(str(range_.begin), "D")
+            end = np.datetime64(str(range_.end), "D")
+            inside = (records["date"] >= begin) & (records["date"] <= end)
+            return self._to_dated(ticker, records[inside])
+
+    def _read(self, ticker: str) -> np.ndarray:
+        path = os.path.join(self._directory, quote(ticker, safe=""))
+        try:
+            if os.path.isfile(path + _NUMPY_EXTENSION):
+                return self._read_numpy(path + _NUMPY_EXTENSION)
+            if os.path.isfile(path + _CSV_EXTENSION):
+                return self._read_csv(ticker, path + _CSV_EXTENSION)
+        except (OSError, ValueError, TypeError, IndexError) as err:
+            msg = (
+                f"cannot source prices from local file for {ticker}; "
+                f"file cannot be read, or is in an unexpected format"
+            )
+            raise SourceError(msg) from err
+        return np.empty(0, dtype=_DTYPE)
+
+    @staticmethod
+    def _read_numpy(path: str) -> np.ndarray:
+        loaded = np.load(path, mmap_mode="r", allow_pickle=False)
+        records = np.empty(len(loaded), dtype=_DTYPE)
+        records["date"] = loaded["date"]
+        records["price"] = loaded["price"]
+        return records
+
+    def _read_csv(self, ticker: str, path: str) -> np.ndarray:
+        with open(path) as f:
+            self._skip_header(f)
+            begin = f.tell()
+            if f.read(1) == "":  # empty!
+                return np.empty(0, dtype=_DTYPE)
+            f.seek(begin)
+            rows = np.loadtxt(
+                f,
+                delimiter=",",
+                dtype=str,
+                usecols=(0, 1),
+                ndmin=2,
+            )
+        records = np.empty(len(rows), dtype=_DTYPE)
+        dates = np.char.strip(rows[:, 0]).tolist()
+        records["date"] = self._parse_dates(ticker, dates)
+        records["price"] = rows[:, 1].astype(np.float64)
+        return records
+
+    @staticmethod
+    def _parse_dates(ticker: str, values: List[str]) -> np.ndarray:
+        try:
+            return column.from_strings(values)  # strict, unlike loadtxt!
+        except ValueError as err:
+            row = next(i for i, v in enumerate(values) if not _is_date(v))
+            msg = (
+                f"cannot source prices from local file for {ticker}; "
+                f"dates must be valid dates in ISO format (i.e., "
+                f"YYYY-MM-DD) (first offending row is {row})"
+            )
+            raise SourceError(msg) from err
+
+    @staticmethod
+    def _skip_header(f: TextIO):
+        first = f.readline()
+        if first[:1].isdigit():  # no header!
+            f.seek(0)
+
+    @staticmethod
+    def _to_dated(ticker: str, records: np.ndarray) -> DatedPriceSeries:
+        try:
+            return DatedPriceSeries.from_unsorted_arrays(
+                records["date"],
+                records["price"],
+            )
+        except ValueError as err:
+            msg = (
+                f"cannot source prices from local file for {ticker}; "
+                f"data read is in an unexpected format, likely cause "
+                f"is some prices which are non-finite (i.e., NaN, inf "
+                f"or -inf), negative or zero, or duplicated dates"
+            )
+            raise SourceError(msg) from err
+
+
+def _is_date(value: str) -> bool:
+    try:
+        column.from_strings([value])
+    except ValueError:
+        return False
+    return True
@@ -1,9 +1,34 @@
-from portan.utilities.collections import Matrix
+import numpy as np
 
+from portan.utilities.collections import BlockMatrix
+
+from .price import Price
 from .sequence import PriceSequence
 
 
-class PriceMatrix(Matrix[PriceSequence]):
-    """Immutable matrix of prices."""
+class PriceMatrix(BlockMatrix[PriceSequence]):
+    """Immutable matrix of prices.
+
+    The matrix is backed by a two-dimensional block of prices (i.e.,
+    float64) with a row per sequence of prices, and each
+    :py:class:`PriceSequence` is only created when accessed.
+
+    Parameters
+    ----------
+    values: Iterable[PriceSequence]
+        values to create the matrix from
+
+    Raises
+    ------
+    ValueError
+        if the values in `values` are not all of the same length
+    """
+
+    _VALID = "finite, and strictly positive"
+
+    @classmethod
+    def _invalid(cls, block: np.ndarray) -> np.ndarray:
+        return ~(np.isfinite(block) & (block > 0.0))
 
-    pass
+    def _to_sequence(self, row: np.ndarray) -> PriceSequence:
+        return PriceSequence(Price._from_valid(v) for v in row.tolist())
@@ -1,5 +1,8 @@
 from typing import Iterable, SupportsFloat, Type, TypeVar
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 from portan.utilities.collections import Sequence
 
 from .price import Price
@@ -30,7 +33,47 @@ class PriceSequence(Sequence[Price]):
         T
             sequence from `values`
         """
-        return cls(Price(value) for value in values)
+        return cls.from_array(np.array(list(values), dtype=np.float64))
+
+    @classmethod
+    def from_array(cls: Type[T], values: ArrayLike) -> T:
+        """Create a sequence from an array of floating-point numbers,
+        which are validated all at once.
+
+        Parameters
+        ----------
+        values
+            values to create the sequence from (i.e., convertible to a
+            one-dimensional float64 array)
+
+        Raises
+        ------
+        ValueError
+            if `values` is not one-dimensional,
+            if any value in `values` is not finite, or
+            if any value in `values` is not strictly positive
+
+        Returns
+        -------
+        T
+            sequence from `values`
+        """
+        values_ = np.asarray(values, dtype=np.float64)
+        if values_.ndim != 1:
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"values must be one-dimensional"
+            )
+            raise ValueError(msg)
+        invalid = ~(np.isfinite(values_) & (values_ > 0.0))
+        if np.any(invalid):
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"values must all be finite, and strictly positive "
+                f"(first offending row is {np.argmax(invalid)})"
+            )
+            raise ValueError(msg)
+        return cls(Price._from_valid(value) for value in values_.tolist())
 
     def add(self: T, value: Price) -> T:
         """Add `value` at the end of this sequence.
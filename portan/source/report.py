@@ -0,0 +1,387 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
+
+from portan.utilities.collections import Sequence
+
+GET = "get"
+NETWORK = "network"
+READ = "read"
+PARSE = "parse"
+ALIGN = "align"
+
+HIT = "hit"
+PARTIAL = "partial"
+MISS = "miss"
+
+
+class TickerReport:
+    """Report of the fetch of prices of a single financial instrument.
+
+    Parameters
+    ----------
+    ticker: str
+        ticker of the financial instrument
+    phases: Mapping[str, float]
+        seconds spent in each phase of the fetch (e.g., get, network,
+        read, or parse)
+    rows: int
+        number of prices received
+    dropped: int
+        number of prices dropped when aligning the prices with the prices
+        of the other financial instruments fetched
+    bytes_: int
+        number of bytes received from the network, when known
+    cache: Optional[str]
+        whether the prices were served from the cache (i.e., hit), partly
+        served from the cache (i.e., partial), or fetched (i.e., miss), or
+        None when the prices are not cached
+    discarded: int
+        number of times the prices cached were discarded, since unreadable
+        (e.g., corrupted) or revised since cached (defaults to 0)
+    """
+
+    def __init__(
+        self,
+        ticker: str,
+        *,
+        phases: Mapping[str, float],
+        rows: int,
+        dropped: int,
+        bytes_: int,
+        cache: Optional[str],
+        discarded: int = 0,
+    ):
+        self._ticker = ticker
+        self._phases = dict(phases)
+        self._rows = rows
+        self._dropped = dropped
+        self._bytes = bytes_
+        self._cache = cache
+        self._discarded = discarded
+
+    @property
+    def ticker(self) -> str:
+        """Ticker of the financial instrument."""
+        return self._ticker
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        """Seconds spent in each phase of the fetch."""
+        return dict(self._phases)
+
+    @property
+    def rows(self) -> int:
+        """Number of prices received."""
+        return self._rows
+
+    @property
+    def dropped(self) -> int:
+        """Number of prices dropped when aligning the prices."""
+        return self._dropped
+
+    @property
+    def bytes_(self) -> int:
+        """Number of bytes received from the network, when known."""
+        return self._bytes
+
+    @property
+    def cache(self) -> Optional[str]:
+        """Whether the prices were served from the cache (i.e., hit,
+        partial or miss), or None when the prices are not cached."""
+        return self._cache
+
+    @property
+    def discarded(self) -> int:
+        """Number of times the prices cached were discarded."""
+        return self._discarded
+
+    def to_basic(self) -> Dict[str, Any]:
+        """Get this report as basic Python types.
+
+        Returns
+        -------
+        Dict[str, Any]
+            mapping of each attribute of this report (except the ticker)
+            to its value
+        """
+        return {
+            "phases": dict(self._phases),
+            "rows": self._rows,
+            "dropped": self._dropped,
+            "bytes": self._bytes,
+            "cache": self._cache,
+            "discarded": self._discarded,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return (self._ticker, self.to_basic()) == (
+            other._ticker,
+            other.to_basic(),
+        )
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}({self._ticker})>"
+
+
+class FetchReport(Sequence[TickerReport]):
+    """Immutable report of a fetch of prices of financial instruments,
+    with a :py:class:`TickerReport` per financial instrument fetched (in
+    order of first measure recorded, thus not necessarily in order of
+    request when fetched concurrently).
+
+    Parameters
+    ----------
+    values: Iterable[TickerReport]
+        report of each financial instrument fetched
+    phases: Mapping[str, float]
+        seconds spent in each phase of the fetch not attributable to a
+        single financial instrument (e.g., align)
+    """
+
+    def __init__(
+        self,
+        values: Iterable[TickerReport],
+        *,
+        phases: Optional[Mapping[str, float]] = None,
+    ):
+        super().__init__(values)
+        self._phases = dict({} if phases is None else phases)
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        """Seconds spent in each phase of the fetch not attributable to a
+        single financial instrument."""
+        return dict(self._phases)
+
+    def to_basic(self) -> Dict[str, Any]:
+        """Get this report as basic Python types.
+
+        Returns
+        -------
+        Dict[str, Any]
+            mapping with the seconds spent in each phase not attributable
+            to a single financial instrument (i.e., phases), and the report
+            of each financial instrument as basic Python types (i.e.,
+            tickers)
+        """
+        return {
+            "phases": dict(self._phases),
+            "tickers": {value.ticker: value.to_basic() for value in self},
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return super().__eq__(other) and self._phases == other._phases
+
+    def __hash__(self) -> int:
+        return hash(tuple(value.ticker for value in self))
+
+
+class FetchRecorder:
+    """Thread-safe recorder of the measures taken while fetching prices,
+    from which to get a :py:class:`FetchReport`."""
+
+    def __init__(self):
+        self._tickers: Dict[str, Dict[str, Any]] = {}
+        self._phases: Dict[str, float] = {}
+        self._lock = Lock()
+
+    def add_time(self, ticker: Optional[str], phase: str, seconds: float):
+        """Add `seconds` to the time spent in `phase` for `ticker`, or for
+        the whole fetch if `ticker` is None."""
+        with self._lock:
+            phases = self._phases if ticker is None else self._get(ticker)[0]
+            phases[phase] = phases.get(phase, 0.0) + seconds
+
+    def add_rows(self, ticker: str, rows: int):
+        """Add `rows` to the number of prices received for `ticker`."""
+        self._add(ticker, "rows", rows)
+
+    def add_dropped(self, ticker: str, rows: int):
+        """Add `rows` to the number of prices dropped for `ticker`."""
+        self._add(ticker, "dropped", rows)
+
+    def add_bytes(self, ticker: str, bytes_: int):
+        """Add `bytes_` to the number of bytes received for `ticker`."""
+        self._add(ticker, "bytes", bytes_)
+
+    def add_discarded(self, ticker: str):
+        """Add one to the number of times the prices cached for `ticker`
+        were discarded."""
+        self._add(ticker, "discarded", 1)
+
+    def set_cache(self, ticker: str, status: str):
+        """Set the cache status (i.e., hit, partial or miss) of `ticker`,
+        which is partial once both hits and misses are recorded."""
+        with self._lock:
+            measures = self._get(ticker)[1]
+            previous = measures["cache"]
+            if previous is not None and previous != status:
+                status = PARTIAL
+            measures["cache"] = status
+
+    def _add(self, ticker: str, measure: str, value: int):
+        with self._lock:
+            self._get(ticker)[1][measure] += value
+
+    def _get(self, ticker: str):
+        if ticker not in self._tickers:
+            self._tickers[ticker] = (
+                {},
+                {
+                    "rows": 0,
+                    "dropped": 0,
+                    "bytes": 0,
+                    "cache": None,
+                    "discarded": 0,
+                },
+            )
+        return self._tickers[ticker]
+
+    def report(self) -> FetchReport:
+        """Get the report of the measures recorded so far.
+
+        Returns
+        -------
+        FetchReport
+            report of the fetch
+        """
+        with self._lock:
+            return FetchReport(
+                (
+                    TickerReport(
+                        ticker,
+                        phases=phases,
+                        rows=measures["rows"],
+                        dropped=measures["dropped"],
+                        bytes_=measures["bytes"],
+                        cache=measures["cache"],
+                        discarded=measures["discarded"],
+                    )
+                    for ticker, (phases, measures) in self._tickers.items()
+                ),
+                phases=self._phases,
+            )
+
+
+_RECORDER: ContextVar[Optional[FetchRecorder]] = ContextVar(
+    "portan_fetch_recorder", default=None
+)
+
+
+@contextmanager
+def recording() -> Iterator[FetchRecorder]:
+    """Context in which the fetches of prices (in the current thread or
+    task, and in the threads and tasks they start) are recorded.
+
+    Yields
+    ------
+    FetchRecorder
+        recorder of the fetches
+    """
+    token = _RECORDER.set(FetchRecorder())
+    try:
+        yield _RECORDER.get()
+    finally:
+        _RECORDER.reset(token)
+
+
+def current() -> Optional[FetchRecorder]:
+    """Get the recorder of the current context, if any.
+
+    Returns
+    -------
+    Optional[FetchRecorder]
+        recorder of the current context, or None when not recording
+    """
+    return _RECORDER.get()
+
+
+@contextmanager
+def timed(ticker: Optional[str], phase: str) -> Iterator[None]:
+    """Context whose wall time is added to `phase` for `ticker` (or for
+    the whole fetch if `ticker` is None), when recording.
+
+    Parameters
+    ----------
+    ticker
+        ticker of the financial instrument being fetched, if any
+    phase
+        phase of the fetch (e.g., network)
+    """
+    recorder = _RECORDER.get()
+    if recorder is None:
+        yield
+        return
+    begin = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.add_time(ticker, phase, time.perf_counter() - begin)
+
+
+def count(
+    ticker: str,
+    *,
+    rows: int = 0,
+    dropped: int = 0,
+    bytes_: int = 0,
+):
+    """Add to the number of prices received, the number of prices
+    dropped, and the number of bytes received for `ticker`, when
+    recording.
+
+    Parameters
+    ----------
+    ticker
+        ticker of the financial instrument being fetched
+    rows
+        number of prices received (defaults to 0)
+    dropped
+        number of prices dropped when aligning (defaults to 0)
+    bytes_
+        number of bytes received from the network (defaults to 0)
+    """
+    recorder = _RECORDER.get()
+    if recorder is None:
+        return
+    recorder.add_rows(ticker, rows)
+    recorder.add_dropped(ticker, dropped)
+    recorder.add_bytes(ticker, bytes_)
+
+
+def cache(ticker: str, status: str):
+    """Set the cache status (i.e., hit, partial or miss) of `ticker`,
+    when recording.
+
+    Parameters
+    ----------
+    ticker
+        ticker of the financial instrument being fetched
+    status
+        whether the prices were served from the cache (i.e., hit), partly
+        served from the cache (i.e., partial), or fetched (i.e., miss)
+    """
+    recorder = _RECORDER.get()
+    if recorder is not None:
+        recorder.set_cache(ticker, status)
+
+
+def discard(ticker: str):
+    """Add one to the number of times the prices cached for `ticker` were
+    discarded (e.g., corrupted), when recording.
+
+    Parameters
+    ----------
+    ticker
+        ticker of the financial instrument being fetched
+    """
+    recorder = _RECORDER.get()
+    if recorder is not None:
+        recorder.add_discarded(ticker)
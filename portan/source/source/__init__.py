@@ -1,3 +1,3 @@
-from .source import PriceSource
+from .source import AsyncPriceSource, PriceSource
 
-__all__ = ["PriceSource"]
+__all__ = ["AsyncPriceSource", "PriceSource"]
@@ -0,0 +1,464 @@
+import json
+import os
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from tempfile import NamedTemporaryFile
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+from urllib.parse import quote
+
+import numpy as np
+
+from .. import report
+from ..date import Date, column
+from ..date.coverage import DateCoverage
+from ..date.range import DateRange
+from ..dated.price.series import DatedPriceSeries
+from ..exception import SourceError
+from .single import ISingleSource
+
+T = TypeVar("T")
+_Settled = Tuple[DateCoverage, DatedPriceSeries]
+_Revisable = Tuple[DateRange, DatedPriceSeries, float]
+
+
+class CachedSource(ISingleSource):
+    """Source of prices for a single financial instrument caching on
+    disk the prices fetched from another :py:class:`ISingleSource`.
+
+    The prices are stored per ticker along with the ranges of dates they
+    cover. A range of dates already covered is served from memory (or
+    from disk the first time), while only the segments of a range of
+    dates that are not covered are fetched. Prices of the `recent` most
+    recent days (i.e., as of today, or later, by default) are never
+    stored on disk, since they may not be available yet (or may still be
+    revised).
+
+    Each segment fetched also includes the last price cached before it,
+    if any is adjacent to it. When that price differs from the price
+    cached (e.g., adjusted for a split or a dividend since cached), all
+    prices cached for the ticker are discarded, and the whole range of
+    dates is fetched again.
+
+    When `ttl` is provided, prices of the most recent days are kept in
+    memory instead, and are served as is for `ttl` seconds after being
+    fetched. Afterwards, they are still served immediately (i.e., stale)
+    while being fetched again in the background (i.e., revalidated).
+
+    The prices of at most `memory` tickers are kept in memory, and the
+    prices of the least recently used ticker are evicted first (i.e.,
+    read again from disk when next used).
+
+    Parameters
+    ----------
+    single: ISingleSource
+        source of prices from which to fetch the prices which are not
+        cached
+    directory: str
+        directory in which to cache the prices
+    name: str
+        name of `single` (e.g., yahoo) used to separate its prices
+        from the prices of other sources in `directory`
+    ttl: Optional[float]
+        seconds during which prices of the most recent days are served
+        without being revalidated (defaults to None, i.e., prices of the
+        most recent days are always fetched)
+    recent: int
+        number of most recent days, up to today, whose prices may still
+        be revised (defaults to 1, i.e., only today)
+    memory: int
+        maximum number of tickers whose prices are kept in memory
+        (defaults to 256)
+    clock: Callable[[], float]
+        monotonic clock in seconds (defaults to `time.monotonic`)
+
+    Raises
+    ------
+    ValueError
+        if `ttl` is negative,
+        if `recent` is negative or zero, or
+        if `memory` is negative or zero
+    """
+
+    def __init__(
+        self,
+        single: ISingleSource,
+        directory: str,
+        name: str,
+        *,
+        ttl: Optional[float] = None,
+        recent: int = 1,
+        memory: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._single = single
+        self._directory = os.path.join(os.path.expanduser(directory), name)
+        self._ttl = ttl
+        self._recent = recent
+        self._memory = memory
+        self._raise_if_ttl_recent_or_memory_is_invalid()
+        self._clock = clock
+        # least recently used tickers first!
+        self._settled: OrderedDict[str, _Settled] = OrderedDict()
+        self._revisable: OrderedDict[str, _Revisable] = OrderedDict()
+        self._revalidations: Dict[str, Thread] = {}
+        self._revisions: Dict[str, int] = {}
+        self._locks: Dict[str, Lock] = {}
+        self._lock = Lock()
+
+    def _raise_if_ttl_recent_or_memory_is_invalid(self):
+        if (
+            (self._ttl is not None and self._ttl < 0.0)
+            or self._recent <= 0
+            or self._memory <= 0
+        ):
+            msg = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"ttl must be non-negative, and recent and memory must be "
+                f"strictly positive"
+            )
+            raise ValueError(msg)
+
+    @property
+    def single(self) -> ISingleSource:
+        """Source of prices from which to fetch the prices which are not
+        cached. This is exposed for testing purposes only."""
+        return self._single
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        """Get prices of `ticker` for business days inside `range_`.
+
+        Parameters
+        ----------
+        ticker
+            ticker of financial instrument to extract prices for
+        range_
+            range delimiting the business days for which to extract prices
+            (both side of the range are inclusive)
+
+        Raises
+        ------
+        SourceError
+            if there's an unexpected error when fetching prices from the
+            source,
+            if the fetched prices are in an unexpected format (e.g., non-finite
+            prices), or
+            if the prices cannot be written to the cache
+
+        Returns
+        -------
+        DatedPriceSeries
+            fetched prices
+        """
+        last = Date.today().decrement(by=self._recent)
+        with self._get_lock(ticker):
+            coverage, cached = self._load(ticker, range_, last)
+            missing: List[DateRange] = []
+            if range_.begin <= last:
+                settled = DateRange(range_.begin, min(range_.end, last))
+                missing = list(coverage.missing(settled))
+            revisable: Optional[DateRange] = None
+            if range_.end > last:
+                revisable = DateRange(
+                    max(range_.begin, last.increment()), range_.end
+                )
+                served = self._serve(ticker, revisable)
+                if served is None:
+                    missing = self._extend(missing, revisable, last)
+                else:
+                    cached = cached.merge(served)
+            if len(missing) == 0:
+                report.cache(ticker, report.HIT)
+                return cached.restrict(range_)
+        anchors = [self._anchor(coverage, cached, value) for value in missing]
+        fetched = self._fetch(  # other ranges may proceed!
+            ticker,
+            [
+                value if anchor is None else DateRange(anchor, value.end)
+                for value, anchor in zip(missing, anchors)
+            ],
+        )
+        revised = self._is_revised(cached, fetched, anchors)
+        report.cache(
+            ticker, report.MISS if revised else self._status(range_, missing)
+        )
+        if revised:  # e.g., adjusted for a split or a dividend since cached!
+            missing, cached = [range_], DatedPriceSeries([])
+            fetched = self._fetch(ticker, missing)
+        with self._get_lock(ticker):
+            if revised:
+                self._discard(ticker)
+            self._update(ticker, missing, fetched, last)
+            if revisable is not None and self._ttl is not None:
+                self._keep(ticker, revisable, fetched.restrict(revisable))
+        return cached.merge(fetched).restrict(range_)
+
+    def revisions(self, ticker: str) -> int:
+        """Get the number of times the cached prices of `ticker` were
+        discarded, since prices fetched again differed from the prices
+        cached for the same dates (e.g., adjusted for a split or a
+        dividend since cached).
+
+        Parameters
+        ----------
+        ticker
+            ticker of financial instrument
+
+        Returns
+        -------
+        int
+            number of times the cached prices of `ticker` were discarded
+        """
+        with self._lock:
+            return self._revisions.get(ticker, 0)
+
+    @staticmethod
+    def _status(range_: DateRange, missing: List[DateRange]) -> str:
+        if missing == [range_]:
+            return report.MISS
+        return report.PARTIAL
+
+    def _get_lock(self, ticker: str) -> Lock:
+        with self._lock:
+            return self._locks.setdefault(ticker, Lock())
+
+    def _load(
+        self,
+        ticker: str,
+        range_: DateRange,
+        last: Date,
+    ) -> Tuple[DateCoverage, DatedPriceSeries]:
+        loaded = self._recall(self._settled, ticker)
+        if loaded is not None and (
+            range_.begin > last
+            or loaded[0].includes(
+                DateRange(range_.begin, min(range_.end, last))
+            )
+        ):
+            return loaded
+        with report.timed(ticker, report.READ):
+            loaded = self._read(ticker)  # possibly cached by another process!
+        self._remember(self._settled, ticker, loaded)
+        return loaded
+
+    def _recall(self, memory: OrderedDict[str, T], ticker: str) -> Optional[T]:
+        with self._lock:
+            value = memory.get(ticker)
+            if value is not None:
+                memory.move_to_end(ticker)  # most recently used!
+            return value
+
+    def _remember(self, memory: OrderedDict[str, T], ticker: str, value: T):
+        with self._lock:
+            memory[ticker] = value
+            memory.move_to_end(ticker)
+            while len(memory) > self._memory:
+                memory.popitem(last=False)  # least recently used!
+
+    def _serve(
+        self,
+        ticker: str,
+        range_: DateRange,
+    ) -> Optional[DatedPriceSeries]:
+        if self._ttl is None:
+            return None
+        entry = self._recall(self._revisable, ticker)
+        if entry is None or not entry[0].includes(range_):
+            return None
+        kept, cached, fetched_at = entry
+        if self._clock() - fetched_at > self._ttl:  # stale!
+            self._revalidate(ticker, kept)
+        return cached.restrict(range_)
+
+    @staticmethod
+    def _extend(
+        missing: List[DateRange],
+        revisable: DateRange,
+        last: Date,
+    ) -> List[DateRange]:
+        if len(missing) > 0 and missing[-1].end == last:  # single fetch!
+            return [
+                *missing[:-1],
+                DateRange(missing[-1].begin, revisable.end),
+            ]
+        return [*missing, revisable]
+
+    @staticmethod
+    def _anchor(
+        coverage: DateCoverage,
+        cached: DatedPriceSeries,
+        segment: DateRange,
+    ) -> Optional[Date]:
+        try:
+            before = segment.begin.decrement()
+        except OverflowError:
+            return None
+        for value in coverage:
+            if value.begin <= before <= value.end:  # adjacent to segment!
+                dates, _ = cached.restrict(
+                    DateRange(value.begin, before)
+                ).to_arrays()
+                if len(dates) > 0:
+                    return Date(str(dates[-1]))
+        return None
+
+    @staticmethod
+    def _is_revised(
+        cached: DatedPriceSeries,
+        fetched: DatedPriceSeries,
+        anchors: Iterable[Optional[Date]],
+    ) -> bool:
+        kept = column.from_dates(
+            anchor for anchor in anchors if anchor is not None
+        )
+        if len(kept) == 0:
+            return False
+        dates, prices = cached.to_arrays()
+        expected = prices[np.isin(dates, kept)]
+        dates, prices = fetched.to_arrays()
+        actual = prices[np.isin(dates, kept)]
+        return len(actual) != len(expected) or not np.allclose(
+            actual, expected, rtol=1e-9, atol=0.0
+        )
+
+    def _discard(self, ticker: str):
+        empty = DateCoverage([]), DatedPriceSeries([])
+        self._write(ticker, *empty)  # also discarded by other processes!
+        self._remember(self._settled, ticker, empty)
+        report.discard(ticker)
+        with self._lock:
+            self._revisable.pop(ticker, None)
+            self._revisions[ticker] = self._revisions.get(ticker, 0) + 1
+
+    def _fetch(
+        self,
+        ticker: str,
+        missing: Iterable[DateRange],
+    ) -> DatedPriceSeries:
+        fetched = DatedPriceSeries([])
+        for segment in missing:
+            fetched = fetched.merge(self._single.get(ticker, segment))
+        return fetched
+
+    def _update(
+        self,
+        ticker: str,
+        missing: List[DateRange],
+        fetched: DatedPriceSeries,
+        last: Date,
+    ):
+        if missing[0].begin > last:
+            return
+        latest = self._recall(self._settled, ticker)
+        if latest is None:  # evicted while fetching!
+            latest = self._read(ticker)
+        coverage, cached = latest
+        for segment in missing:
+            if segment.begin <= last:
+                coverage = coverage.add(
+                    DateRange(segment.begin, min(segment.end, last))
+                )
+        merged = cached.merge(
+            fetched.restrict(DateRange(missing[0].begin, last))
+        )
+        self._write(ticker, coverage, merged)
+        self._remember(self._settled, ticker, (coverage, merged))
+
+    def _keep(self, ticker: str, range_: DateRange, dated: DatedPriceSeries):
+        self._remember(self._revisable, ticker, (range_, dated, self._clock()))
+
+    def _revalidate(self, ticker: str, range_: DateRange):
+        with self._lock:
+            if ticker in self._revalidations:
+                return
+            thread = Thread(
+                target=self._run_revalidation,
+                args=(ticker, range_),
+                daemon=True,
+            )
+            self._revalidations[ticker] = thread
+        thread.start()
+
+    def _run_revalidation(self, ticker: str, range_: DateRange):
+        try:
+            fetched = self._single.get(ticker, range_)
+            with self._get_lock(ticker):
+                self._keep(ticker, range_, fetched)
+        except SourceError:
+            pass  # served stale until the next revalidation!
+        finally:
+            with self._lock:
+                del self._revalidations[ticker]
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait for the revalidations in the background to complete. This
+        is exposed for testing purposes only.
+
+        Parameters
+        ----------
+        timeout
+            seconds to wait for each revalidation at most (defaults to
+            None, i.e., no limit)
+        """
+        with self._lock:
+            threads = list(self._revalidations.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    def _path(self, ticker: str) -> str:
+        return os.path.join(self._directory, f"{quote(ticker, safe='')}.json")
+
+    def _read(self, ticker: str) -> Tuple[DateCoverage, DatedPriceSeries]:
+        try:
+            with open(self._path(ticker), "r") as f:
+                data = json.load(f)
+            return (
+                DateCoverage(
+                    DateRange.from_string(*value) for value in data["coverage"]
+                ),
+                DatedPriceSeries.from_basic(data["prices"]),
+            )
+        except FileNotFoundError:  # never cached!
+            return DateCoverage([]), DatedPriceSeries([])
+        except (OSError, ValueError, KeyError):  # corrupted, thus start over!
+            report.discard(ticker)
+            return DateCoverage([]), DatedPriceSeries([])
+
+    def _write(
+        self,
+        ticker: str,
+        coverage: DateCoverage,
+        series: DatedPriceSeries,
+    ):
+        data = {
+            "coverage": [
+                [str(value.begin), str(value.end)] for value in coverage
+            ],
+            "prices": list(series.to_basic()),
+        }
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            self._replace(ticker, data)
+        except OSError as err:
+            msg = (
+                f"cannot cache prices for {ticker}; an unexpected error "
+                f"occurred when writing to {self._directory}"
+            )
+            raise SourceError(msg) from err
+
+    def _replace(self, ticker: str, data: Dict[str, Any]):
+        f = NamedTemporaryFile(
+            "w",
+            dir=self._directory,
+            suffix=".tmp",
+            delete=False,
+        )
+        try:
+            with f:
+                json.dump(data, f)
+            os.replace(f.name, self._path(ticker))  # atomic!
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(f.name)  # never left behind!
+            raise
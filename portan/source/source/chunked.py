@@ -0,0 +1,143 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import List, Sequence
+
+import numpy as np
+
+from ..date.range import DateRange
+from ..dated.price.series import DatedPriceSeries
+from .cache import CachedSource
+from .single import ISingleSource
+
+
+class ChunkedSource(ISingleSource):
+    """Source of prices for a single financial instrument splitting long
+    ranges of dates into chunks fetched concurrently from another
+    :py:class:`ISingleSource`.
+
+    A range of dates is split into chunks spanning `years` calendar years
+    each (see :py:meth:`DateRange.split`), whose prices are fetched in a
+    pool of threads, and merged once all chunks are fetched. Chunks are
+    aligned on calendar years regardless of the range requested, thus
+    `single` may cache the prices of each chunk on its own (e.g.,
+    :py:class:`CachedSource`), such that a failure only discards the
+    prices of the chunk failing. When a :py:class:`CachedSource` discards
+    the prices of an instrument while fetching (e.g., adjusted for a
+    split since cached), all chunks are fetched again, since the chunks
+    served from its cache may be stale.
+
+    Parameters
+    ----------
+    single: ISingleSource
+        source of prices from which to fetch the prices of each chunk,
+        which is shared by all threads, thus it must be thread-safe
+    years: int
+        number of calendar years spanned by each chunk (defaults to 1)
+    workers: int
+        maximum number of chunks for which to fetch prices concurrently
+        (defaults to 4)
+
+    Raises
+    ------
+    ValueError
+        if `years` is not strictly positive, or
+        if `workers` is not strictly positive
+    """
+
+    def __init__(
+        self,
+        single: ISingleSource,
+        *,
+        years: int = 1,
+        workers: int = 4,
+    ):
+        self._single = single
+        self._years = years
+        self._workers = workers
+        self._raise_if_years_or_workers_is_negative_or_zero()
+
+    def _raise_if_years_or_workers_is_negative_or_zero(self):
+        if self._years <= 0 or self._workers <= 0:
+            msg = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"years and workers must be strictly positive"
+            )
+            raise ValueError(msg)
+
+    @property
+    def single(self) -> ISingleSource:
+        """Source of prices from which to fetch the prices of each chunk.
+        This is exposed for testing purposes only."""
+        return self._single
+
+    @property
+    def years(self) -> int:
+        """Number of calendar years spanned by each chunk."""
+        return self._years
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        """Get prices of `ticker` for business days inside `range_`.
+
+        Parameters
+        ----------
+        ticker
+            ticker of financial instrument to extract prices for
+        range_
+            range delimiting the business days for which to extract prices
+            (both side of the range are inclusive)
+
+        Raises
+        ------
+        SourceError
+            if there's an unexpected error when fetching prices from the
+            source (i.e., for any chunk), or
+            if the fetched prices are in an unexpected format (e.g., non-finite
+            prices)
+
+        Returns
+        -------
+        DatedPriceSeries
+            fetched prices
+        """
+        chunks = range_.split(years=self._years)
+        if len(chunks) == 1:
+            return self._single.get(ticker, range_)
+        revisions = self._revisions(ticker)
+        fetched = self._fetch(ticker, chunks)
+        if self._revisions(ticker) != revisions:  # others may be stale!
+            fetched = self._fetch(ticker, chunks)
+        return self._concatenate(chunks, fetched)
+
+    def _revisions(self, ticker: str) -> int:
+        if isinstance(self._single, CachedSource):
+            return self._single.revisions(ticker)
+        return 0
+
+    def _fetch(
+        self,
+        ticker: str,
+        chunks: Sequence[DateRange],
+    ) -> List[DatedPriceSeries]:
+        workers = min(self._workers, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    copy_context().run, self._single.get, ticker, chunk
+                )  # recorded in the context of the caller!
+                for chunk in chunks
+            ]  # every chunk completes, even when another one fails!
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def _concatenate(
+        chunks: Sequence[DateRange],
+        fetched: Sequence[DatedPriceSeries],
+    ) -> DatedPriceSeries:
+        columns = [
+            dated.restrict(chunk).to_arrays()  # disjoint, thus no duplicates!
+            for chunk, dated in zip(chunks, fetched)
+        ]
+        return DatedPriceSeries.from_arrays(
+            np.concatenate([dates for dates, _ in columns]),
+            np.concatenate([prices for _, prices in columns]),
+        )
@@ -0,0 +1,203 @@
+import asyncio
+from concurrent.futures import Future
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from ..date.range import DateRange
+from ..dated.price.series import DatedPriceSeries
+from .single import IAsyncSingleSource, ISingleSource
+
+
+class CoalescingSource(ISingleSource):
+    """Source of prices for a single financial instrument coalescing the
+    concurrent fetches of another :py:class:`ISingleSource`.
+
+    While prices of a ticker are being fetched for a range of dates (i.e.,
+    in flight), any other caller asking prices of the same ticker for a
+    range of dates inside the range in flight waits for the fetch in
+    flight, instead of fetching its prices again. Hence, bursts of
+    overlapping requests are served by a single fetch per ticker.
+
+    Parameters
+    ----------
+    single: ISingleSource
+        source of prices from which to fetch prices, which must be
+        thread-safe
+    """
+
+    def __init__(self, single: ISingleSource):
+        self._single = single
+        self._flights: Dict[str, List[Tuple[DateRange, Future]]] = {}
+        self._lock = Lock()
+
+    @property
+    def single(self) -> ISingleSource:
+        """Source of prices from which to fetch prices. This is exposed
+        for testing purposes only."""
+        return self._single
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        """Get prices of `ticker` for business days inside `range_`.
+
+        Parameters
+        ----------
+        ticker
+            ticker of financial instrument to extract prices for
+        range_
+            range delimiting the business days for which to extract prices
+            (both side of the range are inclusive)
+
+        Raises
+        ------
+        SourceError
+            if there's an unexpected error when fetching prices from the
+            source, or
+            if the fetched prices are in an unexpected format (e.g., non-finite
+            prices)
+
+        Returns
+        -------
+        DatedPriceSeries
+            fetched prices
+        """
+        with self._lock:
+            flight = self._find(ticker, range_)
+            if flight is None:  # lead the fetch!
+                flight = (range_, Future())
+                self._flights.setdefault(ticker, []).append(flight)
+                leader = True
+            else:
+                leader = False
+        if leader:
+            self._fly(ticker, flight)
+        flown, future = flight
+        return _restrict(future.result(), flown, range_)
+
+    def _find(
+        self,
+        ticker: str,
+        range_: DateRange,
+    ) -> Optional[Tuple[DateRange, Future]]:
+        for flight in self._flights.get(ticker, ()):
+            if flight[0].includes(range_):
+                return flight
+        return None
+
+    def _fly(self, ticker: str, flight: Tuple[DateRange, Future]):
+        range_, future = flight
+        try:
+            future.set_result(self._single.get(ticker, range_))
+        except BaseException as err:
+            future.set_exception(err)
+        finally:
+            self._land(ticker, flight)
+
+    def _land(self, ticker: str, flight: Tuple[DateRange, Future]):
+        with self._lock:
+            flights = self._flights[ticker]
+            flights.remove(flight)
+            if len(flights) == 0:
+                del self._flights[ticker]
+
+
+class AsyncCoalescingSource(IAsyncSingleSource):
+    """Asynchronous source of prices for a single financial instrument
+    coalescing the concurrent fetches of another
+    :py:class:`IAsyncSingleSource`.
+
+    While prices of a ticker are being fetched for a range of dates (i.e.,
+    in flight) in an event loop, any other coroutine of the same event
+    loop asking prices of the same ticker for a range of dates inside the
+    range in flight awaits the fetch in flight, instead of fetching its
+    prices again. Cancelling a coroutine awaiting a fetch in flight never
+    cancels the fetch for the other coroutines.
+
+    The source may be shared by multiple event loops (e.g., one per
+    thread), but fetches are only coalesced within an event loop.
+
+    Parameters
+    ----------
+    single: IAsyncSingleSource
+        asynchronous source of prices from which to fetch prices
+    """
+
+    def __init__(self, single: IAsyncSingleSource):
+        self._single = single
+        self._flights: Dict[str, List[Tuple[DateRange, asyncio.Task]]] = {}
+        self._lock = Lock()
+
+    @property
+    def single(self) -> IAsyncSingleSource:
+        """Asynchronous source of prices from which to fetch prices. This
+        is exposed for testing purposes only."""
+        return self._single
+
+    async def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        """Get prices of `ticker` for business days inside `range_`.
+
+        Parameters
+        ----------
+        ticker
+            ticker of financial instrument to extract prices for
+        range_
+            range delimiting the business days for which to extract prices
+            (both side of the range are inclusive)
+
+        Raises
+        ------
+        SourceError
+            if there's an unexpected error when fetching prices from the
+            source, or
+            if the fetched prices are in an unexpected format (e.g., non-finite
+            prices)
+
+        Returns
+        -------
+        DatedPriceSeries
+            fetched prices
+        """
+        with self._lock:
+            flight = self._find(ticker, range_)
+            if flight is None:  # lead the fetch!
+                flight = self._fly(ticker, range_)
+        flown, task = flight
+        return _restrict(await asyncio.shield(task), flown, range_)
+
+    def _find(
+        self,
+        ticker: str,
+        range_: DateRange,
+    ) -> Optional[Tuple[DateRange, asyncio.Task]]:
+        loop = asyncio.get_running_loop()
+        for flight in self._flights.get(ticker, ()):
+            if flight[1].get_loop() is loop and flight[0].includes(range_):
+                return flight
+        return None
+
+    def _fly(
+        self,
+        ticker: str,
+        range_: DateRange,
+    ) -> Tuple[DateRange, asyncio.Task]:
+        task = asyncio.ensure_future(self._single.get(ticker, range_))
+        flight = (range_, task)
+        self._flights.setdefault(ticker, []).append(flight)
+        task.add_done_callback(lambda _: self._land(ticker, flight))
+        return flight
+
+    def _land(self, ticker: str, flight: Tuple[DateRange, asyncio.Task]):
+        with self._lock:
+            flights = self._flights[ticker]
+            flights.remove(flight)
+            if len(flights) == 0:
+                del self._flights[ticker]
+
+
+def _restrict(
+    dated: DatedPriceSeries,
+    flown: DateRange,
+    range_: DateRange,
+) -> DatedPriceSeries:
+    if flown == range_:
+        return dated
+    return dated.restrict(range_)
@@ -1,9 +1,14 @@
-from typing import Iterable, Tuple
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from typing import Dict, Iterable, Optional, Tuple
 
+from .. import report
 from ..date.range import DateRange
+from ..dated.price.series import DatedPriceSeries
 from ..dated.prices.builder import DatedPricesSeriesBuilder
 from ..dated.prices.series import DatedPricesSeries
-from .single import ISingleSource
+from .single import IAsyncSingleSource, ISingleSource
 
 
 class IMultipleSource:
@@ -81,5 +86,247 @@ class MultipleSource(IMultipleSource):
     ) -> DatedPricesSeries:
         builder = DatedPricesSeriesBuilder()
         for ticker in tickers:
-            builder.add(self._single.get(ticker, range_))
+            builder.add(_get(self._single, ticker, range_), ticker=ticker)
         return builder.get()
+
+
+class ConcurrentMultipleSource(IMultipleSource):
+    """Source of prices for multiple financial instruments fetching
+    prices for each instrument concurrently from a :py:class:`ISingleSource`
+    and combining them.
+
+    The prices of each instrument are fetched in a pool of threads, and are
+    combined as soon as they are fetched. The order of the instruments in
+    the combined prices is the order of the tickers requested.
+
+    Parameters
+    ----------
+    single: ISingleSource
+        source of prices for single financial instrument from which to
+        fetch individual instrument prices, which is shared by all
+        threads (e.g., along with its HTTP session), thus it must be
+        thread-safe
+    workers: int
+        maximum number of instruments for which to fetch prices
+        concurrently
+
+    Raises
+    ------
+    ValueError
+        if `workers` is not strictly positive
+    """
+
+    def __init__(self, single: ISingleSource, *, workers: int = 8):
+        self._single = single
+        self._workers = workers
+        self._raise_if_workers_is_negative_or_zero()
+
+    def _raise_if_workers_is_negative_or_zero(self):
+        if self._workers <= 0:
+            msg = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"workers must be strictly positive"
+            )
+            raise ValueError(msg)
+
+    @property
+    def single(self) -> ISingleSource:
+        """Source of prices for single financial instrument from which
+        to fetch individual instrument prices. This is exposed for testing
+        purposes only."""
+        return self._single
+
+    @property
+    def workers(self) -> int:
+        """Maximum number of instruments for which to fetch prices
+        concurrently."""
+        return self._workers
+
+    def _get(
+        self,
+        tickers: Tuple[str, ...],
+        range_: DateRange,
+    ) -> DatedPricesSeries:
+        workers = min(self._workers, len(tickers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    copy_context().run, _get, self._single, ticker, range_
+                ): i  # recorded in the context of the caller!
+                for i, ticker in enumerate(tickers)
+            }
+            try:
+                return self._combine(tickers, futures)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    @staticmethod
+    def _combine(
+        tickers: Tuple[str, ...],
+        futures: Dict[Future, int],
+    ) -> DatedPricesSeries:
+        builder = DatedPricesSeriesBuilder()
+        completed: Dict[int, DatedPriceSeries] = {}
+        for future in as_completed(futures):
+            completed[futures[future]] = future.result()
+            while len(completed) > 0 and min(completed) == builder.count:
+                i = builder.count
+                builder.add(completed.pop(i), ticker=tickers[i])  # in order!
+        return builder.get()
+
+
+class IAsyncMultipleSource:
+    """Interface for asynchronous sources of prices for multiple financial
+    instruments."""
+
+    async def get(
+        self,
+        tickers: Iterable[str],
+        range_: DateRange,
+    ) -> DatedPricesSeries:
+        """Get prices of all tickers in `tickers` for business days inside
+        `range_`. The prices returned are only for days where every financial
+        instrument in `tickers` has a price available.
+
+        Parameters
+        ----------
+        tickers
+            tickers of financial instruments to extract prices for
+        range_
+            range delimiting the business days for which to extract prices
+            (both side of the range are inclusive)
+
+        Raises
+        ------
+        SourceError
+            if there's an unexpected error when fetching prices from the
+            source, or
+            if the fetched prices are in an unexpected format (e.g., non-finite
+            prices)
+
+        Returns
+        -------
+        DatedPricesSeries
+            fetched prices
+        """
+        tickers_ = tuple(tickers)  # freeze!
+        if len(tickers_) == 0:
+            return DatedPricesSeries([])
+        return await self._get(tickers_, range_)
+
+    async def _get(
+        self,
+        tickers: Tuple[str, ...],
+        range_: DateRange,
+    ) -> DatedPricesSeries:
+        raise NotImplementedError
+
+
+class AsyncMultipleSource(IAsyncMultipleSource):
+    """Asynchronous source of prices for multiple financial instruments
+    fetching prices for each instrument concurrently from a
+    :py:class:`IAsyncSingleSource` and combining them.
+
+    The order of the instruments in the combined prices is the order of
+    the tickers requested.
+
+    Parameters
+    ----------
+    single: IAsyncSingleSource
+        asynchronous source of prices for single financial instrument from
+        which to fetch individual instrument prices
+    concurrency: Optional[int]
+        maximum number of instruments for which to fetch prices
+        concurrently (defaults to None, i.e., all instruments requested)
+
+    Raises
+    ------
+    ValueError
+        if `concurrency` is not strictly positive
+    """
+
+    def __init__(
+        self,
+        single: IAsyncSingleSource,
+        *,
+        concurrency: Optional[int] = None,
+    ):
+        self._single = single
+        self._concurrency = concurrency
+        self._raise_if_concurrency_is_negative_or_zero()
+
+    def _raise_if_concurrency_is_negative_or_zero(self):
+        if self._concurrency is not None and self._concurrency <= 0:
+            msg = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"concurrency must be strictly positive"
+            )
+            raise ValueError(msg)
+
+    @property
+    def single(self) -> IAsyncSingleSource:
+        """Asynchronous source of prices for single financial instrument
+        from which to fetch individual instrument prices. This is exposed
+        for testing purposes only."""
+        return self._single
+
+    @property
+    def concurrency(self) -> Optional[int]:
+        """Maximum number of instruments for which to fetch prices
+        concurrently, or None when all instruments requested are."""
+        return self._concurrency
+
+    async def _get(
+        self,
+        tickers: Tuple[str, ...],
+        range_: DateRange,
+    ) -> DatedPricesSeries:
+        bound = len(tickers) if self._concurrency is None else self._concurrency
+        semaphore = asyncio.Semaphore(max(bound, 1))  # of the running loop!
+        tasks = [
+            asyncio.ensure_future(self._get_bounded(semaphore, ticker, range_))
+            for ticker in tickers
+        ]
+        try:
+            fetched = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        builder = DatedPricesSeriesBuilder()
+        for ticker, series in zip(tickers, fetched):
+            builder.add(series, ticker=ticker)
+        return builder.get()
+
+    async def _get_bounded(
+        self,
+        semaphore: asyncio.Semaphore,
+        ticker: str,
+        range_: DateRange,
+    ) -> DatedPriceSeries:
+        async with semaphore:
+            return await _get_async(self._single, ticker, range_)
+
+
+def _get(
+    single: ISingleSource,
+    ticker: str,
+    range_: DateRange,
+) -> DatedPriceSeries:
+    with report.timed(ticker, report.GET):
+        dated = single.get(ticker, range_)
+    report.count(ticker, rows=len(dated))
+    return dated
+
+
+async def _get_async(
+    single: IAsyncSingleSource,
+    ticker: str,
+    range_: DateRange,
+) -> DatedPriceSeries:
+    with report.timed(ticker, report.GET):
+        dated = await single.get(ticker, range_)
+    report.count(ticker, rows=len(dated))
+    return dated
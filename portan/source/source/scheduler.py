@@ -0,0 +1,319 @@
+import random
+import time
+from contextlib import contextmanager
+from threading import Condition, Lock
+from typing import Callable, Iterator, Optional
+
+from ..date.range import DateRange
+from ..dated.price.series import DatedPriceSeries
+from ..exception import TransientSourceError
+from .single import ISingleSource
+
+
+class TokenBucket:
+    """Token bucket limiting the rate at which events occur.
+
+    The bucket holds up to `burst` tokens, and is refilled with `rate`
+    tokens per second. Each event consumes a token, and waits for the
+    bucket to be refilled when it is empty. The bucket is thread-safe,
+    and events waiting are served in order.
+
+    Parameters
+    ----------
+    rate: float
+        number of tokens added to the bucket per second
+    burst: int
+        maximum number of tokens in the bucket (defaults to 1)
+    clock: Callable[[], float]
+        monotonic clock in seconds (defaults to `time.monotonic`)
+    sleep: Callable[[float], None]
+        function waiting for a number of seconds (defaults to `time.sleep`)
+
+    Raises
+    ------
+    ValueError
+        if `rate` is negative or zero, or
+        if `burst` is negative or zero
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._rate = rate
+        self._burst = burst
+        self._raise_if_rate_or_burst_is_negative_or_zero()
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._refilled = clock()
+        self._lock = Lock()
+
+    def _raise_if_rate_or_burst_is_negative_or_zero(self):
+        if not (self._rate > 0.0 and self._burst > 0):
+            msg = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"rate and burst must be strictly positive"
+            )
+            raise ValueError(msg)
+
+    @property
+    def rate(self) -> float:
+        """Number of tokens added to the bucket per second."""
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        """Maximum number of tokens in the bucket."""
+        return self._burst
+
+    def acquire(self):
+        """Consume a token, waiting for the bucket to be refilled when
+        it is empty."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1.0  # reserve a token, possibly in advance!
+            wait = -self._tokens / self._rate
+        if wait > 0.0:
+            self._sleep(wait)
+
+    def _refill(self):
+        now = self._clock()
+        elapsed = now - self._refilled
+        self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+        self._refilled = now
+
+
+class AdaptiveLimiter:
+    """Limiter of the number of concurrent events adapting the limit to
+    the outcome of the events (i.e., additive increase, multiplicative
+    decrease).
+
+    The limit grows by one after a limit's worth of successful events,
+    while it is halved after each throttled event. An event succeeding
+    slower than `latency` is deemed throttled. The limiter is thread-safe.
+
+    Parameters
+    ----------
+    initial: int
+        initial limit (defaults to 4)
+    minimum: int
+        minimum limit (defaults to 1)
+    maximum: int
+        maximum limit (defaults to 32)
+    latency: Optional[float]
+        seconds above which a successful event is deemed throttled
+        (defaults to None, i.e., latency is ignored)
+
+    Raises
+    ------
+    ValueError
+        if `minimum` is negative or zero,
+        if `initial` is not inside [`minimum`, `maximum`], or
+        if `latency` is negative or zero
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        *,
+        minimum: int = 1,
+        maximum: int = 32,
+        latency: Optional[float] = None,
+    ):
+        self._minimum = minimum
+        self._maximum = maximum
+        self._limit = float(initial)
+        self._latency = latency
+        self._raise_if_limits_or_latency_is_invalid()
+        self._active = 0
+        self._condition = Condition()
+
+    def _raise_if_limits_or_latency_is_invalid(self):
+        if not 0 < self._minimum <= self._limit <= self._maximum or (
+            self._latency is not None and self._latency <= 0.0
+        ):
+            msg = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"minimum and latency must be strictly positive, and "
+                f"initial must be inside [minimum, maximum]"
+            )
+            raise ValueError(msg)
+
+    @property
+    def limit(self) -> int:
+        """Current maximum number of concurrent events."""
+        return int(self._limit)
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Seconds above which a successful event is deemed throttled,
+        or None when latency is ignored."""
+        return self._latency
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Context in which an event occurs, waiting for the number of
+        concurrent events to be below the limit before entering."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    def succeed(self, latency: float):
+        """Record an event succeeding after `latency` seconds.
+
+        Parameters
+        ----------
+        latency
+            seconds the event took to succeed
+        """
+        if self._latency is not None and latency > self._latency:
+            self.throttle()
+            return
+        with self._condition:
+            self._limit = min(self._maximum, self._limit + 1.0 / self.limit)
+            self._condition.notify_all()
+
+    def throttle(self):
+        """Record an event being throttled."""
+        with self._condition:
+            self._limit = max(self._minimum, self._limit / 2.0)
+
+
+class ScheduledSource(ISingleSource):
+    """Source of prices for a single financial instrument scheduling the
+    fetches of another :py:class:`ISingleSource` to sustain the highest
+    throughput under the limits of the provider.
+
+    Each fetch waits for a token of `bucket` and a slot of `limiter`.
+    A fetch failing with a :py:class:`TransientSourceError` (e.g.,
+    throttling) throttles `limiter`, and is retried up to `retries` times
+    after waiting a random number of seconds in [0, `backoff` * 2 **
+    attempt] (i.e., jittered exponential backoff).
+
+    Parameters
+    ----------
+    single: ISingleSource
+        source of prices from which to fetch prices, which must be
+        thread-safe
+    bucket: Optional[TokenBucket]
+        bucket limiting the rate of fetches (defaults to None, i.e., the
+        rate is not limited)
+    limiter: Optional[AdaptiveLimiter]
+        limiter of concurrent fetches (defaults to None, i.e., a limiter
+        with default arguments)
+    retries: int
+        maximum number of retries of a fetch (defaults to 3)
+    backoff: float
+        seconds to wait before the first retry at most (defaults to 0.5)
+    clock: Callable[[], float]
+        monotonic clock in seconds (defaults to `time.monotonic`)
+    sleep: Callable[[float], None]
+        function waiting for a number of seconds (defaults to `time.sleep`)
+    uniform: Callable[[float, float], float]
+        function drawing a random number inside [a, b] (defaults to
+        `random.uniform`)
+
+    Raises
+    ------
+    ValueError
+        if `retries` is negative, or
+        if `backoff` is negative
+    """
+
+    def __init__(
+        self,
+        single: ISingleSource,
+        *,
+        bucket: Optional[TokenBucket] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+        retries: int = 3,
+        backoff: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        uniform: Callable[[float, float], float] = random.uniform,
+    ):
+        self._single = single
+        self._bucket = bucket
+        self._limiter = AdaptiveLimiter() if limiter is None else limiter
+        self._retries = retries
+        self._backoff = backoff
+        self._raise_if_retries_or_backoff_is_negative()
+        self._clock = clock
+        self._sleep = sleep
+        self._uniform = uniform
+
+    def _raise_if_retries_or_backoff_is_negative(self):
+        if self._retries < 0 or self._backoff < 0.0:
+            msg = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"retries and backoff must be non-negative"
+            )
+            raise ValueError(msg)
+
+    @property
+    def single(self) -> ISingleSource:
+        """Source of prices from which to fetch prices. This is exposed
+        for testing purposes only."""
+        return self._single
+
+    @property
+    def limiter(self) -> AdaptiveLimiter:
+        """Limiter of concurrent fetches."""
+        return self._limiter
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        """Get prices of `ticker` for business days inside `range_`.
+
+        Parameters
+        ----------
+        ticker
+            ticker of financial instrument to extract prices for
+        range_
+            range delimiting the business days for which to extract prices
+            (both side of the range are inclusive)
+
+        Raises
+        ------
+        SourceError
+            if there's an unexpected error when fetching prices from the
+            source (i.e., a :py:class:`TransientSourceError` once all
+            retries are exhausted), or
+            if the fetched prices are in an unexpected format (e.g., non-finite
+            prices)
+
+        Returns
+        -------
+        DatedPriceSeries
+            fetched prices
+        """
+        for attempt in range(self._retries + 1):
+            try:
+                return self._fetch(ticker, range_)
+            except TransientSourceError:
+                if attempt == self._retries:
+                    raise
+            self._sleep(self._uniform(0.0, self._backoff * 2**attempt))
+
+    def _fetch(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        with self._limiter.slot():
+            if self._bucket is not None:
+                self._bucket.acquire()
+            begin = self._clock()
+            try:
+                dated = self._single.get(ticker, range_)
+            except TransientSourceError:
+                self._limiter.throttle()
+                raise
+            self._limiter.succeed(self._clock() - begin)
+            return dated
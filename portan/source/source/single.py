@@ -1,3 +1,6 @@
+import asyncio
+from contextvars import copy_context
+
 from ..date.range import DateRange
 from ..dated.price.series import DatedPriceSeries
 
@@ -30,3 +33,65 @@ class ISingleSource:
             fetched prices
         """
         raise NotImplementedError
+
+
+class IAsyncSingleSource:
+    """Interface for asynchronous sources of prices for a single financial
+    instrument."""
+
+    async def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        """Get prices of `ticker` for business days inside `range_`.
+
+        Parameters
+        ----------
+        ticker
+            ticker of financial instrument to extract prices for
+        range_
+            range delimiting the business days for which to extract prices
+            (both side of the range are inclusive)
+
+        Raises
+        ------
+        SourceError
+            if there's an unexpected error when fetching prices from the
+            source, or
+            if the fetched prices are in an unexpected format (e.g., non-finite
+            prices)
+
+        Returns
+        -------
+        DatedPriceSeries
+            fetched prices
+        """
+        raise NotImplementedError
+
+
+class AsyncSingleSource(IAsyncSingleSource):
+    """Asynchronous source of prices for a single financial instrument
+    fetching from a blocking :py:class:`ISingleSource`.
+
+    The prices are fetched in the default executor of the running event
+    loop, thus the event loop is never blocked while fetching.
+
+    Parameters
+    ----------
+    single: ISingleSource
+        blocking source of prices for a single financial instrument
+        from which to fetch prices, which must be thread-safe
+    """
+
+    def __init__(self, single: ISingleSource):
+        self._single = single
+
+    @property
+    def single(self) -> ISingleSource:
+        """Blocking source of prices for a single financial instrument
+        from which to fetch prices. This is exposed for testing purposes
+        only."""
+        return self._single
+
+    async def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, copy_context().run, self._single.get, ticker, range_
+        )  # recorded in the context of the caller!
@@ -0,0 +1,246 @@
+import json
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Any, Dict, Mapping, Optional, Union
+from urllib.parse import parse_qs, unquote, urlparse
+
+import numpy as np
+
+from .chart import CHART_PATH
+from .date import Date
+from .date.range import DateRange
+from .dated.price.series import DatedPriceSeries
+from .exception import SourceError
+from .source.single import ISingleSource
+from .synthetic import Synthetic
+
+_NOT_FOUND = {
+    "chart": {
+        "result": None,
+        "error": {
+            "code": "Not Found",
+            "description": "No data found, symbol may be delisted",
+        },
+    }
+}
+
+
+class StandIn:
+    """Local stand-in of the chart endpoint of Yahoo Finance (e.g., for
+    offline benchmarks of :py:class:`YahooChart`).
+
+    The stand-in is an HTTP server (i.e., HTTP/1.1, thus connections
+    are kept alive) answering each request for the prices of a ticker
+    with the response recorded for the ticker, if any, or else with
+    the prices of the ticker in `single` for the period requested,
+    encoded as the chart endpoint does.
+
+    Each response is delayed by `latency` seconds, while requests are
+    throttled (i.e., 429) with probability `throttle`, and fail (i.e.,
+    500) with probability `errors`, which are deterministic given `seed`
+    and the order of the requests.
+
+    Parameters
+    ----------
+    single: Optional[ISingleSource]
+        source of the prices of the tickers without a recorded response
+        (defaults to None, i.e., a :py:class:`Synthetic` source with
+        default arguments)
+    recorded: Optional[Mapping[str, Union[Mapping[str, Any], bytes]]]
+        response (i.e., JSON, or raw bytes) recorded for some tickers
+        (defaults to None, i.e., none)
+    latency: float
+        seconds by which each response is delayed (defaults to 0.0)
+    throttle: float
+        probability of a request being throttled, inside [0, 1]
+        (defaults to 0.0)
+    errors: float
+        probability of a request failing, inside [0, 1] (defaults to 0.0)
+    seed: int
+        seed from which throttled and failing requests are drawn
+        (defaults to 0)
+    port: int
+        port on which to listen (defaults to 0, i.e., any free port)
+
+    Raises
+    ------
+    ValueError
+        if `latency` is negative, or
+        if `throttle` or `errors` is not inside [0, 1]
+    """
+
+    def __init__(
+        self,
+        single: Optional[ISingleSource] = None,
+        *,
+        recorded: Optional[
+            Mapping[str, Union[Mapping[str, Any], bytes]]
+        ] = None,
+        latency: float = 0.0,
+        throttle: float = 0.0,
+        errors: float = 0.0,
+        seed: int = 0,
+        port: int = 0,
+    ):
+        self._single = Synthetic() if single is None else single
+        self._recorded = dict({} if recorded is None else recorded)
+        self._latency = latency
+        self._throttle = throttle
+        self._errors = errors
+        self._raise_if_parameters_are_invalid()
+        self._random = random.Random(seed)
+        self._port = port
+        self._requests = 0
+        self._lock = Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[Thread] = None
+
+    def _raise_if_parameters_are_invalid(self):
+        if not (
+            self._latency >= 0.0
+            and 0.0 <= self._throttle <= 1.0
+            and 0.0 <= self._errors <= 1.0
+        ):
+            msg = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"latency must be non-negative, and throttle and errors "
+                f"must be inside [0, 1]"
+            )
+            raise ValueError(msg)
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of this stand-in (e.g., for :py:class:`YahooChart`).
+
+        Raises
+        ------
+        RuntimeError
+            if this stand-in is not started
+        """
+        self._raise_if_not_started()
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    @property
+    def requests(self) -> int:
+        """Number of requests answered by this stand-in."""
+        return self._requests
+
+    def start(self):
+        """Start answering requests in a background thread.
+
+        Raises
+        ------
+        RuntimeError
+            if this stand-in is already started
+        """
+        if self._server is not None:
+            msg = "cannot start; already started"
+            raise RuntimeError(msg)
+        self._server = ThreadingHTTPServer(
+            ("127.0.0.1", self._port),
+            self._create_handler(),
+        )
+        self._server.daemon_threads = True
+        self._thread = Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop answering requests, if started."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server, self._thread = None, None
+
+    def __enter__(self) -> "StandIn":
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _raise_if_not_started(self):
+        if self._server is None:
+            msg = "cannot get base URL; must start before"
+            raise RuntimeError(msg)
+
+    def _create_handler(self) -> type:
+        stand_in = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep connections alive!
+
+            def do_GET(self):
+                status, payload = stand_in._answer(self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass  # silent!
+
+        return _Handler
+
+    def _answer(self, path: str):
+        with self._lock:
+            self._requests += 1
+            draw = self._random.random()
+        time.sleep(self._latency)
+        if draw < self._throttle:
+            return 429, b""
+        if draw < self._throttle + self._errors:
+            return 500, b""
+        url = urlparse(path)
+        prefix, _, ticker = url.path.rpartition("/")
+        if f"{prefix}/" != CHART_PATH:
+            return 404, _encode(_NOT_FOUND)
+        ticker = unquote(ticker)
+        if ticker in self._recorded:
+            return 200, _encode(self._recorded[ticker])
+        try:
+            range_ = _to_range(parse_qs(url.query))
+        except (KeyError, IndexError, ValueError):
+            return 400, b""
+        try:
+            dated = self._single.get(ticker, range_)
+        except SourceError:
+            return 500, b""
+        return 200, _encode(_to_chart(ticker, dated))
+
+
+def _encode(body: Union[Mapping[str, Any], bytes]) -> bytes:
+    return body if isinstance(body, bytes) else json.dumps(body).encode()
+
+
+def _to_range(query: Mapping[str, Any]) -> DateRange:
+    begin, end = (
+        str(np.datetime64(int(query[name][0]), "s").astype("datetime64[D]"))
+        for name in ("period1", "period2")
+    )
+    return DateRange(Date(begin), Date(end))
+
+
+def _to_chart(ticker: str, dated: DatedPriceSeries) -> Dict[str, Any]:
+    dates, prices = dated.to_arrays()
+    return {
+        "chart": {
+            "result": [
+                {
+                    "meta": {"symbol": ticker, "gmtoffset": 0},
+                    "timestamp": dates.astype("datetime64[s]")
+                    .astype(np.int64)
+                    .tolist(),
+                    "indicators": {
+                        "quote": [{"close": prices.tolist()}],
+                        "adjclose": [{"adjclose": prices.tolist()}],
+                    },
+                }
+            ],
+            "error": None,
+        }
+    }
@@ -0,0 +1,192 @@
+import zlib
+from threading import Lock
+
+import numpy as np
+
+from . import report
+from .date import Date
+from .date.range import DateRange
+from .dated.price.series import DatedPriceSeries
+from .exception import SourceError
+from .source.single import ISingleSource
+
+_PERIODS = 252  # business days per year!
+_MARKET, _SHOCKS, _MISSING, _GAPS = range(4)  # independent streams!
+
+
+class Synthetic(ISingleSource):
+    """Source of prices for a single financial instrument generating
+    prices following a geometric Brownian motion (e.g., for offline
+    benchmarks).
+
+    Prices are generated for each business day (i.e., Monday to Friday)
+    from `origin`, starting at `initial`, such that the prices of a
+    ticker on a date never depend on the range of dates requested. The
+    prices are deterministic given `seed` and the ticker, and the random
+    shock of each instrument on a day is correlated with the shocks of
+    all other instruments through a common (i.e., market) shock, such
+    that the correlation between the returns of any two instruments is
+    `correlation`.
+
+    Some business days have no price, either independently (i.e.,
+    `missing`), or within gaps of `gap` consecutive business days (e.g.,
+    trading halts), each starting on a business day with probability
+    `gaps`.
+
+    Parameters
+    ----------
+    seed: int
+        seed from which all prices are generated (defaults to 0)
+    drift: float
+        annualized drift of the prices (defaults to 0.05)
+    volatility: float
+        annualized volatility of the prices (defaults to 0.2)
+    correlation: float
+        correlation between the returns of any two instruments, inside
+        [0, 1] (defaults to 0.3)
+    missing: float
+        probability of a business day without price, inside [0, 1)
+        (defaults to 0.0)
+    gaps: float
+        probability of a gap starting on a business day, inside [0, 1)
+        (defaults to 0.0)
+    gap: int
+        number of consecutive business days without price in a gap
+        (defaults to 5)
+    initial: float
+        price on `origin`, or on the first business day following it
+        (defaults to 100.0)
+    origin: Date
+        first date for which prices are generated (defaults to
+        2000-01-01)
+
+    Raises
+    ------
+    ValueError
+        if `volatility` is negative,
+        if `correlation` is not inside [0, 1],
+        if `missing` or `gaps` is not inside [0, 1),
+        if `gap` is negative or zero, or
+        if `initial` is negative or zero
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        *,
+        drift: float = 0.05,
+        volatility: float = 0.2,
+        correlation: float = 0.3,
+        missing: float = 0.0,
+        gaps: float = 0.0,
+        gap: int = 5,
+        initial: float = 100.0,
+        origin: Date = Date("2000-01-01"),
+    ):
+        self._seed = seed
+        self._drift = drift
+        self._volatility = volatility
+        self._correlation = correlation
+        self._missing = missing
+        self._gaps = gaps
+        self._gap = gap
+        self._initial = initial
+        self._raise_if_parameters_are_invalid()
+        self._origin = np.datetime64(str(origin), "D")
+        self._market = np.empty(0)
+        self._lock = Lock()
+
+    def _raise_if_parameters_are_invalid(self):
+        if not (
+            self._volatility >= 0.0
+            and 0.0 <= self._correlation <= 1.0
+            and 0.0 <= self._missing < 1.0
+            and 0.0 <= self._gaps < 1.0
+            and self._gap > 0
+            and self._initial > 0.0
+        ):
+            msg = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"volatility must be non-negative, correlation must be "
+                f"inside [0, 1], missing and gaps must be inside [0, 1), "
+                f"and gap and initial must be strictly positive"
+            )
+            raise ValueError(msg)
+
+    @property
+    def seed(self) -> int:
+        """Seed from which all prices are generated."""
+        return self._seed
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        """Get prices of `ticker` for business days inside `range_`.
+
+        Parameters
+        ----------
+        ticker
+            ticker of financial instrument to generate prices for
+        range_
+            range delimiting the business days for which to generate prices
+            (both side of the range are inclusive)
+
+        Raises
+        ------
+        SourceError
+            if the prices generated overflow, or are very close to zero
+
+        Returns
+        -------
+        DatedPriceSeries
+            generated prices
+        """
+        end = np.datetime64(str(range_.end), "D")
+        if end < self._origin:
+            return DatedPriceSeries([])
+        with report.timed(ticker, report.PARSE):  # i.e., generate!
+            days = np.arange(self._origin, end + 1, dtype="datetime64[D]")
+            days = days[np.is_busday(days)]
+            prices = self._generate(ticker, len(days))
+            begin = np.datetime64(str(range_.begin), "D")
+            kept = (days >= begin) & self._available(ticker, len(days))
+            try:
+                return DatedPriceSeries.from_arrays(days[kept], prices[kept])
+            except ValueError as err:
+                msg = (
+                    f"cannot source prices from synthetic source for "
+                    f"{ticker}; prices generated overflow, or are very "
+                    f"close to zero (i.e., drift or volatility is extreme)"
+                )
+                raise SourceError(msg) from err
+
+    def _generate(self, ticker: str, count: int) -> np.ndarray:
+        step = 1.0 / _PERIODS
+        shocks = np.sqrt(self._correlation) * self._get_market(count)
+        shocks += np.sqrt(1.0 - self._correlation) * self._rng(
+            _SHOCKS, ticker
+        ).standard_normal(count)
+        growth = (self._drift - self._volatility**2 / 2.0) * step
+        growth += self._volatility * np.sqrt(step) * shocks
+        growth[0] = 0.0  # initial price on the first business day!
+        return self._initial * np.exp(np.cumsum(growth))
+
+    def _get_market(self, count: int) -> np.ndarray:
+        with self._lock:  # shared by all instruments, thus generated once!
+            if len(self._market) < count:
+                rng = np.random.default_rng((self._seed, _MARKET))
+                self._market = rng.standard_normal(count)
+            return self._market[:count]
+
+    def _available(self, ticker: str, count: int) -> np.ndarray:
+        available = np.ones(count, dtype=bool)
+        if self._missing > 0.0:
+            uniform = self._rng(_MISSING, ticker).random(count)
+            available &= uniform >= self._missing
+        if self._gaps > 0.0:
+            starts = self._rng(_GAPS, ticker).random(count) < self._gaps
+            inside = np.convolve(starts, np.ones(self._gap))[:count]
+            available &= inside == 0.0
+        return available
+
+    def _rng(self, stream: int, ticker: str) -> np.random.Generator:
+        key = zlib.crc32(ticker.encode())  # stable across processes!
+        return np.random.default_rng((self._seed, stream, key))
@@ -1,33 +1,63 @@
-from contextlib import redirect_stdout
+import socket
+import sys
+from contextlib import contextmanager
 from io import StringIO
-from typing import Optional
+from threading import Lock, local
+from typing import Any, Iterator, Optional, TextIO
 
-from pandas import DataFrame, Series
+import numpy as np
+from pandas import DataFrame, Index, Series
+from requests import exceptions as requests_exceptions
 from yfinance import Ticker
 
+from . import report
 from .date import Date
 from .date.range import DateRange
 from .dated.price.series import DatedPriceSeries
-from .exception import SourceError
+from .exception import SourceError, TransientSourceError
 from .source.single import ISingleSource
 
 _SPLIT_NAME = "Stock Splits"
 _DIVIDEND_NAME = "Dividends"
 _CLOSE_NAME = "Close"
+_TRANSIENT_ERRORS = (
+    socket.timeout,
+    TimeoutError,
+    ConnectionError,
+    requests_exceptions.ConnectionError,
+    requests_exceptions.Timeout,
+)
+_THROTTLED_MESSAGES = (  # yfinance raises no dedicated exception!
+    "too many requests",
+    "rate limit",
+    "yahoo! finance is currently down",
+)
 
 
 class Yahoo(ISingleSource):
     """Source of prices for a single instrument fetching from Yahoo Finance.
 
+    This source is thread-safe, thus it can be shared between threads
+    fetching prices concurrently.
+
     Parameters
     ----------
     verbose: bool
         whether to display information to the console
+    session: Optional[Any]
+        HTTP session to use for all requests to Yahoo Finance (defaults to
+        None, i.e., the session is managed by yfinance)
     """
 
-    def __init__(self, *, verbose: bool = False):
+    def __init__(self, *, verbose: bool = False, session: Optional[Any] = None):
         self._verbose = verbose
-        self._ticker: Optional[str] = None
+        self._session = session
+
+    @property
+    def session(self) -> Optional[Any]:
+        """HTTP session to use for all requests to Yahoo Finance. This is
+        exposed for testing purposes only."""
+        return self._session
 
     def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
         """Get prices of `ticker` for business days inside `range_`.
@@ -54,22 +84,24 @@ class Yahoo(ISingleSource):
         DatedPriceSeries
             fetched prices
         """
-        self._ticker = ticker
-        data = self._get(range_)
-        return self._extract_prices_from(data)
-
-    def _get(self, range_: DateRange) -> DataFrame:
-        with redirect_stdout(StringIO()) as f:
-            data = self._get_from_yahoo(range_)
+        with report.timed(ticker, report.NETWORK):
+            data = self._get(ticker, range_)
+        with report.timed(ticker, report.PARSE):
+            return self._extract_prices_from(ticker, data)
+
+    def _get(self, ticker: str, range_: DateRange) -> DataFrame:
+        with _STDOUT.capture() as f:
+            data = self._get_from_yahoo(ticker, range_)
         if self._verbose:
             print(f.getvalue())
         return data
 
-    def _get_from_yahoo(self, range_: DateRange) -> DataFrame:
+    def _get_from_yahoo(self, ticker: str, range_: DateRange) -> DataFrame:
+        end = self._increment(ticker, range_.end)
         try:
-            return Ticker(self._ticker).history(
+            return Ticker(ticker, session=self._session).history(
                 start=str(range_.begin),
-                end=str(self._increment(range_.end)),
+                end=str(end),
                 interval="1d",
                 prepost=False,
                 actions=True,
@@ -78,33 +110,35 @@ class Yahoo(ISingleSource):
                 rounding=False,
             )
         except Exception as err:
-            msg = (
-                f"cannot source prices from Yahoo for {self._ticker}; "
-                f"an unexpected error occurred when fetching prices"
-            )
-            raise SourceError(msg) from err
+            _raise_due_to_unexpected_error(ticker, err)
 
-    def _increment(self, end: Date) -> Date:
+    @staticmethod
+    def _increment(ticker: str, end: Date) -> Date:
         try:
             return end.increment()
         except OverflowError:
             msg = (
-                f"cannot source prices from Yahoo for {self._ticker}; "
+                f"cannot source prices from Yahoo for {ticker}; "
                 f"end date of range_ must be lower than {end}"
             )
             raise SourceError(msg)
 
-    def _extract_prices_from(self, data: DataFrame) -> DatedPriceSeries:
+    def _extract_prices_from(
+        self,
+        ticker: str,
+        data: DataFrame,
+    ) -> DatedPriceSeries:
         if len(data) == 0:
             return DatedPriceSeries([])
-        return self._extract_prices_when_non_empty(data)
+        return self._extract_prices_when_non_empty(ticker, data)
 
     def _extract_prices_when_non_empty(
         self,
+        ticker: str,
         data: DataFrame,
     ) -> DatedPriceSeries:
         filtered = self._remove_extraneous_actions(data)
-        return self._to_dated(filtered)
+        return self._to_dated(ticker, filtered)
 
     def _remove_extraneous_actions(self, data: DataFrame) -> DataFrame:
         return data.loc[~self._is_extraneous_actions(data)]
@@ -114,20 +148,103 @@ class Yahoo(ISingleSource):
         is_action = (data[_SPLIT_NAME] != 0.0) | (data[_DIVIDEND_NAME] != 0.0)
         return is_action & data[_CLOSE_NAME].isna()
 
-    def _to_dated(self, data: DataFrame) -> DatedPriceSeries:
+    @staticmethod
+    def _to_dated(ticker: str, data: DataFrame) -> DatedPriceSeries:
         try:
-            return DatedPriceSeries.from_unsorted_basic(
-                zip(
-                    data.index.strftime("%Y-%m-%d"),
-                    data[_CLOSE_NAME],
-                )
+            return DatedPriceSeries.from_unsorted_arrays(
+                _to_days(data.index),
+                data[_CLOSE_NAME].to_numpy(dtype=np.float64),
             )
-        except ValueError:
+        except ValueError as err:
             msg = (
-                f"cannot source prices from Yahoo for {self._ticker}; "
+                f"cannot source prices from Yahoo for {ticker}; "
                 f"data fetched is in an unexpected format, likely "
                 f"cause is some prices which are non-finite "
                 f"(i.e., NaN, inf or -inf), negative or zero, "
                 f"or duplicated dates"
             )
-            raise SourceError(msg)
+            raise SourceError(msg) from err
+
+
+def _raise_due_to_unexpected_error(ticker: str, err: Exception):
+    msg = (
+        f"cannot source prices from Yahoo for {ticker}; "
+        f"an unexpected error occurred when fetching prices"
+    )
+    if _is_transient(err):
+        raise TransientSourceError(msg) from err
+    raise SourceError(msg) from err
+
+
+def _is_transient(err: Exception) -> bool:
+    if isinstance(err, _TRANSIENT_ERRORS):
+        return True
+    if isinstance(err, requests_exceptions.HTTPError):
+        status = getattr(err.response, "status_code", None)
+        if status is not None:  # throttled or unavailable!
+            return status == 429 or status >= 500
+    # a throttled response is not JSON, hence it fails to be decoded
+    text = f"{err} {getattr(err, 'doc', '')}".lower()
+    return any(message in text for message in _THROTTLED_MESSAGES)
+
+
+def _to_days(index: Index) -> np.ndarray:
+    if getattr(index, "tz", None) is not None:
+        index = index.tz_localize(None)  # keeps the local date!
+    return np.asarray(index, dtype="datetime64[D]")
+
+
+class _StdoutCapture:
+    """Capture of the standard output per thread. Unlike
+    `contextlib.redirect_stdout`, the capture is safe to use from
+    multiple threads concurrently."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._count = 0
+        self._original: Optional[TextIO] = None
+        self._local = local()
+
+    @contextmanager
+    def capture(self) -> Iterator[StringIO]:
+        """Capture the standard output of the current thread.
+
+        Returns
+        -------
+        Iterator[StringIO]
+            captured standard output
+        """
+        self._enter()
+        self._local.buffer = StringIO()
+        try:
+            yield self._local.buffer
+        finally:
+            self._local.buffer = None
+            self._exit()
+
+    def _enter(self):
+        with self._lock:
+            if self._count == 0:
+                self._original, sys.stdout = sys.stdout, self
+            self._count += 1
+
+    def _exit(self):
+        with self._lock:
+            self._count -= 1
+            if self._count == 0:
+                sys.stdout, self._original = self._original, None
+
+    def write(self, value: str) -> int:
+        return self._get_current().write(value)
+
+    def flush(self):
+        self._get_current().flush()
+
+    def _get_current(self) -> TextIO:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:  # uncaptured thread!
+            return self._original or sys.__stdout__
+        return buffer
+
+
+_STDOUT = _StdoutCapture()
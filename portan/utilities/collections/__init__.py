@@ -1,4 +1,10 @@
-from .matrix import Matrix, SquareMatrix, SymmetricMatrix
+from .matrix import BlockMatrix, Matrix, SquareMatrix, SymmetricMatrix
 from .sequence import Sequence
 
-__all__ = ["Sequence", "Matrix", "SquareMatrix", "SymmetricMatrix"]
+__all__ = [
+    "Sequence",
+    "BlockMatrix",
+    "Matrix",
+    "SquareMatrix",
+    "SymmetricMatrix",
+]
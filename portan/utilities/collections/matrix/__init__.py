@@ -1,5 +1,6 @@
+from .block import BlockMatrix
 from .matrix import Matrix
 from .square import SquareMatrix
 from .symmetric import SymmetricMatrix
 
-__all__ = ["Matrix", "SquareMatrix", "SymmetricMatrix"]
+__all__ = ["BlockMatrix", "Matrix", "SquareMatrix", "SymmetricMatrix"]
@@ -0,0 +1,182 @@
+from operator import index
+from typing import Iterable, Iterator, List, Type, TypeVar, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ..sequence import Sequence
+from .matrix import Matrix
+
+T = TypeVar("T", bound=Sequence)
+M = TypeVar("M", bound="BlockMatrix")
+
+
+class BlockMatrix(Matrix[T]):
+    """Immutable sequence of sequences of floating-point numbers of the
+    same length, stored in a block (i.e., a two-dimensional float64 array
+    with a row per sequence), with default implementation for __init__,
+    __getitem__, __len__, __eq__, __hash__, __str__, and __repr__.
+
+    The block is operated on as a whole, while the sequences (and their
+    values) are only created when accessed. Subclasses define the
+    sequence created from a row of the block (see `_to_sequence`), the
+    floating-point numbers which are invalid (see `_invalid`), and any
+    other constraint on the block (see `_raise_if_block_is_invalid`).
+
+    Parameters
+    ----------
+    values: Iterable[T]
+        values to create the sequence from (i.e., sequences of values
+        supporting float)
+
+    Raises
+    ------
+    ValueError
+        if the values in `values` are not all of the same length
+    """
+
+    _VALID: str = "finite"  # description of valid values, for errors!
+
+    def __init__(self, values: Iterable[T]):
+        rows = [[float(value) for value in row] for row in values]
+        self._raise_if_rows_length_mismatch(rows)
+        ncols = len(rows[0]) if len(rows) > 0 else 0
+        block = np.array(rows, dtype=np.float64).reshape(len(rows), ncols)
+        self._raise_if_block_is_invalid(block)
+        self._set(block)
+
+    @classmethod
+    def _raise_if_rows_length_mismatch(cls, rows: List[List[float]]):
+        if len(set(len(row) for row in rows)) > 1:
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"values must all have the same length"
+            )
+            raise ValueError(msg)
+
+    @classmethod
+    def from_array(cls: Type[M], values: ArrayLike) -> M:
+        """Create a matrix from a two-dimensional array of floating-point
+        numbers, which are validated all at once. A read-only float64 array
+        is viewed (i.e., not copied), while any other array is copied.
+
+        Parameters
+        ----------
+        values
+            values to create the matrix from (i.e., convertible to a
+            two-dimensional float64 array with a row per sequence)
+
+        Raises
+        ------
+        ValueError
+            if `values` is not two-dimensional, or
+            if any value in `values` is invalid
+
+        Returns
+        -------
+        M
+            matrix from `values`
+        """
+        block = np.asarray(values, dtype=np.float64)
+        if block.flags.writeable:
+            block = block.copy()
+        cls._raise_if_is_not_two_dimensional(block)
+        cls._raise_if_any_is_invalid(block)
+        cls._raise_if_block_is_invalid(block)
+        return cls._from_block(block)
+
+    @classmethod
+    def _raise_if_is_not_two_dimensional(cls, block: np.ndarray):
+        if block.ndim != 2:
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"values must be two-dimensional"
+            )
+            raise ValueError(msg)
+
+    @classmethod
+    def _raise_if_any_is_invalid(cls, block: np.ndarray):
+        invalid = cls._invalid(block)
+        if np.any(invalid):
+            row, column = np.unravel_index(np.argmax(invalid), block.shape)
+            msg = (
+                f"cannot instantiate {cls.__name__}; "
+                f"values must all be {cls._VALID} (first offending value "
+                f"is in row {row}, column {column})"
+            )
+            raise ValueError(msg)
+
+    @classmethod
+    def _raise_if_block_is_invalid(cls, block: np.ndarray):
+        pass  # e.g., not square, thus defined by subclasses!
+
+    @classmethod
+    def _invalid(cls, block: np.ndarray) -> np.ndarray:
+        return ~np.isfinite(block)
+
+    @classmethod
+    def _from_block(cls: Type[M], block: np.ndarray) -> M:
+        instance = cls.__new__(cls)  # already validated, thus skip it!
+        instance._set(block)
+        return instance
+
+    def _set(self, block: np.ndarray):
+        if block.shape[0] == 0:
+            block = np.empty((0, 0))  # no sequences, thus no length!
+        block.setflags(write=False)
+        self._values = ()  # superseded by the block!
+        self._block = block
+
+    def _to_sequence(self, row: np.ndarray) -> T:
+        raise NotImplementedError
+
+    def to_array(self) -> np.ndarray:
+        """Get the block backing this matrix (i.e., without copying the
+        floating-point numbers). The block is read-only.
+
+        Returns
+        -------
+        np.ndarray
+            block of floating-point numbers (i.e., float64) with a row per
+            sequence in this matrix
+        """
+        return self._block
+
+    def __getitem__(self: M, item: Union[slice, int]) -> Union[M, T]:
+        if isinstance(item, slice):
+            return self._from_block(self._block[item])
+        return self._to_sequence(self._block[index(item)])
+
+    def __iter__(self) -> Iterator[T]:
+        for row in self._block:
+            yield self._to_sequence(row)
+
+    def __len__(self) -> int:
+        return self._block.shape[0]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return np.array_equal(self._block, other._block)
+
+    def __hash__(self) -> int:
+        return hash((self._block.shape, self._block.tobytes()))
+
+    def transpose(self: M) -> M:
+        """Transpose this matrix (i.e., without copying the floating-point
+        numbers).
+
+        Returns
+        -------
+        M[T]
+            transposed matrix
+        """
+        if self.is_empty():
+            return self
+        return self._from_block(self._block.T)
+
+    @property
+    def ncols(self) -> int:
+        """The number of columns in this matrix (i.e., the length of the
+        sequences)."""
+        return self._block.shape[1]
@@ -1,5 +1,5 @@
 from math import isfinite
-from typing import SupportsFloat, TypeVar
+from typing import SupportsFloat, Type, TypeVar
 
 T = TypeVar("T", bound="Finite")
 
@@ -22,6 +22,12 @@ class Finite:
         self._value = float(value)
         self._raise_if_is_not_finite()
 
+    @classmethod
+    def _from_valid(cls: Type[T], value: float) -> T:
+        instance = cls.__new__(cls)  # already validated, thus skip it!
+        instance._value = value
+        return instance
+
     def _raise_if_is_not_finite(self):
         if not isfinite(self._value):
             msg = (
@@ -0,0 +1,82 @@
+import statistics as stats
+from math import fsum, isfinite, sqrt
+from typing import Sequence
+
+
+def mean(values: Sequence[float], *, exact: bool = False) -> float:
+    """Get the sample (i.e., arithmetic) mean of `values`.
+
+    The mean is computed from the correctly rounded sum of `values`
+    (i.e., compensated summation), thus it is within one unit in the last
+    place of the exact mean, unless `exact`, in which case it is the
+    exact mean correctly rounded (i.e., computed with fractions, which is
+    orders of magnitude slower).
+
+    Parameters
+    ----------
+    values
+        non-empty sequence of finite floating-point numbers
+    exact
+        whether to get the exact mean correctly rounded (defaults to False)
+
+    Raises
+    ------
+    statistics.StatisticsError
+        if `values` is empty
+
+    Returns
+    -------
+    float
+        sample mean of `values`
+    """
+    if exact or len(values) == 0:
+        return stats.mean(values)
+    try:
+        return fsum(values) / len(values)
+    except OverflowError:  # sum out of range, while the mean is not!
+        return stats.mean(values)
+
+
+def stdev(values: Sequence[float], *, exact: bool = False) -> float:
+    """Get the sample standard deviation of `values`.
+
+    The standard deviation is computed in two passes from the correctly
+    rounded sums of the deviations from the mean, and of their squares
+    (i.e., corrected two-pass algorithm), thus it is within a few units
+    in the last place of the exact standard deviation, unless `exact`,
+    in which case it is computed with fractions (i.e., orders of
+    magnitude slower). The standard deviation of equal values is zero.
+
+    Parameters
+    ----------
+    values
+        sequence of at least two finite floating-point numbers
+    exact
+        whether to compute the standard deviation with fractions
+        (defaults to False)
+
+    Raises
+    ------
+    statistics.StatisticsError
+        if `values` has less than two values
+
+    Returns
+    -------
+    float
+        sample standard deviation of `values`
+    """
+    if exact or len(values) < 2:
+        return stats.stdev(values)
+    if min(values) == max(values):
+        return 0.0  # despite rounding of the mean!
+    mean_ = mean(values)
+    deviations = [value - mean_ for value in values]
+    try:
+        squares = fsum(deviation * deviation for deviation in deviations)
+        correction = fsum(deviations) ** 2 / len(values)
+    except OverflowError:
+        return stats.stdev(values)
+    variance = max(squares - correction, 0.0) / (len(values) - 1)
+    if not isfinite(variance):  # squares out of range!
+        return stats.stdev(values)
+    return sqrt(variance)
@@ -1,5 +1,7 @@
 from math import isnan
-from typing import SupportsFloat
+from typing import SupportsFloat, Type, TypeVar
+
+T = TypeVar("T", bound="NonNan")
 
 
 class NonNan:
@@ -20,6 +22,12 @@ class NonNan:
         self._value = float(value)
         self._raise_if_is_nan()
 
+    @classmethod
+    def _from_valid(cls: Type[T], value: float) -> T:
+        instance = cls.__new__(cls)  # already validated, thus skip it!
+        instance._value = value
+        return instance
+
     def _raise_if_is_nan(self):
         if isnan(self._value):
             msg = (
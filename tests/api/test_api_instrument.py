@@ -1,3 +1,4 @@
+import asyncio
 from math import isclose
 from typing import Tuple
 
@@ -60,6 +61,29 @@ class TestInstrumentInvariants:
         range_ = ("2021-09-01", "2021-09-02")
         Instrument(ticker, range_)  # does not raise
 
+    def test_when_ttl_is_negative(
+        self,
+        ticker: str,
+        range_: Tuple[str, str],
+    ):
+        with pytest.raises(PortanError, match="negative ttl"):
+            Instrument(ticker, range_, ttl=-1.0)
+
+    @pytest.mark.parametrize(
+        "synthetic",
+        [{"volatility": -0.2}, {"batman": 1.0}],
+    )
+    def test_when_synthetic_is_invalid(
+        self,
+        ticker: str,
+        range_: Tuple[str, str],
+        synthetic,
+    ):
+        with pytest.raises(PortanError, match="synthetic settings"):
+            Instrument(
+                ticker, range_, source=Source.SYNTHETIC, synthetic=synthetic
+            )
+
     def test_supports_all_sources(self, ticker: str, range_: Tuple[str, str]):
         for source in Source:
             Instrument(ticker, range_, source=source)  # does not raise
@@ -87,12 +111,40 @@ class TestInstrumentFetch:
 
     def test_when_prices(self, ticker: str):
         range_ = ("2021-10-01", "2021-10-05")
-        for source in Source:
+        for source in (Source.YAHOO,):  # network sources only!
             instrument = Instrument(ticker, range_, source=source)
             instrument.fetch()
             result = instrument.prices
             assert len(tuple(result)) == 3
 
+    def test_when_synthetic(self, ticker: str, range_: Tuple[str, str]):
+        instrument = Instrument(ticker, range_, source=Source.SYNTHETIC)
+        instrument.fetch()
+        drifting = Instrument(
+            ticker,
+            range_,
+            source=Source.SYNTHETIC,
+            synthetic={"drift": 5.0, "volatility": 0.0},
+        )
+        drifting.fetch()
+        assert tuple(drifting.prices) != tuple(instrument.prices)
+        assert len(tuple(drifting.prices)) == len(tuple(instrument.prices))
+
+
+class TestInstrumentFetchAsync:
+    def test_when_no_prices(self, ticker: str):
+        instrument = Instrument(ticker, ("2021-09-18", "2021-09-19"))
+        asyncio.run(instrument.fetch_async())
+        result = instrument.prices
+        assert tuple(result) == ()
+
+    def test_when_prices(self, ticker: str):
+        range_ = ("2021-10-01", "2021-10-05")
+        instrument = Instrument(ticker, range_)
+        asyncio.run(instrument.fetch_async())
+        result = instrument.prices
+        assert len(tuple(result)) == 3
+
 
 class TestInstrumentPrices:
     def test_when_unfetched(self, ticker: str, range_: Tuple[str, str]):
@@ -113,6 +165,22 @@ class TestInstrumentPrices:
             instrument.prices = ()
 
 
+class TestInstrumentReport:
+    def test_when_unfetched(self, ticker: str, range_: Tuple[str, str]):
+        assert Instrument(ticker, range_).report is None
+
+    def test_when_fetched(self, monkeypatch, tmp_path):
+        (tmp_path / "AAPL.csv").write_text("2021-10-01,1.0\n2021-10-04,2.0\n")
+        monkeypatch.setenv("PORTAN_LOCAL_DIRECTORY", str(tmp_path))
+        instrument = Instrument(
+            "AAPL", ("2021-10-01", "2021-10-05"), source=Source.LOCAL
+        )
+        instrument.fetch()
+        result = instrument.report["tickers"]["AAPL"]
+        assert result["rows"] == 2
+        assert {"get", "read", "parse"} <= set(result["phases"])
+
+
 class TestInstrumentMean:
     @pytest.fixture(scope="class")
     def absolute_tolerance(self) -> float:
@@ -1,3 +1,4 @@
+import asyncio
 from math import inf, nan
 from typing import Dict, Tuple
 
@@ -199,3 +200,54 @@ class TestMVOOptimise:
         range_ = ("2021-10-01", "2021-10-04")
         result = optimiser.optimise(tickers, range_, minimum=-20.0)
         assert result == {"BATMAN": 100}
+
+
+class TestMVOReport:
+    def test_when_unoptimised(self):
+        assert MVO().report is None
+
+    def test_when_optimised(self, monkeypatch, tmp_path):
+        (tmp_path / "AAPL.csv").write_text("2021-10-01,1.0\n2021-10-04,2.0\n")
+        (tmp_path / "SQ.csv").write_text("2021-10-01,3.0\n2021-10-04,4.0\n")
+        monkeypatch.setenv("PORTAN_LOCAL_DIRECTORY", str(tmp_path))
+        mvo = MVO()
+        mvo.optimise(
+            ["AAPL", "SQ"],
+            ("2021-10-01", "2021-10-05"),
+            minimum=0.0,
+            source=Source.LOCAL,
+        )
+        assert set(mvo.report["tickers"]) == {"AAPL", "SQ"}
+
+
+class TestMVOOptimiseAsync:
+    def test_when_invalid_range_values_relationship(
+        self,
+        optimiser: MVO,
+        tickers: Tuple[str, ...],
+        minimum: float,
+    ):
+        range_ = ("2021-09-02", "2021-09-01")
+        with pytest.raises(PortanError, match="values of range_"):
+            asyncio.run(
+                optimiser.optimise_async(tickers, range_, minimum=minimum)
+            )
+
+    def test_when_no_tickers(
+        self,
+        optimiser: MVO,
+        range_: Tuple[str, str],
+    ):
+        result = asyncio.run(optimiser.optimise_async((), range_, minimum=0.0))
+        assert result == {}
+
+    def test_when_multiple_tickers_and_non_zero_covariances(
+        self,
+        optimiser: MVO,
+        tickers: Tuple[str, ...],
+        range_: Tuple[str, str],
+    ):
+        result = asyncio.run(
+            optimiser.optimise_async(tickers, range_, minimum=0.5)
+        )
+        assert result == {"AAPL": 90, "SQ": 10}
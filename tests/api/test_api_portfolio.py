@@ -1,3 +1,4 @@
+import asyncio
 from math import isclose
 from typing import Dict, Tuple
 
@@ -85,6 +86,27 @@ class TestPortfolioInvariants:
     ):
         Portfolio(allocation, range_)  # does not raise
 
+    def test_when_ttl_is_negative(
+        self,
+        allocation: Dict[str, int],
+        range_: Tuple[str, str],
+    ):
+        with pytest.raises(PortanError, match="negative ttl"):
+            Portfolio(allocation, range_, ttl=-1.0)
+
+    def test_when_synthetic_is_invalid(
+        self,
+        allocation: Dict[str, int],
+        range_: Tuple[str, str],
+    ):
+        with pytest.raises(PortanError, match="synthetic settings"):
+            Portfolio(
+                allocation,
+                range_,
+                source=Source.SYNTHETIC,
+                synthetic={"correlation": 2.0},
+            )
+
     def test_supports_all_sources(
         self,
         allocation: Dict[str, int],
@@ -151,12 +173,79 @@ class TestPortfolioFetch:
         range_: Tuple[str, str],
         expected: int,
     ):
-        for source in Source:
+        for source in (Source.YAHOO,):  # network sources only!
             portfolio = Portfolio(allocation, range_, source=source)
             portfolio.fetch()
             result = portfolio.prices
             assert len(tuple(result)) == expected
 
+    def test_when_local(self, monkeypatch, tmp_path):
+        (tmp_path / "AAPL.csv").write_text("2021-10-01,1.0\n2021-10-04,2.0\n")
+        (tmp_path / "SQ.csv").write_text("2021-10-04,3.0\n2021-10-05,4.0\n")
+        monkeypatch.setenv("PORTAN_LOCAL_DIRECTORY", str(tmp_path))
+        portfolio = Portfolio(
+            {"AAPL": 50, "SQ": 50},
+            ("2021-10-01", "2021-10-05"),
+            source=Source.LOCAL,
+        )
+        portfolio.fetch()
+        result = tuple(
+            (date, tuple(prices)) for date, prices in portfolio.prices
+        )
+        assert result == (("2021-10-04", (2.0, 3.0)),)
+
+
+class TestPortfolioFetchAsync:
+    def test_when_prices(self, allocation: Dict[str, int]):
+        range_ = ("2021-10-01", "2021-10-05")
+        portfolio = Portfolio(allocation, range_)
+        asyncio.run(portfolio.fetch_async())
+        result = portfolio.prices
+        assert len(tuple(result)) == 3
+
+    def test_when_many(self, range_: Tuple[str, str]):
+        async def fetch_all(portfolios):
+            await asyncio.gather(*(p.fetch_async() for p in portfolios))
+
+        portfolios = [
+            Portfolio({"AAPL": 100}, range_),
+            Portfolio({"SQ": 100}, range_),
+        ]
+        asyncio.run(fetch_all(portfolios))
+        for portfolio in portfolios:
+            assert len(tuple(portfolio.prices)) > 0
+
+
+class TestPortfolioReport:
+    def test_when_unfetched(
+        self,
+        allocation: Dict[str, int],
+        range_: Tuple[str, str],
+    ):
+        assert Portfolio(allocation, range_).report is None
+
+    def test_when_fetched(self, monkeypatch, tmp_path):
+        (tmp_path / "AAPL.csv").write_text("2021-10-01,1.0\n2021-10-04,2.0\n")
+        (tmp_path / "SQ.csv").write_text("2021-10-04,3.0\n2021-10-05,4.0\n")
+        monkeypatch.setenv("PORTAN_LOCAL_DIRECTORY", str(tmp_path))
+        portfolio = Portfolio(
+            {"AAPL": 50, "SQ": 50},
+            ("2021-10-01", "2021-10-05"),
+            source=Source.LOCAL,
+        )
+        portfolio.fetch()
+        result = portfolio.report
+        assert "align" in result["phases"]
+        assert {
+            ticker: (value["rows"], value["dropped"])
+            for ticker, value in result["tickers"].items()
+        } == {"AAPL": (2, 1), "SQ": (2, 1)}
+
+    def test_set(self, allocation: Dict[str, int], range_: Tuple[str, str]):
+        portfolio = Portfolio(allocation, range_)
+        with pytest.raises(AttributeError):
+            portfolio.report = None
+
 
 class TestPortfolioPrices:
     def test_when_unfetched(
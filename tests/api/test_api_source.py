@@ -3,7 +3,10 @@ import pytest
 from portan.api.source import Source
 
 
-@pytest.fixture(scope="module", params=[Source.YAHOO])
+@pytest.fixture(
+    scope="module",
+    params=[Source.YAHOO, Source.YAHOO_CHART, Source.LOCAL, Source.SYNTHETIC],
+)
 def source(request) -> Source:
     return request.param
 
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from portan.library.accumulator import RateMatrixAccumulator
+from portan.library.mean.sequence import MeanSequence
+from portan.library.price.matrix import PriceMatrix
+from portan.library.price.sequence import PriceSequence
+from portan.library.scatter import CovarianceMatrix
+
+
+@pytest.fixture(scope="module")
+def prices() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return np.exp(np.cumsum(rng.normal(0.0, 0.01, size=(4, 250)), axis=1))
+
+
+class TestRateMatrixAccumulatorAdd:
+    @pytest.mark.parametrize("length", [1, 2, 3, 250])
+    def test_when_batch(self, prices: np.ndarray, length: int):
+        accumulator = RateMatrixAccumulator.from_float(
+            prices[:, :length].T.tolist()
+        )
+        rates = PriceMatrix.from_array(prices[:, :length]).growth()
+        assert accumulator.count == rates.ncols
+        assert accumulator.length == len(prices)
+        assert np.allclose(
+            [float(mean) for mean in accumulator.means()],
+            [float(mean) for mean in rates.means()],
+            rtol=1e-12,
+            atol=1e-18,
+        )
+        assert np.allclose(
+            accumulator.covariances().to_array(),
+            rates.covariances().to_array(),
+            rtol=1e-12,
+            atol=1e-18,
+        )
+
+    def test_when_empty(self):
+        accumulator = RateMatrixAccumulator()
+        assert accumulator.means() == MeanSequence([])
+        assert accumulator.covariances() == CovarianceMatrix([])
+
+    def test_when_length_mismatch(self):
+        accumulator = RateMatrixAccumulator.from_float([[1.0, 2.0]])
+        with pytest.raises(ValueError, match="number of instruments"):
+            accumulator.add(PriceSequence.from_float([1.0, 2.0, 3.0]))
+
+    def test_when_ratio_is_close_to_inf_or_zero(self):
+        accumulator = RateMatrixAccumulator.from_float([[1.0, 1e-300]])
+        with pytest.raises(ValueError, match="of row 1"):
+            accumulator.add(PriceSequence.from_float([1.0, 1e300]))
+
+
+class TestRateMatrixAccumulatorMerge:
+    @pytest.mark.parametrize("split", [0, 1, 2, 100, 249, 250])
+    def test_when_split(self, prices: np.ndarray, split: int):
+        first = RateMatrixAccumulator.from_float(prices[:, :split].T.tolist())
+        second = RateMatrixAccumulator.from_float(prices[:, split:].T.tolist())
+        result = first.merge(second)
+        expected = RateMatrixAccumulator.from_float(prices.T.tolist())
+        assert result.count == expected.count
+        assert np.allclose(
+            result.covariances().to_array(),
+            expected.covariances().to_array(),
+            rtol=1e-12,
+            atol=1e-18,
+        )
+
+    def test_when_length_mismatch(self):
+        first = RateMatrixAccumulator.from_float([[1.0, 2.0]])
+        second = RateMatrixAccumulator.from_float([[1.0, 2.0, 3.0]])
+        with pytest.raises(ValueError, match="number of instruments"):
+            first.merge(second)
+
+    def test_is_not_in_place(self, prices: np.ndarray):
+        first = RateMatrixAccumulator.from_float(prices[:, :10].T.tolist())
+        first.merge(RateMatrixAccumulator.from_float(prices[:, 10:].T.tolist()))
+        assert first.count == 9
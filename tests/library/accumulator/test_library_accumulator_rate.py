@@ -0,0 +1,75 @@
+from math import sqrt
+from typing import List
+
+import numpy as np
+import pytest
+
+from portan.library.accumulator import RateAccumulator, RateMatrixAccumulator
+from portan.library.mean import Mean
+from portan.library.price import Price
+from portan.library.price.sequence import PriceSequence
+from portan.library.scatter import Dispersion
+
+
+@pytest.fixture(scope="module")
+def prices() -> List[float]:
+    rng = np.random.default_rng(0)
+    return np.exp(np.cumsum(rng.normal(0.0, 0.01, size=250))).tolist()
+
+
+def _as_matrix(prices: List[float]) -> RateMatrixAccumulator:
+    return RateMatrixAccumulator.from_float([[price] for price in prices])
+
+
+def _assert_is_identical(
+    result: RateAccumulator,
+    expected: RateMatrixAccumulator,
+):
+    assert result.count == expected.count
+    assert float(result.mean()) == float(expected.means()[0])
+    assert float(result.dispersion()) == sqrt(
+        float(expected.covariances()[0][0])
+    )
+
+
+class TestRateAccumulatorAdd:
+    @pytest.mark.parametrize("length", [0, 1, 2, 3, 250])
+    def test_when_batch(self, prices: List[float], length: int):
+        accumulator = RateAccumulator.from_float(prices[:length])
+        rates = PriceSequence.from_float(prices[:length]).growth()
+        assert accumulator.count == len(rates)
+        if length > 0:  # a matrix needs at least one price!
+            _assert_is_identical(accumulator, _as_matrix(prices[:length]))
+
+    def test_when_empty(self):
+        accumulator = RateAccumulator()
+        assert accumulator.mean() == Mean(0.0)
+        assert accumulator.dispersion() == Dispersion(0.0)
+
+    def test_when_constant(self):
+        accumulator = RateAccumulator.from_float([1.0, 2.0, 4.0, 8.0])
+        assert accumulator.dispersion() == Dispersion(0.0)
+
+    def test_when_ratio_is_close_to_inf_or_zero(self):
+        accumulator = RateAccumulator([Price(1e-300)])
+        with pytest.raises(ValueError, match="close or equal to"):
+            accumulator.add(Price(1e300))
+
+
+class TestRateAccumulatorMerge:
+    @pytest.mark.parametrize("split", [0, 1, 2, 100, 249, 250])
+    def test_when_split(self, prices: List[float], split: int):
+        first = RateAccumulator.from_float(prices[:split])
+        second = RateAccumulator.from_float(prices[split:])
+        result = first.merge(second)
+        expected = _as_matrix(prices[:split]).merge(_as_matrix(prices[split:]))
+        _assert_is_identical(result, expected)
+
+    def test_is_not_in_place(self, prices: List[float]):
+        first = RateAccumulator.from_float(prices[:10])
+        first.merge(RateAccumulator.from_float(prices[10:]))
+        assert first.count == 9
+
+    def test_when_both_empty(self):
+        result = RateAccumulator().merge(RateAccumulator())
+        assert result.count == 0
@@ -1,5 +1,6 @@
 from typing import Tuple
 
+import numpy as np
 import pytest
 
 from portan.library.price.matrix import PriceMatrix
@@ -45,6 +46,34 @@ class TestPriceMatrixAlternativeConstructors:
         assert result == expected
 
 
+class TestPriceMatrixFromArray:
+    def test_when_valid(self):
+        values = np.array([[1.0, 2.0], [3.0, 4.0]])
+        result = PriceMatrix.from_array(values)
+        assert result == PriceMatrix.from_float(values.tolist())
+
+    def test_when_not_two_dimensional(self):
+        with pytest.raises(ValueError, match="two-dimensional"):
+            PriceMatrix.from_array([1.0, 2.0])
+
+    @pytest.mark.parametrize("value", [0.0, -1.0, np.inf, np.nan])
+    def test_when_invalid(self, value: float):
+        values = np.array([[1.0, 2.0], [3.0, value]])
+        with pytest.raises(ValueError, match="row 1, column 1"):
+            PriceMatrix.from_array(values)
+
+    def test_when_writeable(self):
+        values = np.array([[1.0, 2.0], [3.0, 4.0]])
+        matrix = PriceMatrix.from_array(values)
+        values[0, 0] = 5.0
+        assert float(matrix[0][0]) == 1.0
+
+    def test_to_array_is_read_only(self):
+        matrix = PriceMatrix.from_float([[1.0, 2.0], [3.0, 4.0]])
+        with pytest.raises(ValueError):
+            matrix.to_array()[0, 0] = 5.0
+
+
 class TestPriceMatrixGrowth:
     @pytest.mark.parametrize(
         "value",
@@ -83,6 +112,20 @@ class TestPriceMatrixGrowth:
         expected = RateMatrix(value.growth() for value in values)
         assert result == expected
 
+    def test_when_many(self):
+        rng = np.random.default_rng(0)
+        values = np.exp(np.cumsum(rng.normal(size=(5, 100)), axis=1))
+        matrix = PriceMatrix.from_array(values)
+        result = matrix.growth()
+        expected = RateMatrix(value.growth() for value in matrix)
+        assert result == expected
+
+    @pytest.mark.parametrize("values", [[1e-300, 1e300], [1e300, 1e-300]])
+    def test_when_ratio_is_close_to_inf_or_zero(self, values):
+        matrix = PriceMatrix.from_float([[1.0, 1.0, 1.0], [1.0, *values]])
+        with pytest.raises(ValueError, match="price is 2 of row 1"):
+            matrix.growth()
+
 
 class TestPriceMatrixEmpty:
     @pytest.fixture(scope="class")
@@ -60,6 +60,12 @@ class TestPriceSequenceGrowth:
         )
         assert result == expected
 
+    @pytest.mark.parametrize("values", [[1e-300, 1e300], [1e300, 1e-300]])
+    def test_when_ratio_is_close_to_inf_or_zero(self, values):
+        sequence = PriceSequence.from_float([1.0, *values])
+        with pytest.raises(ValueError, match="first offending price is 2"):
+            sequence.growth()
+
 
 class TestPriceSequenceEmpty:
     @pytest.fixture(scope="class")
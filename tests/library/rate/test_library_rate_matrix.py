@@ -1,5 +1,6 @@
 from typing import Tuple
 
+import numpy as np
 import pytest
 
 from portan.library.mean.sequence import MeanSequence
@@ -8,6 +9,51 @@ from portan.library.rate.sequence import RateSequence
 from portan.library.scatter import CorrelationMatrix, CovarianceMatrix
 
 
+class TestRateMatrixBlock:
+    @pytest.fixture(scope="class")
+    def values(self) -> Tuple[RateSequence, ...]:
+        return (
+            RateSequence.from_float([0.01, -0.02, 0.03]),
+            RateSequence.from_float([0.04, 0.05, -0.06]),
+        )
+
+    @pytest.fixture(scope="class")
+    def matrix(self, values: Tuple[RateSequence, ...]) -> RateMatrix:
+        return RateMatrix(values)
+
+    def test_from_array(self, matrix: RateMatrix):
+        values = [[0.01, -0.02, 0.03], [0.04, 0.05, -0.06]]
+        assert RateMatrix.from_array(values) == matrix
+
+    def test_from_array_when_non_finite(self):
+        with pytest.raises(ValueError, match="row 0, column 1"):
+            RateMatrix.from_array([[0.01, np.inf], [0.02, 0.03]])
+
+    def test_to_array(self, matrix: RateMatrix):
+        expected = np.array([[0.01, -0.02, 0.03], [0.04, 0.05, -0.06]])
+        assert np.array_equal(matrix.to_array(), expected)
+
+    def test_getitem(
+        self,
+        matrix: RateMatrix,
+        values: Tuple[RateSequence, ...],
+    ):
+        assert matrix[1] == values[1]
+        assert matrix[-1] == values[-1]
+        assert matrix[:1] == RateMatrix(values[:1])
+
+    def test_iter(self, matrix: RateMatrix, values: Tuple[RateSequence, ...]):
+        assert tuple(matrix) == values
+
+    def test_transpose(self, matrix: RateMatrix):
+        expected = RateMatrix.from_array(matrix.to_array().T)
+        assert matrix.transpose() == expected
+        assert matrix.transpose().transpose() == matrix
+
+    def test_hash(self, matrix: RateMatrix, values: Tuple[RateSequence, ...]):
+        assert hash(matrix) == hash(RateMatrix(values))
+
+
 class TestRateMatrixMeans:
     @pytest.mark.parametrize(
         "value",
@@ -91,6 +137,22 @@ class TestRateMatrixCovariances:
         )
         assert result == expected
 
+    def test_when_many(self):
+        rng = np.random.default_rng(0)
+        matrix = RateMatrix.from_array(rng.normal(size=(5, 100)))
+        result = matrix.covariances()
+        expected = [
+            [float(value.covariance(other)) for other in matrix]
+            for value in matrix
+        ]
+        assert result.is_symmetric()
+        assert np.allclose(result.to_array(), expected, rtol=1e-12)
+
+    def test_when_one_rate_per_sequence(self):
+        matrix = RateMatrix.from_array([[0.1], [-0.1], [0.2]])
+        result = matrix.covariances()
+        assert np.array_equal(result.to_array(), np.zeros((3, 3)))
+
 
 class TestRateMatrixCorrelations:
     @pytest.mark.parametrize(
@@ -136,6 +198,32 @@ class TestRateMatrixCorrelations:
         )
         assert result == expected
 
+    def test_when_many(self):
+        rng = np.random.default_rng(0)
+        matrix = RateMatrix.from_array(rng.normal(size=(5, 100)))
+        result = matrix.correlations()
+        expected = [
+            [float(value.correlation(other)) for other in matrix]
+            for value in matrix
+        ]
+        assert np.allclose(result.to_array(), expected, rtol=1e-12)
+
+    @pytest.mark.parametrize("constant", [0.0, 0.1, -0.07])
+    def test_when_zero_dispersion(self, constant: float):
+        matrix = RateMatrix.from_array(
+            [[constant] * 7, [0.01, -0.02, 0.03, 0.0, 0.05, -0.01, 0.02]]
+        )
+        result = matrix.correlations().to_array()
+        assert np.allclose(result, [[0.0, 0.0], [0.0, 1.0]], rtol=0.0)
+        assert result[0, 0] == result[0, 1] == result[1, 0] == 0.0
+
+    def test_when_perfectly_correlated(self):
+        values = [0.01, -0.02, 0.03, 0.1]
+        matrix = RateMatrix.from_array([values, [-2.0 * v for v in values]])
+        result = matrix.correlations().to_array()
+        assert np.all(np.abs(result) <= 1.0)
+        assert np.allclose(result, [[1.0, -1.0], [-1.0, 1.0]])
+
 
 class TestRateMatrixEmpty:
     @pytest.fixture(scope="class")
@@ -60,6 +60,11 @@ class TestRateSequenceMean:
         )
         assert result == expected
 
+    def test_when_exact(self):
+        sequence = RateSequence.from_float([0.1, 0.2, 0.3, 0.7])
+        result = sequence.mean(exact=True)
+        assert result == Mean(0.325)
+
 
 class TestRateSequenceDispersion:
     @pytest.fixture(scope="class")
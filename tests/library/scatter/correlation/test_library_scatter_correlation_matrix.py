@@ -1,5 +1,6 @@
 from typing import Tuple
 
+import numpy as np
 import pytest
 
 from portan.library.scatter.correlation import Correlation
@@ -75,6 +76,29 @@ class TestCorrelationMatrixAlternativeConstructors:
         )
         assert result == expected
 
+    def test_from_array(self):
+        result = CorrelationMatrix.from_array([[1.0, -0.5], [-0.5, 1.0]])
+        expected = CorrelationMatrix.from_iterable(
+            [
+                (Correlation(1.0), Correlation(-0.5)),
+                (Correlation(-0.5), Correlation(1.0)),
+            ]
+        )
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "values, match",
+        [
+            ([[1.0, 0.5]], "number of values"),
+            ([[1.0, 0.5], [-0.5, 1.0]], "symmetric"),
+            ([[1.0, 1.5], [1.5, 1.0]], "inside"),
+            ([[1.0, np.nan], [np.nan, 1.0]], "finite"),
+        ],
+    )
+    def test_from_array_when_invalid(self, values, match: str):
+        with pytest.raises(ValueError, match=match):
+            CorrelationMatrix.from_array(np.array(values))
+
 
 class TestCorrelationMatrixToFloat:
     def test(self):
@@ -1,6 +1,7 @@
 from math import inf, nan
 from typing import Tuple
 
+import numpy as np
 import pytest
 
 from portan.library.scatter import (
@@ -79,6 +80,28 @@ class TestCovarianceMatrixAlternativeConstructors:
         )
         assert result == expected
 
+    def test_from_array(self):
+        result = CovarianceMatrix.from_array([[2.0, 4.0], [4.0, inf]])
+        expected = CovarianceMatrix.from_iterable(
+            [
+                (Covariance(2.0), Covariance(4.0)),
+                (Covariance(4.0), Covariance(inf)),
+            ]
+        )
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "values, match",
+        [
+            ([[2.0, 4.0]], "number of values"),
+            ([[2.0, 4.0], [3.0, 1.0]], "symmetric"),
+            ([[2.0, nan], [nan, 1.0]], "non-NaN"),
+        ],
+    )
+    def test_from_array_when_invalid(self, values, match: str):
+        with pytest.raises(ValueError, match=match):
+            CovarianceMatrix.from_array(np.array(values))
+
 
 class TestCovarianceMatrixVariance:
     @pytest.fixture(scope="class")
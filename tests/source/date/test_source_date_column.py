@@ -0,0 +1,61 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from portan.source.date import Date, column
+
+
+class TestColumnFromStrings:
+    def test(self):
+        strings = ["0001-01-01", "1970-01-01", "2020-02-29", "9999-12-31"]
+        result = column.from_strings(strings)
+        expected = np.array(strings, dtype="datetime64[D]")
+        assert np.array_equal(result, expected)
+        assert result.dtype == np.dtype("datetime64[D]")
+
+    def test_when_empty(self):
+        result = column.from_strings([])
+        assert result.shape == (0,)
+        assert result.dtype == np.dtype("datetime64[D]")
+
+    def test_is_consistent_with_date(self):
+        begin = date(1, 1, 1)
+        strings = [
+            (begin + timedelta(days=days)).isoformat()
+            for days in range(0, 3652059, 997)
+        ]
+        result = column.to_ordinals(column.from_strings(strings)).tolist()
+        assert result == [Date(string).to_ordinal() for string in strings]
+
+    @pytest.mark.parametrize(
+        "string",
+        [
+            "2021-02-29",  # not a leap year
+            "1900-02-29",  # not a leap year
+            "2021-04-31",
+            "2021-13-01",
+            "2021-00-01",
+            "2021-01-00",
+            "0000-01-01",
+            "10000-01-01",
+            "1-01-01",
+            "2021-9-01",
+            "2021-09",
+            "2021/09/01",
+            "2021-09-01T00",
+            "today",
+            "NaT",
+            "",
+            "2021-09-é1",
+        ],
+    )
+    def test_when_invalid(self, string: str):
+        with pytest.raises(ValueError, match="ISO format.*row is 1"):
+            column.from_strings(["2021-09-01", string, "2021-09-02"])
+
+
+class TestColumnInvalid:
+    def test(self):
+        dates = np.array(["2021-09-01", "NaT"], dtype="datetime64[D]")
+        assert column.invalid(dates).tolist() == [False, True]
@@ -0,0 +1,148 @@
+import pytest
+
+from portan.source.date.coverage import DateCoverage
+from portan.source.date.range import DateRange
+
+
+@pytest.fixture(scope="module")
+def coverage() -> DateCoverage:
+    return DateCoverage(
+        [
+            DateRange.from_string("2021-09-01", "2021-09-10"),
+            DateRange.from_string("2021-09-20", "2021-09-30"),
+        ]
+    )
+
+
+class TestDateCoverageInvariants:
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [
+                DateRange.from_string("2021-09-20", "2021-09-30"),
+                DateRange.from_string("2021-09-01", "2021-09-10"),
+            ],  # unsorted
+            [
+                DateRange.from_string("2021-09-01", "2021-09-10"),
+                DateRange.from_string("2021-09-10", "2021-09-30"),
+            ],  # overlapping
+            [
+                DateRange.from_string("2021-09-01", "2021-09-10"),
+                DateRange.from_string("2021-09-11", "2021-09-30"),
+            ],  # adjacent
+        ],
+    )
+    def test_when_invalid(self, values):
+        with pytest.raises(ValueError, match="values must be sorted"):
+            DateCoverage(values)
+
+    def test_when_valid(self, coverage: DateCoverage):
+        DateCoverage(coverage)  # does not raise
+        DateCoverage([])  # does not raise
+
+
+class TestDateCoverageAlternativeConstructors:
+    def test_from_unsorted(self, coverage: DateCoverage):
+        result = DateCoverage.from_unsorted(reversed(coverage))
+        assert result == coverage
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [
+                DateRange.from_string("2021-09-05", "2021-09-30"),
+                DateRange.from_string("2021-09-01", "2021-09-10"),
+            ],  # overlapping
+            [
+                DateRange.from_string("2021-09-01", "2021-09-10"),
+                DateRange.from_string("2021-09-11", "2021-09-30"),
+            ],  # adjacent
+            [
+                DateRange.from_string("2021-09-01", "2021-09-30"),
+                DateRange.from_string("2021-09-11", "2021-09-12"),
+            ],  # included
+        ],
+    )
+    def test_from_unsorted_merges(self, values):
+        result = DateCoverage.from_unsorted(values)
+        expected = DateCoverage(
+            [DateRange.from_string("2021-09-01", "2021-09-30")]
+        )
+        assert result == expected
+
+
+class TestDateCoverageIncludes:
+    @pytest.mark.parametrize(
+        "range_, expected",
+        [
+            (DateRange.from_string("2021-09-01", "2021-09-10"), True),
+            (DateRange.from_string("2021-09-21", "2021-09-22"), True),
+            (DateRange.from_string("2021-09-05", "2021-09-11"), False),
+            (DateRange.from_string("2021-09-05", "2021-09-25"), False),
+            (DateRange.from_string("2021-10-01", "2021-10-02"), False),
+        ],
+    )
+    def test(self, coverage: DateCoverage, range_: DateRange, expected: bool):
+        assert coverage.includes(range_) is expected
+
+    def test_when_empty(self):
+        range_ = DateRange.from_string("2021-09-01", "2021-09-10")
+        assert not DateCoverage([]).includes(range_)
+
+
+class TestDateCoverageMissing:
+    @pytest.mark.parametrize(
+        "range_, expected",
+        [
+            (
+                DateRange.from_string("2021-09-02", "2021-09-09"),
+                [],
+            ),  # covered
+            (
+                DateRange.from_string("2021-08-25", "2021-09-05"),
+                [DateRange.from_string("2021-08-25", "2021-08-31")],
+            ),  # head
+            (
+                DateRange.from_string("2021-09-25", "2021-10-05"),
+                [DateRange.from_string("2021-10-01", "2021-10-05")],
+            ),  # tail
+            (
+                DateRange.from_string("2021-09-05", "2021-09-25"),
+                [DateRange.from_string("2021-09-11", "2021-09-19")],
+            ),  # gap
+            (
+                DateRange.from_string("2021-08-31", "2021-10-01"),
+                [
+                    DateRange.from_string("2021-08-31", "2021-08-31"),
+                    DateRange.from_string("2021-09-11", "2021-09-19"),
+                    DateRange.from_string("2021-10-01", "2021-10-01"),
+                ],
+            ),  # head, gap and tail
+            (
+                DateRange.from_string("2021-09-12", "2021-09-13"),
+                [DateRange.from_string("2021-09-12", "2021-09-13")],
+            ),  # uncovered
+        ],
+    )
+    def test(self, coverage: DateCoverage, range_: DateRange, expected):
+        assert coverage.missing(range_) == DateCoverage(expected)
+
+    def test_when_empty(self):
+        range_ = DateRange.from_string("2021-09-01", "2021-09-10")
+        result = DateCoverage([]).missing(range_)
+        assert result == DateCoverage([range_])
+
+
+class TestDateCoverageAdd:
+    def test(self, coverage: DateCoverage):
+        result = coverage.add(
+            DateRange.from_string("2021-09-11", "2021-09-19"),
+        )
+        expected = DateCoverage(
+            [DateRange.from_string("2021-09-01", "2021-09-30")],
+        )
+        assert result == expected
+
+    def test_is_not_in_place(self, coverage: DateCoverage):
+        coverage.add(DateRange.from_string("2021-09-11", "2021-09-19"))
+        assert len(coverage) == 2
@@ -1,5 +1,7 @@
+import pickle
 from datetime import date
 
+import numpy as np
 import pytest
 
 from portan.source.date import MAX_YEAR, MIN_YEAR, Date
@@ -54,6 +56,34 @@ class TestDateAlternativeConstructors:
         expected = Date(date.today().isoformat())
         assert result == expected
 
+    @pytest.mark.parametrize(
+        "value",
+        [
+            f"{str(MIN_YEAR).zfill(4)}-01-01",  # minimum year
+            f"{str(MAX_YEAR).zfill(4)}-12-31",  # maximum year
+            "2020-02-29",  # leap year
+        ],
+    )
+    def test_from_ordinal(self, value: str):
+        result = Date.from_ordinal(date.fromisoformat(value).toordinal())
+        assert result == Date(value)
+
+    @pytest.mark.parametrize(
+        "ordinal",
+        [0, -1, date.max.toordinal() + 1],
+    )
+    def test_from_ordinal_when_invalid(self, ordinal: int):
+        with pytest.raises(ValueError, match="ordinal must be in"):
+            Date.from_ordinal(ordinal)
+
+    @pytest.mark.parametrize("ordinal", [738000.7, 738000.0, "738000"])
+    def test_from_ordinal_when_not_an_integer(self, ordinal):
+        with pytest.raises(TypeError):
+            Date.from_ordinal(ordinal)
+
+    def test_from_ordinal_when_numpy_integer(self):
+        assert Date.from_ordinal(np.int64(738000)) is Date.from_ordinal(738000)
+
 
 @pytest.fixture(scope="module")
 def value() -> str:
@@ -65,6 +95,28 @@ def date_(value: str) -> Date:
     return Date(value)
 
 
+class TestDateToOrdinal:
+    def test(self, date_: Date, value: str):
+        assert date_.to_ordinal() == date.fromisoformat(value).toordinal()
+
+
+class TestDateInterning:
+    def test_when_equal(self, date_: Date, value: str):
+        assert Date(value) is date_
+
+    def test_when_from_ordinal(self, date_: Date):
+        assert Date.from_ordinal(date_.to_ordinal()) is date_
+
+    def test_when_incremented(self, date_: Date):
+        assert date_.increment().decrement() is date_
+
+    def test_when_pickled(self, date_: Date):
+        assert pickle.loads(pickle.dumps(date_)) is date_
+
+    def test_has_no_dict(self, date_: Date):
+        assert not hasattr(date_, "__dict__")
+
+
 class TestDateStringRepresentation:
     def test_str(self, date_: Date, value: str):
         assert str(date_) == value
@@ -90,3 +90,81 @@ class TestDateRangeProperties:
     def test_set_end(self, range_: DateRange, end: Date):
         with pytest.raises(AttributeError):
             range_.end = end
+
+
+class TestDateRangeIncludes:
+    @pytest.mark.parametrize(
+        "other, expected",
+        [
+            (DateRange.from_string("2021-09-01", "2021-09-02"), True),
+            (DateRange.from_string("2021-09-02", "2021-09-02"), True),
+            (DateRange.from_string("2021-08-31", "2021-09-02"), False),
+            (DateRange.from_string("2021-09-01", "2021-09-03"), False),
+        ],
+    )
+    def test(self, range_: DateRange, other: DateRange, expected: bool):
+        assert range_.includes(other) is expected
+
+
+class TestDateRangeSplit:
+    @pytest.mark.parametrize(
+        "range_, years, expected",
+        [
+            (
+                DateRange.from_string("2021-09-01", "2021-09-02"),
+                1,
+                [("2021-09-01", "2021-09-02")],
+            ),
+            (
+                DateRange.from_string("2019-06-01", "2021-03-01"),
+                1,
+                [
+                    ("2019-06-01", "2019-12-31"),
+                    ("2020-01-01", "2020-12-31"),
+                    ("2021-01-01", "2021-03-01"),
+                ],
+            ),
+            (
+                DateRange.from_string("2019-06-01", "2023-03-01"),
+                2,
+                [
+                    ("2019-06-01", "2020-12-31"),
+                    ("2021-01-01", "2022-12-31"),
+                    ("2023-01-01", "2023-03-01"),
+                ],
+            ),
+            (
+                DateRange.from_string("2020-01-01", "2020-12-31"),
+                1,
+                [("2020-01-01", "2020-12-31")],
+            ),
+            (
+                DateRange.from_string("9998-06-01", "9999-12-31"),
+                1,
+                [("9998-06-01", "9998-12-31"), ("9999-01-01", "9999-12-31")],
+            ),
+        ],
+    )
+    def test(self, range_: DateRange, years: int, expected):
+        result = range_.split(years=years)
+        assert result == tuple(DateRange.from_string(*v) for v in expected)
+
+    @pytest.mark.parametrize("years", [0, -1])
+    def test_when_years_is_negative_or_zero(self, range_: DateRange, years):
+        with pytest.raises(ValueError, match="years must be strictly"):
+            range_.split(years=years)
+
+
+class TestDateRangeContains:
+    @pytest.mark.parametrize(
+        "date, expected",
+        [
+            (Date("2021-08-31"), False),
+            (Date("2021-09-01"), True),
+            (Date("2021-09-02"), True),
+            (Date("2021-09-03"), False),
+            ("2021-09-01", False),
+        ],
+    )
+    def test(self, range_: DateRange, date: Date, expected: bool):
+        assert (date in range_) is expected
@@ -43,6 +43,16 @@ class TestDateSequenceAlternativeConstructors:
         result = DateSequence.from_string(str(value) for value in values)
         assert result == sequence
 
+    def test_from_ordinal(
+        self,
+        sequence: DateSequence,
+        values: Tuple[Date, ...],
+    ):
+        result = DateSequence.from_ordinal(
+            value.to_ordinal() for value in values
+        )
+        assert result == sequence
+
 
 class TestDateSequenceIsAscending:
     def test_when_one_element(self):
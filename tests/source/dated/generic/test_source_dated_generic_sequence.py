@@ -3,6 +3,7 @@ from typing import Tuple
 import pytest
 
 from portan.source.date import Date
+from portan.source.date.range import DateRange
 from portan.source.date.sequence import DateSequence
 from portan.source.dated.generic import Dated
 from portan.source.dated.generic.sequence import DatedSequence
@@ -202,6 +203,42 @@ class TestDatedSequenceCompress:
         assert result == sequence
 
 
+class TestDatedSequenceRestrict:
+    @pytest.fixture(scope="class")
+    def sequence(self) -> DatedSequence:
+        return DatedSequence(
+            [
+                Dated(Date("2021-10-31"), 1),
+                Dated(Date("2021-11-01"), 2),
+                Dated(Date("2021-11-03"), 2),
+            ]
+        )
+
+    @pytest.mark.parametrize(
+        "range_, expected",
+        [
+            (DateRange.from_string("2021-10-01", "2021-10-30"), []),
+            (
+                DateRange.from_string("2021-11-01", "2021-11-02"),
+                [Dated(Date("2021-11-01"), 2)],
+            ),
+            (
+                DateRange.from_string("2021-10-31", "2021-11-01"),
+                [
+                    Dated(Date("2021-10-31"), 1),
+                    Dated(Date("2021-11-01"), 2),
+                ],
+            ),
+        ],
+    )
+    def test(self, sequence: DatedSequence, range_: DateRange, expected):
+        assert sequence.restrict(range_) == DatedSequence(expected)
+
+    def test_when_all_selected(self, sequence: DatedSequence):
+        range_ = DateRange.from_string("2021-10-31", "2021-11-03")
+        assert sequence.restrict(range_) == sequence
+
+
 class TestDatedSequenceEmpty:
     @pytest.fixture(scope="class")
     def sequence(self) -> DatedSequence:
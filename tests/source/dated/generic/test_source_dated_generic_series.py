@@ -67,6 +67,43 @@ class TestDatedSeriesAlternativeConstructors:
             )
 
 
+class TestDatedSeriesMerge:
+    @pytest.fixture(scope="class")
+    def series(self) -> DatedSeries:
+        return DatedSeries(
+            (
+                Dated(Date("2021-09-01"), 1),
+                Dated(Date("2021-09-03"), 3),
+            )
+        )
+
+    def test_when_disjoint(self, series: DatedSeries):
+        other = DatedSeries(
+            (
+                Dated(Date("2021-08-31"), 0),
+                Dated(Date("2021-09-02"), 2),
+            )
+        )
+        result = series.merge(other)
+        expected = DatedSeries.from_unsorted((*series, *other))
+        assert result == expected
+
+    def test_when_overlapping(self, series: DatedSeries):
+        other = DatedSeries((Dated(Date("2021-09-03"), 4),))
+        result = series.merge(other)
+        expected = DatedSeries(
+            (
+                Dated(Date("2021-09-01"), 1),
+                Dated(Date("2021-09-03"), 4),
+            )
+        )
+        assert result == expected
+
+    def test_when_empty(self, series: DatedSeries):
+        assert series.merge(DatedSeries([])) == series
+        assert DatedSeries([]).merge(series) == series
+
+
 class TestDatedSeriesEmpty:
     @pytest.fixture(scope="class")
     def series(self) -> DatedSeries:
@@ -1,7 +1,10 @@
 from typing import Tuple
 
+import numpy as np
 import pytest
 
+from portan.source.date.range import DateRange
+from portan.source.date.sequence import DateSequence
 from portan.source.dated.price import DatedPrice
 from portan.source.dated.price.series import DatedPriceSeries
 from portan.source.price.sequence import PriceSequence
@@ -75,6 +78,116 @@ class TestDatedPriceSeriesAlternativeConstructors:
         assert result == series
 
 
+class TestDatedPriceSeriesFromArrays:
+    def test(self, series: DatedPriceSeries):
+        result = DatedPriceSeries.from_arrays(
+            np.array(
+                ["2021-09-01", "2021-09-02", "2021-09-03"], "datetime64[D]"
+            ),
+            np.array([100.0, 101.0, 99.0]),
+        )
+        assert result == series
+
+    def test_when_unsorted(self):
+        dates = np.array(["2021-09-02", "2021-09-01"], "datetime64[D]")
+        with pytest.raises(ValueError, match="sorted"):
+            DatedPriceSeries.from_arrays(dates, [1.0, 2.0])
+
+    def test_when_duplicated(self):
+        dates = np.array(["2021-09-01", "2021-09-01"], "datetime64[D]")
+        with pytest.raises(ValueError, match="same date"):
+            DatedPriceSeries.from_arrays(dates, [1.0, 2.0])
+
+    def test_when_lengths_mismatch(self):
+        dates = np.array(["2021-09-01", "2021-09-02"], "datetime64[D]")
+        with pytest.raises(ValueError, match="same length"):
+            DatedPriceSeries.from_arrays(dates, [1.0])
+
+    def test_when_not_a_date(self):
+        dates = np.array(["2021-09-01", "NaT"], "datetime64[D]")
+        with pytest.raises(ValueError, match="valid dates"):
+            DatedPriceSeries.from_arrays(dates, [1.0, 2.0])
+
+    @pytest.mark.parametrize("price", [np.nan, np.inf, -np.inf, -1.0, 0.0])
+    def test_when_invalid_price(self, price: float):
+        dates = np.array(["2021-09-01", "2021-09-02"], "datetime64[D]")
+        with pytest.raises(ValueError, match="finite, and strictly positive"):
+            DatedPriceSeries.from_arrays(dates, [1.0, price])
+
+    def test_copies(self):
+        dates = np.array(["2021-09-01", "2021-09-02"], "datetime64[D]")
+        prices = np.array([1.0, 2.0])
+        result = DatedPriceSeries.from_arrays(dates, prices)
+        prices[0] = 3.0
+        assert result.prices == PriceSequence.from_float([1.0, 2.0])
+
+    def test_from_unsorted_arrays(self):
+        dates = np.array(["2021-09-02", "2021-09-01"], "datetime64[D]")
+        result = DatedPriceSeries.from_unsorted_arrays(dates, [2.0, 1.0])
+        expected = DatedPriceSeries.from_basic(
+            [("2021-09-01", 1.0), ("2021-09-02", 2.0)]
+        )
+        assert result == expected
+
+
+class TestDatedPriceSeriesDiagnostics:
+    @pytest.fixture(scope="class")
+    def values(self) -> Tuple[Tuple[str, float], ...]:
+        return (
+            ("2021-09-01", 1.0),
+            ("2021-09-02", 2.0),
+            ("2021-09-03", 3.0),
+            ("2021-09-06", 4.0),
+        )
+
+    @pytest.mark.parametrize("date", ["2021-09-31", "2021-9-06", "today"])
+    def test_when_invalid_date(self, values, date: str):
+        invalid = (*values[:2], (date, 3.0), values[3])
+        with pytest.raises(ValueError, match="ISO format.*row is 2"):
+            DatedPriceSeries.from_basic(invalid)
+
+    @pytest.mark.parametrize("price", [np.nan, np.inf, -1.0, 0.0])
+    def test_when_invalid_price(self, values, price: float):
+        invalid = (*values[:3], (values[3][0], price))
+        with pytest.raises(ValueError, match="positive.*row is 3"):
+            DatedPriceSeries.from_unsorted_basic(invalid)
+
+    def test_when_unsorted(self, values):
+        invalid = (values[0], values[2], values[1], values[3])
+        with pytest.raises(ValueError, match="sorted.*row is 2"):
+            DatedPriceSeries.from_basic(invalid)
+
+    def test_when_duplicated(self, values):
+        invalid = (*values[:3], (values[2][0], 5.0))
+        with pytest.raises(ValueError, match="same date.*row is 3"):
+            DatedPriceSeries.from_basic(invalid)
+
+    def test_when_unsorted_and_duplicated(self, values):
+        invalid = (values[3], values[1], values[0], (values[1][0], 5.0))
+        with pytest.raises(ValueError, match="same date.*row is 3"):
+            DatedPriceSeries.from_unsorted_basic(invalid)
+
+
+class TestDatedPriceSeriesToArrays:
+    def test(self, series: DatedPriceSeries):
+        dates, prices = series.to_arrays()
+        assert dates.dtype == np.dtype("datetime64[D]")
+        assert np.datetime_as_string(dates).tolist() == [
+            str(date) for date in series.dates
+        ]
+        assert prices.tolist() == [float(price) for price in series.prices]
+
+    def test_is_read_only(self, series: DatedPriceSeries):
+        dates, prices = series.to_arrays()
+        with pytest.raises(ValueError):
+            prices[0] = 1.0
+        with pytest.raises(ValueError):
+            dates[0] = dates[1]
+
+    def test_reverts_to(self, series: DatedPriceSeries):
+        assert DatedPriceSeries.from_arrays(*series.to_arrays()) == series
+
+
 class TestDatedPriceSeriesProperties:
     def test_prices(self, series: DatedPriceSeries):
         expected = PriceSequence(value.value for value in series)
@@ -127,3 +240,59 @@ class TestDatedPriceSeriesEmpty:
 
     def test_to_basic(self, series: DatedPriceSeries):
         assert tuple(series.to_basic()) == ()
+
+
+class TestDatedPriceSeriesOperations:
+    def test_getitem(
+        self,
+        series: DatedPriceSeries,
+        values: Tuple[DatedPrice, ...],
+    ):
+        assert tuple(series[i] for i in range(len(series))) == values
+        assert series[-1] == values[-1]
+
+    def test_getitem_when_slice(
+        self,
+        series: DatedPriceSeries,
+        values: Tuple[DatedPrice, ...],
+    ):
+        assert series[1:] == DatedPriceSeries(values[1:])
+
+    def test_iter(
+        self,
+        series: DatedPriceSeries,
+        values: Tuple[DatedPrice, ...],
+    ):
+        assert tuple(series) == values
+
+    def test_compress(
+        self,
+        series: DatedPriceSeries,
+        values: Tuple[DatedPrice, ...],
+    ):
+        dates = DateSequence([values[0].date, values[2].date])
+        result = series.compress(dates)
+        assert result == DatedPriceSeries([values[0], values[2]])
+
+    def test_restrict(
+        self,
+        series: DatedPriceSeries,
+        values: Tuple[DatedPrice, ...],
+    ):
+        range_ = DateRange(values[1].date, values[2].date)
+        assert series.restrict(range_) == DatedPriceSeries(values[1:])
+
+    def test_merge(self, series: DatedPriceSeries):
+        other = DatedPriceSeries.from_basic(
+            [("2021-09-03", 50.0), ("2021-09-06", 51.0)]
+        )
+        result = series.merge(other)
+        expected = DatedPriceSeries.from_basic(
+            [
+                ("2021-09-01", 100.0),
+                ("2021-09-02", 101.0),
+                ("2021-09-03", 50.0),
+                ("2021-09-06", 51.0),
+            ]
+        )
+        assert result == expected
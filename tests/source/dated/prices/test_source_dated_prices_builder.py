@@ -1,5 +1,6 @@
 import pytest
 
+from portan.source import report
 from portan.source.dated.price.series import DatedPriceSeries
 from portan.source.dated.prices import DatedPrices
 from portan.source.dated.prices.builder import DatedPricesSeriesBuilder
@@ -159,3 +160,70 @@ class TestDatedPricesSeriesBuilderAdd:
         result = builder.get()
         expected = DatedPricesSeries([])
         assert result == expected
+
+
+class TestDatedPricesSeriesBuilderCount:
+    def test_when_none(self, builder: DatedPricesSeriesBuilder):
+        assert builder.count == 0
+
+    def test_when_some(self, builder: DatedPricesSeriesBuilder):
+        single = DatedPriceSeries.from_basic([("2021-10-31", 100.0)])
+        builder.add(single)
+        builder.add(single)
+        assert builder.count == 2
+
+
+class TestDatedPricesSeriesBuilderReport:
+    def test_when_dropped(self, builder: DatedPricesSeriesBuilder):
+        builder.add(
+            DatedPriceSeries.from_basic(
+                [("2021-10-29", 1.0), ("2021-11-01", 2.0), ("2021-11-02", 3.0)]
+            ),
+            ticker="a",
+        )
+        builder.add(
+            DatedPriceSeries.from_basic([("2021-11-01", 4.0)]),
+            ticker="b",
+        )
+        with report.recording() as recorder:
+            builder.get()
+        result = recorder.report()
+        assert [(value.ticker, value.dropped) for value in result] == [
+            ("a", 2),
+            ("b", 0),
+        ]
+        assert set(result.phases) == {report.ALIGN}
+
+    def test_when_got_twice(self, builder: DatedPricesSeriesBuilder):
+        builder.add(
+            DatedPriceSeries.from_basic(
+                [("2021-10-29", 1.0), ("2021-11-01", 2.0)]
+            ),
+            ticker="a",
+        )
+        builder.add(
+            DatedPriceSeries.from_basic([("2021-11-01", 4.0)]),
+            ticker="b",
+        )
+        with report.recording() as recorder:
+            first = builder.get()
+            second = builder.get()
+        assert second is first
+        assert [
+            (value.ticker, value.dropped) for value in recorder.report()
+        ] == [
+            ("a", 1),
+            ("b", 0),
+        ]
+
+    def test_when_added_after_get(self, builder: DatedPricesSeriesBuilder):
+        builder.add(DatedPriceSeries.from_basic([("2021-11-01", 4.0)]))
+        builder.get()
+        builder.add(DatedPriceSeries.from_basic([("2021-11-02", 5.0)]))
+        assert len(builder.get()) == 0
+
+    def test_when_no_ticker(self, builder: DatedPricesSeriesBuilder):
+        builder.add(DatedPriceSeries.from_basic([("2021-11-01", 4.0)]))
+        with report.recording() as recorder:
+            builder.get()
+        assert len(recorder.report()) == 0
@@ -1,7 +1,10 @@
 from typing import Tuple
 
+import numpy as np
 import pytest
 
+from portan.source.date.range import DateRange
+from portan.source.date.sequence import DateSequence
 from portan.source.dated.price.series import DatedPriceSeries
 from portan.source.dated.prices import DatedPrices
 from portan.source.dated.prices.series import DatedPricesSeries
@@ -68,6 +71,83 @@ class TestDatedPricesSeriesProperties:
             series.prices = PriceMatrix([])
 
 
+class TestDatedPricesSeriesFromArrays:
+    def test(self, series: DatedPricesSeries):
+        result = DatedPricesSeries.from_arrays(
+            np.array(["2021-11-01", "2021-11-02"], "datetime64[D]"),
+            np.array([[1.0, 3.0], [2.0, 4.0]]),
+        )
+        assert result == series
+
+    def test_when_shapes_mismatch(self):
+        dates = np.array(["2021-11-01", "2021-11-02"], "datetime64[D]")
+        with pytest.raises(ValueError, match="column per date"):
+            DatedPricesSeries.from_arrays(dates, [[1.0, 2.0, 3.0]])
+
+    def test_when_unsorted(self):
+        dates = np.array(["2021-11-02", "2021-11-01"], "datetime64[D]")
+        with pytest.raises(ValueError, match="sorted"):
+            DatedPricesSeries.from_arrays(dates, [[1.0, 2.0]])
+
+    @pytest.mark.parametrize("price", [np.nan, np.inf, -1.0, 0.0])
+    def test_when_invalid_price(self, price: float):
+        dates = np.array(["2021-11-01", "2021-11-02"], "datetime64[D]")
+        with pytest.raises(ValueError, match="finite, and strictly positive"):
+            DatedPricesSeries.from_arrays(dates, [[1.0, price]])
+
+    def test_when_no_dates(self):
+        result = DatedPricesSeries.from_arrays(
+            np.array([], "datetime64[D]"),
+            np.empty((3, 0)),
+        )
+        assert result == DatedPricesSeries([])
+
+
+class TestDatedPricesSeriesToArrays:
+    def test(self, series: DatedPricesSeries):
+        dates, prices = series.to_arrays()
+        assert np.datetime_as_string(dates).tolist() == [
+            "2021-11-01",
+            "2021-11-02",
+        ]
+        assert prices.tolist() == [[1.0, 3.0], [2.0, 4.0]]
+        assert prices.flags.c_contiguous
+
+    def test_is_read_only(self, series: DatedPricesSeries):
+        _, prices = series.to_arrays()
+        with pytest.raises(ValueError):
+            prices[0, 0] = 5.0
+
+    def test_prices_is_a_view(self, series: DatedPricesSeries):
+        _, prices = series.to_arrays()
+        assert series.prices.to_array() is prices
+
+
+class TestDatedPricesSeriesOperations:
+    def test_iter(self, series: DatedPricesSeries):
+        assert tuple(series) == (
+            DatedPrices.from_basic("2021-11-01", [1.0, 2.0]),
+            DatedPrices.from_basic("2021-11-02", [3.0, 4.0]),
+        )
+
+    def test_getitem(self, series: DatedPricesSeries):
+        assert series[-1] == DatedPrices.from_basic("2021-11-02", [3.0, 4.0])
+
+    def test_getitem_when_slice(self, series: DatedPricesSeries):
+        expected = DatedPricesSeries(
+            [DatedPrices.from_basic("2021-11-02", [3.0, 4.0])]
+        )
+        assert series[1:] == expected
+
+    def test_restrict(self, series: DatedPricesSeries):
+        range_ = DateRange.from_string("2021-11-02", "2021-11-30")
+        assert series.restrict(range_) == series[1:]
+
+    def test_compress(self, series: DatedPricesSeries):
+        dates = DateSequence.from_string(["2021-11-01"])
+        assert series.compress(dates) == series[:1]
+
+
 class TestDatedPricesSeriesToBasic:
     def test_when_one(self):
         value = ("2021-11-01", (1.0, 2.0))
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from portan.source.price.matrix import PriceMatrix
+from portan.source.price.sequence import PriceSequence
+
+
+@pytest.fixture(scope="module")
+def matrix() -> PriceMatrix:
+    return PriceMatrix(
+        [
+            PriceSequence.from_float([1.0, 2.0, 3.0]),
+            PriceSequence.from_float([4.0, 5.0, 6.0]),
+        ]
+    )
+
+
+class TestPriceMatrixInvariants:
+    def test_when_length_mismatch(self):
+        with pytest.raises(ValueError, match="same length"):
+            PriceMatrix(
+                [
+                    PriceSequence.from_float([1.0, 2.0]),
+                    PriceSequence.from_float([1.0]),
+                ]
+            )
+
+
+class TestPriceMatrixFromArray:
+    def test(self, matrix: PriceMatrix):
+        result = PriceMatrix.from_array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        assert result == matrix
+
+    def test_when_not_two_dimensional(self):
+        with pytest.raises(ValueError, match="two-dimensional"):
+            PriceMatrix.from_array([1.0, 2.0])
+
+    @pytest.mark.parametrize("price", [np.nan, np.inf, -1.0, 0.0])
+    def test_when_invalid_price(self, price: float):
+        with pytest.raises(ValueError, match="finite, and strictly positive"):
+            PriceMatrix.from_array([[1.0, price]])
+
+    def test_when_writeable(self):
+        block = np.array([[1.0, 2.0]])
+        result = PriceMatrix.from_array(block)
+        block[0, 0] = 3.0
+        assert result == PriceMatrix.from_array([[1.0, 2.0]])
+
+    def test_when_read_only(self):
+        block = np.array([[1.0, 2.0]])
+        block.setflags(write=False)
+        assert PriceMatrix.from_array(block).to_array() is block
+
+
+class TestPriceMatrixSequence:
+    def test_getitem(self, matrix: PriceMatrix):
+        assert matrix[1] == PriceSequence.from_float([4.0, 5.0, 6.0])
+
+    def test_getitem_when_slice(self, matrix: PriceMatrix):
+        assert matrix[1:] == PriceMatrix.from_array([[4.0, 5.0, 6.0]])
+
+    def test_iter(self, matrix: PriceMatrix):
+        assert tuple(matrix) == (matrix[0], matrix[1])
+
+    def test_shape(self, matrix: PriceMatrix):
+        assert (matrix.nrows, matrix.ncols) == (2, 3)
+
+
+class TestPriceMatrixTranspose:
+    def test(self, matrix: PriceMatrix):
+        expected = PriceMatrix.from_array([[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]])
+        assert matrix.transpose() == expected
+
+    def test_shares_prices(self, matrix: PriceMatrix):
+        result = matrix.transpose().to_array()
+        assert np.shares_memory(result, matrix.to_array())
+
+
+class TestPriceMatrixToArray:
+    def test_is_read_only(self, matrix: PriceMatrix):
+        with pytest.raises(ValueError):
+            matrix.to_array()[0, 0] = 1.0
+
+
+class TestPriceMatrixEmpty:
+    def test(self):
+        assert PriceMatrix([]).to_array().shape == (0, 0)
+
+    def test_transpose_when_empty_sequences(self):
+        matrix = PriceMatrix([PriceSequence([]), PriceSequence([])])
+        assert matrix.transpose() == PriceMatrix([])
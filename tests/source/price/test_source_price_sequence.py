@@ -1,5 +1,6 @@
 from typing import Tuple
 
+import numpy as np
 import pytest
 
 from portan.source.price import Price
@@ -25,6 +26,19 @@ class TestPriceSequenceAlternativeConstructors:
         result = PriceSequence.from_float(value for value in sequence)
         assert result == sequence
 
+    @pytest.mark.parametrize("value", [np.nan, np.inf, -np.inf, -1.0, 0.0])
+    def test_from_float_when_invalid(self, value: float):
+        with pytest.raises(ValueError, match="positive.*row is 1"):
+            PriceSequence.from_float([1.0, value, 2.0])
+
+    def test_from_array(self, sequence: PriceSequence):
+        result = PriceSequence.from_array(np.array([1.0, 2.0, 3.0]))
+        assert result == sequence
+
+    def test_from_array_when_not_one_dimensional(self):
+        with pytest.raises(ValueError, match="one-dimensional"):
+            PriceSequence.from_array(np.ones((2, 2)))
+
 
 class TestPriceSequenceAdd:
     def test(self, sequence: PriceSequence, values: Tuple[Price, ...]):
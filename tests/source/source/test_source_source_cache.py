@@ -0,0 +1,404 @@
+import os
+from typing import List, Tuple
+
+import pytest
+
+from portan.source import report
+from portan.source.date import Date
+from portan.source.date.range import DateRange
+from portan.source.dated.price.series import DatedPriceSeries
+from portan.source.exception import SourceError
+from portan.source.source.cache import CachedSource
+from portan.source.source.single import ISingleSource
+
+_SERIES = DatedPriceSeries.from_basic(
+    [
+        ("2021-09-01", 1.0),
+        ("2021-09-02", 2.0),
+        ("2021-09-03", 3.0),
+        ("2021-09-06", 4.0),
+        ("2021-09-07", 5.0),
+        ("2021-09-08", 6.0),
+    ]
+)
+_ADJUSTED = DatedPriceSeries.from_basic(
+    (date, price / 2.0) for date, price in _SERIES.to_basic()
+)
+
+
+class _SingleStub(ISingleSource):
+    def __init__(self):
+        self.calls: List[Tuple[str, DateRange]] = []
+        self.series = _SERIES
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        self.calls.append((ticker, range_))
+        return self.series.restrict(range_)
+
+
+@pytest.fixture(scope="function")
+def single() -> _SingleStub:
+    return _SingleStub()
+
+
+@pytest.fixture(scope="function")
+def source(single: _SingleStub, tmp_path) -> CachedSource:
+    return CachedSource(single, str(tmp_path), "stub")
+
+
+class _RevisedSingleStub(ISingleSource):
+    def __init__(self):
+        self.calls: List[Tuple[str, DateRange]] = []
+        self.version = 1.0
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        self.calls.append((ticker, range_))
+        today = Date.today()
+        dated = DatedPriceSeries.from_basic(
+            [
+                (str(today.decrement(by=2)), 1.0),
+                (str(today.decrement()), 2.0),
+                (str(today), self.version),
+            ]
+        )
+        return dated.restrict(range_)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCachedSourceInvariants:
+    @pytest.mark.parametrize("ttl, recent", [(-1.0, 1), (None, 0)])
+    def test_when_invalid(self, tmp_path, ttl, recent: int):
+        with pytest.raises(ValueError, match="ttl must be non-negative"):
+            CachedSource(
+                _SingleStub(),
+                str(tmp_path),
+                "stub",
+                ttl=ttl,
+                recent=recent,
+            )
+
+    @pytest.mark.parametrize("memory", [0, -1])
+    def test_when_memory_is_invalid(self, tmp_path, memory: int):
+        with pytest.raises(ValueError, match="memory must be strictly"):
+            CachedSource(_SingleStub(), str(tmp_path), "stub", memory=memory)
+
+    def test_when_valid(self, tmp_path):
+        CachedSource(_SingleStub(), str(tmp_path), "stub", ttl=0.0, recent=1)
+
+
+class TestCachedSourceProperties:
+    def test_single(self, source: CachedSource, single: _SingleStub):
+        assert source.single is single
+
+    def test_set_single(self, source: CachedSource, single: _SingleStub):
+        with pytest.raises(AttributeError):
+            source.single = single
+
+
+class TestCachedSourceGet:
+    def test_when_uncached(self, source: CachedSource, single: _SingleStub):
+        range_ = DateRange.from_string("2021-09-02", "2021-09-06")
+        result = source.get("AAPL", range_)
+        assert result == _SERIES.restrict(range_)
+        assert single.calls == [("AAPL", range_)]
+
+    def test_when_cached(self, source: CachedSource, single: _SingleStub):
+        range_ = DateRange.from_string("2021-09-01", "2021-09-08")
+        source.get("AAPL", range_)
+        inside = DateRange.from_string("2021-09-02", "2021-09-06")
+        result = source.get("AAPL", inside)
+        assert result == _SERIES.restrict(inside)
+        assert single.calls == [("AAPL", range_)]
+
+    def test_when_partially_cached(
+        self,
+        source: CachedSource,
+        single: _SingleStub,
+    ):
+        source.get("AAPL", DateRange.from_string("2021-09-02", "2021-09-03"))
+        range_ = DateRange.from_string("2021-09-01", "2021-09-08")
+        result = source.get("AAPL", range_)
+        assert result == _SERIES
+        assert single.calls[1:] == [
+            ("AAPL", DateRange.from_string("2021-09-01", "2021-09-01")),
+            # from the last price cached, to verify it is unchanged!
+            ("AAPL", DateRange.from_string("2021-09-03", "2021-09-08")),
+        ]
+
+    def test_when_other_ticker(
+        self,
+        source: CachedSource,
+        single: _SingleStub,
+    ):
+        range_ = DateRange.from_string("2021-09-01", "2021-09-08")
+        source.get("AAPL", range_)
+        source.get("SQ", range_)
+        assert single.calls == [("AAPL", range_), ("SQ", range_)]
+
+    def test_when_persisted(self, single: _SingleStub, tmp_path):
+        range_ = DateRange.from_string("2021-09-01", "2021-09-08")
+        CachedSource(single, str(tmp_path), "stub").get("AAPL", range_)
+        other = _SingleStub()
+        result = CachedSource(other, str(tmp_path), "stub").get("AAPL", range_)
+        assert result == _SERIES
+        assert other.calls == []
+
+    def test_when_other_name(self, single: _SingleStub, tmp_path):
+        range_ = DateRange.from_string("2021-09-01", "2021-09-08")
+        CachedSource(single, str(tmp_path), "stub").get("AAPL", range_)
+        other = _SingleStub()
+        CachedSource(other, str(tmp_path), "other").get("AAPL", range_)
+        assert other.calls == [("AAPL", range_)]
+
+    @pytest.mark.parametrize("content", ["{", '{"prices": []}'])
+    def test_when_corrupted(self, single: _SingleStub, tmp_path, content):
+        os.makedirs(tmp_path / "stub")
+        with open(tmp_path / "stub" / "AAPL.json", "w") as f:
+            f.write(content)
+        source = CachedSource(single, str(tmp_path), "stub")
+        range_ = DateRange.from_string("2021-09-01", "2021-09-08")
+        with report.recording() as recorder:
+            result = source.get("AAPL", range_)
+        assert result == _SERIES
+        assert recorder.report()[0].discarded == 1
+
+    def test_when_not_corrupted(self, source: CachedSource):
+        range_ = DateRange.from_string("2021-09-01", "2021-09-08")
+        with report.recording() as recorder:
+            source.get("AAPL", range_)
+        assert recorder.report()[0].discarded == 0
+
+    def test_when_write_fails(
+        self,
+        source: CachedSource,
+        tmp_path,
+        monkeypatch,
+    ):
+        def fail(src: str, dst: str):
+            raise OSError("cannot replace")
+
+        monkeypatch.setattr(os, "replace", fail)
+        range_ = DateRange.from_string("2021-09-01", "2021-09-08")
+        with pytest.raises(SourceError, match="cannot cache"):
+            source.get("AAPL", range_)
+        assert os.listdir(tmp_path / "stub") == []  # no temporary file!
+
+    def test_when_ticker_is_not_a_valid_file_name(
+        self,
+        source: CachedSource,
+        single: _SingleStub,
+    ):
+        range_ = DateRange.from_string("2021-09-01", "2021-09-08")
+        source.get("A/B", range_)
+        source.get("A/B", range_)
+        assert single.calls == [("A/B", range_)]
+
+    def test_when_range_includes_today(
+        self,
+        source: CachedSource,
+        single: _SingleStub,
+    ):
+        today = Date.today()
+        range_ = DateRange(today.decrement(by=8), today)
+        source.get("AAPL", range_)
+        source.get("AAPL", range_)
+        assert single.calls[1:] == [("AAPL", DateRange(today, today))]
+
+    def test_when_cached_in_memory(
+        self,
+        source: CachedSource,
+        single: _SingleStub,
+        tmp_path,
+    ):
+        range_ = DateRange.from_string("2021-09-01", "2021-09-08")
+        source.get("AAPL", range_)
+        os.remove(tmp_path / "stub" / "AAPL.json")
+        assert source.get("AAPL", range_) == _SERIES
+        assert single.calls == [("AAPL", range_)]
+
+    def test_when_evicted_from_memory(self, single: _SingleStub, tmp_path):
+        source = CachedSource(single, str(tmp_path), "stub", memory=1)
+        range_ = DateRange.from_string("2021-09-01", "2021-09-08")
+        source.get("AAPL", range_)
+        source.get("MSFT", range_)  # evicts AAPL!
+        os.remove(tmp_path / "stub" / "AAPL.json")
+        assert source.get("AAPL", range_) == _SERIES
+        assert single.calls == [
+            ("AAPL", range_),
+            ("MSFT", range_),
+            ("AAPL", range_),
+        ]
+
+    def test_when_evicted_from_memory_is_read(
+        self,
+        single: _SingleStub,
+        tmp_path,
+    ):
+        source = CachedSource(single, str(tmp_path), "stub", memory=1)
+        range_ = DateRange.from_string("2021-09-01", "2021-09-08")
+        source.get("AAPL", range_)
+        source.get("MSFT", range_)  # evicts AAPL!
+        assert source.get("AAPL", range_) == _SERIES
+        assert len(single.calls) == 2  # served from disk!
+
+
+class TestCachedSourceGetRevised:
+    @pytest.fixture(scope="function")
+    def range_(self) -> DateRange:
+        return DateRange.from_string("2021-09-01", "2021-09-08")
+
+    def test_when_unchanged(self, source: CachedSource, range_: DateRange):
+        source.get("AAPL", DateRange.from_string("2021-09-01", "2021-09-03"))
+        source.get("AAPL", range_)
+        assert source.revisions("AAPL") == 0
+
+    def test_when_adjusted(
+        self,
+        source: CachedSource,
+        single: _SingleStub,
+        range_: DateRange,
+    ):
+        source.get("AAPL", DateRange.from_string("2021-09-01", "2021-09-03"))
+        single.series = _ADJUSTED  # e.g., split since cached!
+        with report.recording() as recorder:
+            result = source.get("AAPL", range_)
+        assert result == _ADJUSTED
+        assert single.calls[-1] == ("AAPL", range_)  # in full!
+        assert source.revisions("AAPL") == 1
+        assert recorder.report()[0].cache == report.MISS
+        assert recorder.report()[0].discarded == 1
+
+    def test_when_adjusted_is_persisted(
+        self,
+        single: _SingleStub,
+        range_: DateRange,
+        tmp_path,
+    ):
+        source = CachedSource(single, str(tmp_path), "stub")
+        source.get("AAPL", DateRange.from_string("2021-09-01", "2021-09-03"))
+        single.series = _ADJUSTED
+        source.get("AAPL", DateRange.from_string("2021-09-04", "2021-09-08"))
+        other = CachedSource(single, str(tmp_path), "stub")
+        count = len(single.calls)
+        result = other.get("AAPL", range_)
+        assert result == _ADJUSTED
+        assert len(single.calls) == count + 1  # stale prices discarded!
+
+
+class TestCachedSourceReport:
+    def test(self, source: CachedSource):
+        range_ = DateRange.from_string("2021-09-02", "2021-09-06")
+        statuses = []
+        for range_ in [
+            DateRange.from_string("2021-09-02", "2021-09-03"),
+            DateRange.from_string("2021-09-02", "2021-09-03"),
+            DateRange.from_string("2021-09-01", "2021-09-08"),
+        ]:
+            with report.recording() as recorder:
+                source.get("AAPL", range_)
+            statuses.append(recorder.report()[0].cache)
+        assert statuses == [report.MISS, report.HIT, report.PARTIAL]
+
+
+class TestCachedSourceGetRevisable:
+    @pytest.fixture(scope="function")
+    def single(self) -> _RevisedSingleStub:
+        return _RevisedSingleStub()
+
+    @pytest.fixture(scope="function")
+    def clock(self) -> _Clock:
+        return _Clock()
+
+    @pytest.fixture(scope="function")
+    def source(
+        self,
+        single: _RevisedSingleStub,
+        clock: _Clock,
+        tmp_path,
+    ) -> CachedSource:
+        return CachedSource(
+            single,
+            str(tmp_path),
+            "stub",
+            ttl=60.0,
+            recent=2,
+            clock=clock,
+        )
+
+    @pytest.fixture(scope="function")
+    def range_(self) -> DateRange:
+        today = Date.today()
+        return DateRange(today.decrement(by=8), today)
+
+    def test_when_fresh(
+        self,
+        source: CachedSource,
+        single: _RevisedSingleStub,
+        clock: _Clock,
+        range_: DateRange,
+    ):
+        first = source.get("AAPL", range_)
+        single.version = 2.0
+        clock.now = 60.0
+        assert source.get("AAPL", range_) == first
+        assert single.calls == [("AAPL", range_)]  # a single fetch!
+
+    def test_when_stale(
+        self,
+        source: CachedSource,
+        single: _RevisedSingleStub,
+        clock: _Clock,
+        range_: DateRange,
+    ):
+        first = source.get("AAPL", range_)
+        single.version = 2.0
+        clock.now = 61.0
+        assert source.get("AAPL", range_) == first  # served stale!
+        source.join(5.0)
+        today = Date.today()
+        assert single.calls[1:] == [
+            ("AAPL", DateRange(today.decrement(), today))
+        ]
+        assert float(source.get("AAPL", range_).prices[-1]) == 2.0
+        assert len(single.calls) == 2
+
+    def test_when_recent_days_are_not_persisted(
+        self,
+        single: _RevisedSingleStub,
+        range_: DateRange,
+        tmp_path,
+    ):
+        CachedSource(single, str(tmp_path), "stub", recent=2).get(
+            "AAPL", range_
+        )
+        other = _RevisedSingleStub()
+        CachedSource(other, str(tmp_path), "stub", recent=2).get("AAPL", range_)
+        today = Date.today()
+        assert other.calls == [  # from the last price cached!
+            ("AAPL", DateRange(today.decrement(by=2), today))
+        ]
+
+    def test_when_revalidation_fails(
+        self,
+        source: CachedSource,
+        single: _RevisedSingleStub,
+        clock: _Clock,
+        range_: DateRange,
+    ):
+        first = source.get("AAPL", range_)
+
+        def fail(ticker: str, range_: DateRange) -> DatedPriceSeries:
+            raise SourceError("cannot source prices")
+
+        single.get = fail
+        clock.now = 61.0
+        source.get("AAPL", range_)
+        source.join(5.0)
+        assert source.get("AAPL", range_) == first  # still served stale!
@@ -0,0 +1,114 @@
+from threading import Lock
+from typing import List, Tuple
+
+import pytest
+
+from portan.source.date import Date
+from portan.source.date.range import DateRange
+from portan.source.dated.price.series import DatedPriceSeries
+from portan.source.exception import SourceError
+from portan.source.source.cache import CachedSource
+from portan.source.source.chunked import ChunkedSource
+from portan.source.source.single import ISingleSource
+
+_SERIES = DatedPriceSeries.from_basic(
+    [
+        ("2019-12-30", 1.0),
+        ("2019-12-31", 2.0),
+        ("2020-01-02", 3.0),
+        ("2020-12-31", 4.0),
+        ("2021-01-04", 5.0),
+        ("2021-03-01", 6.0),
+    ]
+)
+_RANGE = DateRange.from_string("2019-06-01", "2021-03-01")
+_CHUNKS = [
+    DateRange.from_string("2019-06-01", "2019-12-31"),
+    DateRange.from_string("2020-01-01", "2020-12-31"),
+    DateRange.from_string("2021-01-01", "2021-03-01"),
+]
+
+
+class _SingleStub(ISingleSource):
+    def __init__(self, failing: Tuple[DateRange, ...] = (), wider=False):
+        self.calls: List[Tuple[str, DateRange]] = []
+        self.failing = failing
+        self.series = _SERIES
+        self._wider = wider
+        self._lock = Lock()
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        with self._lock:
+            self.calls.append((ticker, range_))
+        if any(value.end == range_.end for value in self.failing):  # anchored!
+            raise SourceError("cannot source prices")
+        if self._wider:  # e.g., a day on each side of the range!
+            range_ = DateRange(range_.begin.decrement(), range_.end.increment())
+        return self.series.restrict(range_)
+
+
+class TestChunkedSourceInvariants:
+    @pytest.mark.parametrize("years, workers", [(0, 1), (1, 0), (-1, -1)])
+    def test_when_negative_or_zero(self, years: int, workers: int):
+        with pytest.raises(ValueError, match="strictly positive"):
+            ChunkedSource(_SingleStub(), years=years, workers=workers)
+
+    def test_when_positive(self):
+        ChunkedSource(_SingleStub(), years=1, workers=1)  # does not raise
+
+
+class TestChunkedSourceProperties:
+    def test_single(self):
+        single = _SingleStub()
+        assert ChunkedSource(single).single is single
+
+    def test_years(self):
+        assert ChunkedSource(_SingleStub(), years=5).years == 5
+
+
+class TestChunkedSourceGet:
+    def test(self):
+        single = _SingleStub()
+        result = ChunkedSource(single).get("AAPL", _RANGE)
+        assert result == _SERIES
+        assert sorted(single.calls, key=lambda c: str(c[1])) == [
+            ("AAPL", chunk) for chunk in _CHUNKS
+        ]
+
+    def test_when_single_chunk(self):
+        single = _SingleStub()
+        range_ = DateRange.from_string("2020-01-01", "2020-06-30")
+        result = ChunkedSource(single).get("AAPL", range_)
+        assert result == _SERIES.restrict(range_)
+        assert single.calls == [("AAPL", range_)]
+
+    def test_when_chunks_overlap(self):
+        single = _SingleStub(wider=True)
+        assert ChunkedSource(single).get("AAPL", _RANGE) == _SERIES
+
+    def test_when_chunk_fails(self):
+        single = _SingleStub(failing=(_CHUNKS[1],))
+        with pytest.raises(SourceError):
+            ChunkedSource(single).get("AAPL", _RANGE)
+        assert len(single.calls) == 3  # every chunk completes!
+
+    def test_when_chunk_fails_and_cached(self, tmp_path):
+        single = _SingleStub(failing=(_CHUNKS[1],))
+        source = ChunkedSource(CachedSource(single, str(tmp_path), "stub"))
+        with pytest.raises(SourceError):
+            source.get("AAPL", _RANGE)
+        single.failing = ()
+        assert source.get("AAPL", _RANGE) == _SERIES
+        assert single.calls[3:] == [  # from the last price cached!
+            ("AAPL", DateRange.from_string("2019-12-31", "2020-12-31"))
+        ]
+
+    def test_when_revised_and_cached(self, tmp_path):
+        single = _SingleStub()
+        source = ChunkedSource(CachedSource(single, str(tmp_path), "stub"))
+        source.get("AAPL", DateRange(_RANGE.begin, Date("2021-02-01")))
+        single.series = DatedPriceSeries.from_basic(
+            (date, price / 2.0) for date, price in _SERIES.to_basic()
+        )  # e.g., split since cached!
+        assert source.get("AAPL", _RANGE) == single.series
+        assert source.single.revisions("AAPL") == 1
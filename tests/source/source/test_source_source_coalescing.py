@@ -0,0 +1,169 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+from typing import List, Tuple
+
+import pytest
+
+from portan.source.date.range import DateRange
+from portan.source.dated.price.series import DatedPriceSeries
+from portan.source.exception import SourceError
+from portan.source.source.coalescing import (
+    AsyncCoalescingSource,
+    CoalescingSource,
+)
+from portan.source.source.single import IAsyncSingleSource, ISingleSource
+
+_PRICES = DatedPriceSeries.from_basic(
+    [
+        ("2021-08-02", 1.0),
+        ("2021-08-03", 2.0),
+        ("2021-08-04", 3.0),
+        ("2021-08-05", 4.0),
+    ]
+)
+_WIDE = DateRange.from_string("2021-08-02", "2021-08-05")
+_NARROW = DateRange.from_string("2021-08-03", "2021-08-04")
+_OUTSIDE = DateRange.from_string("2021-08-04", "2021-08-06")
+
+
+class _BlockingSingleStub(ISingleSource):
+    def __init__(self, fails: bool = False):
+        self.calls: List[Tuple[str, DateRange]] = []
+        self.started = Event()
+        self.release = Event()
+        self._fails = fails
+        self._lock = Lock()
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        with self._lock:
+            self.calls.append((ticker, range_))
+        self.started.set()
+        self.release.wait(5.0)
+        if self._fails:
+            raise SourceError("cannot source prices")
+        return _PRICES.restrict(range_)
+
+
+class TestCoalescingSourceProperties:
+    def test_single(self):
+        single = _BlockingSingleStub()
+        assert CoalescingSource(single).single is single
+
+    def test_set_single(self):
+        source = CoalescingSource(_BlockingSingleStub())
+        with pytest.raises(AttributeError):
+            source.single = _BlockingSingleStub()
+
+
+class TestCoalescingSourceGet:
+    @staticmethod
+    def _get_while_in_flight(
+        source: CoalescingSource,
+        single: _BlockingSingleStub,
+        ranges: List[Tuple[str, DateRange]],
+    ) -> list:
+        with ThreadPoolExecutor(len(ranges) + 1) as executor:
+            leader = executor.submit(source.get, "AAPL", _WIDE)
+            single.started.wait(5.0)
+            others = [executor.submit(source.get, *args) for args in ranges]
+            single.release.set()
+            return [f.result() for f in [leader, *others]]
+
+    def test_when_same_range(self):
+        single = _BlockingSingleStub()
+        source = CoalescingSource(single)
+        results = self._get_while_in_flight(
+            source, single, [("AAPL", _WIDE)] * 3
+        )
+        assert single.calls == [("AAPL", _WIDE)]
+        assert all(result == _PRICES for result in results)
+
+    def test_when_subset_range(self):
+        single = _BlockingSingleStub()
+        source = CoalescingSource(single)
+        results = self._get_while_in_flight(source, single, [("AAPL", _NARROW)])
+        assert single.calls == [("AAPL", _WIDE)]
+        assert results[1] == _PRICES.restrict(_NARROW)
+
+    @pytest.mark.parametrize(
+        "ticker, range_",
+        [("AAPL", _OUTSIDE), ("SQ", _WIDE)],
+    )
+    def test_when_not_in_flight(self, ticker: str, range_: DateRange):
+        single = _BlockingSingleStub()
+        source = CoalescingSource(single)
+        self._get_while_in_flight(source, single, [(ticker, range_)])
+        assert len(single.calls) == 2
+        assert set(single.calls) == {("AAPL", _WIDE), (ticker, range_)}
+
+    def test_when_landed(self):
+        single = _BlockingSingleStub()
+        single.release.set()
+        source = CoalescingSource(single)
+        source.get("AAPL", _WIDE)
+        source.get("AAPL", _WIDE)
+        assert len(single.calls) == 2  # nothing is cached!
+
+    def test_when_error(self):
+        single = _BlockingSingleStub(fails=True)
+        source = CoalescingSource(single)
+        with pytest.raises(SourceError):
+            self._get_while_in_flight(source, single, [("AAPL", _WIDE)])
+        assert len(single.calls) == 1
+
+
+class _AsyncSingleStub(IAsyncSingleSource):
+    def __init__(self):
+        self.calls: List[Tuple[str, DateRange]] = []
+
+    async def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        self.calls.append((ticker, range_))
+        await asyncio.sleep(0.01)
+        return _PRICES.restrict(range_)
+
+
+class TestAsyncCoalescingSourceProperties:
+    def test_single(self):
+        single = _AsyncSingleStub()
+        assert AsyncCoalescingSource(single).single is single
+
+
+class TestAsyncCoalescingSourceGet:
+    def test_when_overlapping(self):
+        single = _AsyncSingleStub()
+        source = AsyncCoalescingSource(single)
+
+        async def gather():
+            return await asyncio.gather(
+                source.get("AAPL", _WIDE),
+                source.get("AAPL", _NARROW),
+                source.get("AAPL", _WIDE),
+                source.get("SQ", _NARROW),
+            )
+
+        results = asyncio.run(gather())
+        assert single.calls == [("AAPL", _WIDE), ("SQ", _NARROW)]
+        assert results[0] == results[2] == _PRICES
+        assert results[1] == results[3] == _PRICES.restrict(_NARROW)
+
+    def test_when_cancelled(self):
+        single = _AsyncSingleStub()
+        source = AsyncCoalescingSource(single)
+
+        async def cancel():
+            first = asyncio.ensure_future(source.get("AAPL", _WIDE))
+            second = asyncio.ensure_future(source.get("AAPL", _WIDE))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(cancel()) == _PRICES
+        assert len(single.calls) == 1
+
+    def test_when_multiple_loops(self):
+        single = _AsyncSingleStub()
+        source = AsyncCoalescingSource(single)
+        asyncio.run(source.get("AAPL", _WIDE))
+        assert asyncio.run(source.get("AAPL", _WIDE)) == _PRICES
+        assert len(single.calls) == 2
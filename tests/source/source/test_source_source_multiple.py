@@ -1,10 +1,22 @@
+import asyncio
+import time
+from threading import Lock
+
 import pytest
 
+from portan.source import report
 from portan.source.date.range import DateRange
 from portan.source.dated.price.series import DatedPriceSeries
 from portan.source.dated.prices.series import DatedPricesSeries
-from portan.source.source.multiple import IMultipleSource, MultipleSource
-from portan.source.source.single import ISingleSource
+from portan.source.exception import SourceError
+from portan.source.source.multiple import (
+    AsyncMultipleSource,
+    ConcurrentMultipleSource,
+    IAsyncMultipleSource,
+    IMultipleSource,
+    MultipleSource,
+)
+from portan.source.source.single import IAsyncSingleSource, ISingleSource
 
 
 class TestIMultipleSourceRaises:
@@ -101,3 +113,264 @@ class TestMultipleSourceGet:
             _SINGLES[0],
         ).add(_SINGLES[1])
         assert result == expected
+
+
+_MANY = tuple(
+    DatedPriceSeries.from_basic(
+        [
+            ("2021-10-29", 1.0 + i),
+            ("2021-11-01", 2.0 + i),
+        ]
+    )
+    for i in range(8)
+)
+
+
+class _ConcurrentSingleStub(ISingleSource):
+    def __init__(self):
+        self._lock = Lock()
+        self._running = 0
+        self.maximum = 0
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        with self._lock:
+            self._running += 1
+            self.maximum = max(self.maximum, self._running)
+        i = int(ticker)
+        time.sleep(0.01 * (len(_MANY) - i))  # last completes first!
+        with self._lock:
+            self._running -= 1
+        if i < 0:
+            raise SourceError("cannot source prices")
+        return _MANY[i]
+
+
+class TestConcurrentMultipleSourceInvariants:
+    @pytest.mark.parametrize("workers", [0, -1])
+    def test_when_workers_is_negative_or_zero(self, workers: int):
+        with pytest.raises(ValueError, match="workers must be strictly"):
+            ConcurrentMultipleSource(_ConcurrentSingleStub(), workers=workers)
+
+    def test_when_workers_is_positive(self):
+        ConcurrentMultipleSource(
+            _ConcurrentSingleStub(),
+            workers=1,
+        )  # does not raise
+
+
+class TestConcurrentMultipleSourceProperties:
+    @pytest.fixture(scope="function")
+    def single(self) -> _ConcurrentSingleStub:
+        return _ConcurrentSingleStub()
+
+    @pytest.fixture(scope="function")
+    def source(
+        self,
+        single: _ConcurrentSingleStub,
+    ) -> ConcurrentMultipleSource:
+        return ConcurrentMultipleSource(single, workers=2)
+
+    def test_single(
+        self,
+        source: ConcurrentMultipleSource,
+        single: _ConcurrentSingleStub,
+    ):
+        assert source.single is single
+
+    def test_set_single(
+        self,
+        source: ConcurrentMultipleSource,
+        single: _ConcurrentSingleStub,
+    ):
+        with pytest.raises(AttributeError):
+            source.single = single
+
+    def test_workers(self, source: ConcurrentMultipleSource):
+        assert source.workers == 2
+
+    def test_set_workers(self, source: ConcurrentMultipleSource):
+        with pytest.raises(AttributeError):
+            source.workers = 2
+
+
+class TestConcurrentMultipleSourceGet:
+    @pytest.fixture(scope="function")
+    def single(self) -> _ConcurrentSingleStub:
+        return _ConcurrentSingleStub()
+
+    @pytest.fixture(scope="function")
+    def source(
+        self,
+        single: _ConcurrentSingleStub,
+    ) -> ConcurrentMultipleSource:
+        return ConcurrentMultipleSource(single, workers=4)
+
+    def test_when_one(self, source: ConcurrentMultipleSource):
+        result = source.get(["0"], _RANGE)
+        expected = DatedPricesSeries.from_single(_MANY[0])
+        assert result == expected
+
+    def test_when_multiple(self, source: ConcurrentMultipleSource):
+        tickers = [str(i) for i in range(len(_MANY))]
+        result = source.get(tickers, _RANGE)
+        expected = MultipleSource(_ConcurrentSingleStub()).get(tickers, _RANGE)
+        assert result == expected
+
+    def test_is_concurrent(
+        self,
+        source: ConcurrentMultipleSource,
+        single: _ConcurrentSingleStub,
+    ):
+        source.get([str(i) for i in range(len(_MANY))], _RANGE)
+        assert 1 < single.maximum <= source.workers
+
+    def test_when_error(self, source: ConcurrentMultipleSource):
+        with pytest.raises(SourceError):
+            source.get(["0", "-1", "2"], _RANGE)
+
+
+class TestIAsyncMultipleSourceRaises:
+    def test(self):
+        source = IAsyncMultipleSource()
+        with pytest.raises(NotImplementedError):
+            asyncio.run(source.get(["AAPL", "SQ"], _RANGE))
+
+
+class TestIAsyncMultipleSourceGet:
+    def test_when_none(self):
+        source = IAsyncMultipleSource()
+        result = asyncio.run(source.get([], _RANGE))
+        assert result == DatedPricesSeries([])
+
+
+class _AsyncSingleStub(IAsyncSingleSource):
+    def __init__(self):
+        self._running = 0
+        self.maximum = 0
+
+    async def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        self._running += 1
+        self.maximum = max(self.maximum, self._running)
+        i = int(ticker)
+        await asyncio.sleep(0.01 * (len(_MANY) - i))  # last completes first!
+        self._running -= 1
+        if i < 0:
+            raise SourceError("cannot source prices")
+        return _MANY[i]
+
+
+class TestAsyncMultipleSourceInvariants:
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    def test_when_concurrency_is_negative_or_zero(self, concurrency: int):
+        with pytest.raises(ValueError, match="strictly positive"):
+            AsyncMultipleSource(_AsyncSingleStub(), concurrency=concurrency)
+
+    def test_when_concurrency_is_positive(self):
+        AsyncMultipleSource(_AsyncSingleStub(), concurrency=1)  # no raise
+
+
+class TestAsyncMultipleSourceProperties:
+    @pytest.fixture(scope="function")
+    def single(self) -> _AsyncSingleStub:
+        return _AsyncSingleStub()
+
+    @pytest.fixture(scope="function")
+    def source(self, single: _AsyncSingleStub) -> AsyncMultipleSource:
+        return AsyncMultipleSource(single)
+
+    def test_single(
+        self, source: AsyncMultipleSource, single: _AsyncSingleStub
+    ):
+        assert source.single is single
+
+    def test_set_single(
+        self,
+        source: AsyncMultipleSource,
+        single: _AsyncSingleStub,
+    ):
+        with pytest.raises(AttributeError):
+            source.single = single
+
+    def test_concurrency(self, single: _AsyncSingleStub):
+        source = AsyncMultipleSource(single, concurrency=2)
+        assert source.concurrency == 2
+
+    def test_set_concurrency(self, source: AsyncMultipleSource):
+        with pytest.raises(AttributeError):
+            source.concurrency = 2
+
+
+class TestAsyncMultipleSourceGet:
+    @pytest.fixture(scope="function")
+    def single(self) -> _AsyncSingleStub:
+        return _AsyncSingleStub()
+
+    @pytest.fixture(scope="function")
+    def source(self, single: _AsyncSingleStub) -> AsyncMultipleSource:
+        return AsyncMultipleSource(single)
+
+    def test_when_one(self, source: AsyncMultipleSource):
+        result = asyncio.run(source.get(["0"], _RANGE))
+        expected = DatedPricesSeries.from_single(_MANY[0])
+        assert result == expected
+
+    def test_when_multiple(self, source: AsyncMultipleSource):
+        tickers = [str(i) for i in range(len(_MANY))]
+        result = asyncio.run(source.get(tickers, _RANGE))
+        expected = MultipleSource(_ConcurrentSingleStub()).get(tickers, _RANGE)
+        assert result == expected
+
+    def test_is_concurrent(
+        self,
+        source: AsyncMultipleSource,
+        single: _AsyncSingleStub,
+    ):
+        asyncio.run(source.get([str(i) for i in range(len(_MANY))], _RANGE))
+        assert single.maximum == len(_MANY)
+
+    def test_when_bounded(self, single: _AsyncSingleStub):
+        source = AsyncMultipleSource(single, concurrency=2)
+        tickers = [str(i) for i in range(len(_MANY))]
+        result = asyncio.run(source.get(tickers, _RANGE))
+        expected = MultipleSource(_ConcurrentSingleStub()).get(tickers, _RANGE)
+        assert result == expected
+        assert single.maximum == 2
+
+    def test_when_error(self, source: AsyncMultipleSource):
+        with pytest.raises(SourceError):
+            asyncio.run(source.get(["0", "-1", "2"], _RANGE))
+
+
+class TestMultipleSourcesReport:
+    def test_when_multiple(self):
+        with report.recording() as recorder:
+            MultipleSource(_SingleStub()).get(_TICKERS, _RANGE)
+        result = recorder.report()
+        assert [(value.ticker, value.rows) for value in result] == [
+            ("a", 2),
+            ("b", 2),
+        ]
+        assert all(report.GET in value.phases for value in result)
+
+    def test_when_concurrent(self):
+        tickers = [str(i) for i in range(len(_MANY))]
+        source = ConcurrentMultipleSource(_ConcurrentSingleStub(), workers=4)
+        with report.recording() as recorder:
+            source.get(tickers, _RANGE)  # recorded across threads!
+        result = recorder.report()
+        assert sorted(value.ticker for value in result) == tickers
+        assert all(value.rows == 2 for value in result)
+
+    def test_when_async(self):
+        async def get():
+            with report.recording() as recorder:
+                await AsyncMultipleSource(_AsyncSingleStub()).get(
+                    ["0", "1"], _RANGE
+                )
+            return recorder.report()
+
+        result = asyncio.run(get())
+        assert sorted((value.ticker, value.rows) for value in result) == [
+            ("0", 2),
+            ("1", 2),
+        ]
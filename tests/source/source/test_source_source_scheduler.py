@@ -0,0 +1,250 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import List, Tuple
+
+import pytest
+
+from portan.source.date.range import DateRange
+from portan.source.dated.price.series import DatedPriceSeries
+from portan.source.exception import SourceError, TransientSourceError
+from portan.source.source.scheduler import (
+    AdaptiveLimiter,
+    ScheduledSource,
+    TokenBucket,
+)
+from portan.source.source.single import ISingleSource
+
+_RANGE = DateRange.from_string("2021-08-02", "2021-08-03")
+_PRICES = DatedPriceSeries.from_basic([("2021-08-02", 1.0)])
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.slept.append(seconds)
+
+
+class TestTokenBucketInvariants:
+    @pytest.mark.parametrize("rate, burst", [(0.0, 1), (-1.0, 1), (1.0, 0)])
+    def test_when_negative_or_zero(self, rate: float, burst: int):
+        with pytest.raises(ValueError, match="strictly positive"):
+            TokenBucket(rate, burst)
+
+    def test_when_positive(self):
+        TokenBucket(1.0, 1)  # does not raise
+
+
+class TestTokenBucketProperties:
+    def test_rate(self):
+        assert TokenBucket(2.0, 3).rate == 2.0
+
+    def test_burst(self):
+        assert TokenBucket(2.0, 3).burst == 3
+
+
+class TestTokenBucketAcquire:
+    def test_when_burst(self):
+        clock = _Clock()
+        bucket = TokenBucket(2.0, 3, clock=clock, sleep=clock.sleep)
+        for _ in range(3):
+            bucket.acquire()
+        assert clock.slept == []
+
+    def test_when_empty(self):
+        clock = _Clock()
+        bucket = TokenBucket(2.0, 1, clock=clock, sleep=clock.sleep)
+        for _ in range(3):
+            bucket.acquire()
+        assert clock.slept == [0.5, 1.0]  # each waits for its own token!
+
+    def test_when_refilled(self):
+        clock = _Clock()
+        bucket = TokenBucket(2.0, 1, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        clock.now = 10.0
+        bucket.acquire()
+        bucket.acquire()
+        assert clock.slept == [0.5]  # refill is capped by burst!
+
+
+class TestAdaptiveLimiterInvariants:
+    @pytest.mark.parametrize(
+        "initial, minimum, maximum",
+        [(4, 0, 8), (0, 1, 8), (9, 1, 8), (4, 5, 8)],
+    )
+    def test_when_invalid(self, initial: int, minimum: int, maximum: int):
+        with pytest.raises(ValueError, match="initial must be"):
+            AdaptiveLimiter(initial, minimum=minimum, maximum=maximum)
+
+    @pytest.mark.parametrize("latency", [0.0, -1.0])
+    def test_when_latency_is_invalid(self, latency: float):
+        with pytest.raises(ValueError, match="latency must be"):
+            AdaptiveLimiter(4, latency=latency)
+
+    def test_when_valid(self):
+        AdaptiveLimiter(4, minimum=1, maximum=8)  # does not raise
+
+
+class TestAdaptiveLimiterProperties:
+    def test_latency(self):
+        assert AdaptiveLimiter(4, latency=1.5).latency == 1.5
+
+    def test_set_latency(self):
+        with pytest.raises(AttributeError):
+            AdaptiveLimiter(4).latency = 1.5
+
+
+class TestAdaptiveLimiterAdapt:
+    def test_when_succeed(self):
+        limiter = AdaptiveLimiter(2, maximum=8)
+        for _ in range(2):
+            limiter.succeed(0.1)
+        assert limiter.limit == 3
+
+    def test_when_succeed_at_maximum(self):
+        limiter = AdaptiveLimiter(2, maximum=2)
+        limiter.succeed(0.1)
+        assert limiter.limit == 2
+
+    def test_when_throttle(self):
+        limiter = AdaptiveLimiter(8, minimum=3, maximum=8)
+        limiter.throttle()
+        assert limiter.limit == 4
+        limiter.throttle()
+        assert limiter.limit == 3
+
+    def test_when_slow(self):
+        limiter = AdaptiveLimiter(8, maximum=8, latency=1.0)
+        limiter.succeed(2.0)
+        assert limiter.limit == 4
+
+
+class TestAdaptiveLimiterSlot:
+    def test_is_limited(self):
+        limiter = AdaptiveLimiter(2, maximum=2)
+        active, peak, lock = [0], [0], Lock()
+
+        def occur():
+            with limiter.slot():
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                with lock:
+                    active[0] -= 1
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(lambda _: occur(), range(64)))
+        assert peak[0] <= 2
+
+
+class _FlakySingleStub(ISingleSource):
+    def __init__(self, failures: int, error: type = TransientSourceError):
+        self.calls = 0
+        self._failures = failures
+        self._error = error
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        self.calls += 1
+        if self.calls <= self._failures:
+            raise self._error("cannot source prices")
+        return _PRICES
+
+
+class TestScheduledSourceInvariants:
+    @pytest.mark.parametrize("retries, backoff", [(-1, 0.0), (0, -1.0)])
+    def test_when_negative(self, retries: int, backoff: float):
+        with pytest.raises(ValueError, match="non-negative"):
+            ScheduledSource(
+                _FlakySingleStub(0),
+                retries=retries,
+                backoff=backoff,
+            )
+
+
+class TestScheduledSourceProperties:
+    def test_single(self):
+        single = _FlakySingleStub(0)
+        assert ScheduledSource(single).single is single
+
+    def test_limiter(self):
+        limiter = AdaptiveLimiter()
+        source = ScheduledSource(_FlakySingleStub(0), limiter=limiter)
+        assert source.limiter is limiter
+
+
+class TestScheduledSourceGet:
+    def test(self):
+        source = ScheduledSource(_FlakySingleStub(0))
+        assert source.get("AAPL", _RANGE) == _PRICES
+
+    def test_when_transient(self):
+        clock = _Clock()
+        single = _FlakySingleStub(2)
+        limiter = AdaptiveLimiter(8, maximum=8)
+        source = ScheduledSource(
+            single,
+            limiter=limiter,
+            clock=clock,
+            sleep=clock.sleep,
+            uniform=lambda a, b: b,
+        )
+        assert source.get("AAPL", _RANGE) == _PRICES
+        assert single.calls == 3
+        assert limiter.limit == 2  # halved twice!
+        assert clock.slept == [0.5, 1.0]  # exponential backoff!
+
+    def test_when_retries_are_exhausted(self):
+        clock = _Clock()
+        single = _FlakySingleStub(3)
+        source = ScheduledSource(
+            single,
+            retries=2,
+            clock=clock,
+            sleep=clock.sleep,
+        )
+        with pytest.raises(TransientSourceError):
+            source.get("AAPL", _RANGE)
+        assert single.calls == 3
+        assert len(clock.slept) == 2
+
+    def test_when_jittered(self):
+        clock = _Clock()
+        bounds: List[Tuple[float, float]] = []
+
+        def uniform(a: float, b: float) -> float:
+            bounds.append((a, b))
+            return a
+
+        source = ScheduledSource(
+            _FlakySingleStub(1),
+            backoff=0.25,
+            clock=clock,
+            sleep=clock.sleep,
+            uniform=uniform,
+        )
+        source.get("AAPL", _RANGE)
+        assert bounds == [(0.0, 0.25)]
+        assert clock.slept == [0.0]
+
+    def test_when_not_transient(self):
+        clock = _Clock()
+        single = _FlakySingleStub(1, error=SourceError)
+        source = ScheduledSource(single, clock=clock, sleep=clock.sleep)
+        with pytest.raises(SourceError):
+            source.get("AAPL", _RANGE)
+        assert single.calls == 1
+        assert clock.slept == []
+
+    def test_when_bucket(self):
+        clock = _Clock()
+        bucket = TokenBucket(1.0, 1, clock=clock, sleep=clock.sleep)
+        source = ScheduledSource(_FlakySingleStub(0), bucket=bucket)
+        source.get("AAPL", _RANGE)
+        source.get("AAPL", _RANGE)
+        assert clock.slept == [1.0]
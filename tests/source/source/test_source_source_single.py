@@ -1,10 +1,17 @@
+import asyncio
+from threading import get_ident
+
 import pytest
 
 from portan.source.date import Date
 from portan.source.date.range import DateRange
 from portan.source.date.sequence import DateSequence
 from portan.source.dated.price.series import DatedPriceSeries
-from portan.source.source.single import ISingleSource
+from portan.source.source.single import (
+    AsyncSingleSource,
+    IAsyncSingleSource,
+    ISingleSource,
+)
 from portan.source.yahoo import Yahoo
 
 
@@ -158,3 +165,60 @@ class TestISingleSourceUnavailableData:
     ):
         result = source.get(ticker, range_)
         assert result.dates == expected
+
+
+class TestIAsyncSingleSourceRaises:
+    def test(self, ticker: str):
+        source = IAsyncSingleSource()
+        with pytest.raises(NotImplementedError):
+            asyncio.run(
+                source.get(
+                    ticker,
+                    DateRange.from_string("2021-08-03", "2021-08-04"),
+                )
+            )
+
+
+_SERIES = DatedPriceSeries.from_basic([("2021-08-03", 1.0)])
+
+
+class _SingleStub(ISingleSource):
+    def __init__(self):
+        self.threads = []
+
+    def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        self.threads.append(get_ident())
+        return _SERIES
+
+
+class TestAsyncSingleSourceProperties:
+    @pytest.fixture(scope="function")
+    def single(self) -> _SingleStub:
+        return _SingleStub()
+
+    @pytest.fixture(scope="function")
+    def source(self, single: _SingleStub) -> AsyncSingleSource:
+        return AsyncSingleSource(single)
+
+    def test_single(self, source: AsyncSingleSource, single: _SingleStub):
+        assert source.single is single
+
+    def test_set_single(self, source: AsyncSingleSource, single: _SingleStub):
+        with pytest.raises(AttributeError):
+            source.single = single
+
+
+class TestAsyncSingleSourceGet:
+    def test(self, ticker: str):
+        single = _SingleStub()
+        source = AsyncSingleSource(single)
+        range_ = DateRange.from_string("2021-08-03", "2021-08-04")
+        result = asyncio.run(source.get(ticker, range_))
+        assert result is _SERIES
+
+    def test_does_not_block_event_loop(self, ticker: str):
+        single = _SingleStub()
+        source = AsyncSingleSource(single)
+        range_ = DateRange.from_string("2021-08-03", "2021-08-04")
+        asyncio.run(source.get(ticker, range_))
+        assert single.threads != [get_ident()]
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Tuple
 
 import pytest
@@ -5,9 +6,9 @@ import pytest
 from portan.source.date.range import DateRange
 from portan.source.dated.price.series import DatedPriceSeries
 from portan.source.dated.prices.series import DatedPricesSeries
-from portan.source.source import PriceSource
-from portan.source.source.multiple import IMultipleSource
-from portan.source.source.single import ISingleSource
+from portan.source.source import AsyncPriceSource, PriceSource
+from portan.source.source.multiple import IAsyncMultipleSource, IMultipleSource
+from portan.source.source.single import IAsyncSingleSource, ISingleSource
 
 _SINGLE_RESULT = DatedPriceSeries([])
 _MULTIPLE_RESULT = DatedPricesSeries([])
@@ -75,3 +76,79 @@ class TestPriceSourceGet:
     def test_when_iterable(self, source: PriceSource, range_: DateRange):
         result = source.get(["AAPL"], range_)
         assert result is _MULTIPLE_RESULT
+
+
+class _AsyncSingleStub(IAsyncSingleSource):
+    async def get(self, ticker: str, range_: DateRange) -> DatedPriceSeries:
+        return _SINGLE_RESULT
+
+
+class _AsyncMultipleStub(IAsyncMultipleSource):
+    async def _get(
+        self,
+        tickers: Tuple[str, ...],
+        range_: DateRange,
+    ) -> DatedPricesSeries:
+        return _MULTIPLE_RESULT
+
+
+class TestAsyncPriceSourceProperties:
+    @pytest.fixture(scope="class")
+    def single(self) -> _AsyncSingleStub:
+        return _AsyncSingleStub()
+
+    @pytest.fixture(scope="class")
+    def multiple(self) -> _AsyncMultipleStub:
+        return _AsyncMultipleStub()
+
+    @pytest.fixture(scope="class")
+    def source(
+        self,
+        single: _AsyncSingleStub,
+        multiple: _AsyncMultipleStub,
+    ) -> AsyncPriceSource:
+        return AsyncPriceSource(single, multiple)
+
+    def test_single(self, source: AsyncPriceSource, single: _AsyncSingleStub):
+        assert source.single is single
+
+    def test_set_single(
+        self,
+        source: AsyncPriceSource,
+        single: _AsyncSingleStub,
+    ):
+        with pytest.raises(AttributeError):
+            source.single = single
+
+    def test_multiple(
+        self,
+        source: AsyncPriceSource,
+        multiple: _AsyncMultipleStub,
+    ):
+        assert source.multiple is multiple
+
+    def test_set_multiple(
+        self,
+        source: AsyncPriceSource,
+        multiple: _AsyncMultipleStub,
+    ):
+        with pytest.raises(AttributeError):
+            source.multiple = multiple
+
+
+class TestAsyncPriceSourceGet:
+    @pytest.fixture(scope="class")
+    def range_(self) -> DateRange:
+        return DateRange.from_string("2021-10-31", "2021-11-01")
+
+    @pytest.fixture(scope="class")
+    def source(self) -> AsyncPriceSource:
+        return AsyncPriceSource(_AsyncSingleStub(), _AsyncMultipleStub())
+
+    def test_when_string(self, source: AsyncPriceSource, range_: DateRange):
+        result = asyncio.run(source.get("AAPL", range_))
+        assert result is _SINGLE_RESULT
+
+    def test_when_iterable(self, source: AsyncPriceSource, range_: DateRange):
+        result = asyncio.run(source.get(["AAPL"], range_))
+        assert result is _MULTIPLE_RESULT
@@ -0,0 +1,170 @@
+import json
+
+import numpy as np
+import pytest
+
+from portan.source.archive import (
+    ArchiveMultipleSource,
+    ArchiveSource,
+    UniverseArchive,
+)
+from portan.source.date.range import DateRange
+from portan.source.dated.price.series import DatedPriceSeries
+from portan.source.dated.prices.series import DatedPricesSeries
+from portan.source.exception import SourceError
+from portan.source.source.multiple import MultipleSource
+
+_PRICES = {
+    "AAPL": DatedPriceSeries.from_basic(
+        [
+            ("2021-08-02", 1.0),
+            ("2021-08-03", 2.0),
+            ("2021-08-04", 3.0),
+            ("2021-08-05", 4.0),
+        ]
+    ),
+    "SQ": DatedPriceSeries.from_basic(
+        [
+            ("2021-08-03", 5.0),
+            ("2021-08-05", 6.0),
+            ("2021-08-06", 7.0),
+        ]
+    ),
+}
+_RANGE = DateRange.from_string("2021-08-03", "2021-08-05")
+
+
+@pytest.fixture(scope="function")
+def archive(tmp_path) -> UniverseArchive:
+    return UniverseArchive.write(str(tmp_path), _PRICES)
+
+
+class TestUniverseArchiveInvariants:
+    def test_when_missing(self, tmp_path):
+        with pytest.raises(ValueError, match="valid archive"):
+            UniverseArchive(str(tmp_path))
+
+    def test_when_unsorted_dates(self, archive: UniverseArchive, tmp_path):
+        np.save(
+            tmp_path / "dates.npy",
+            np.array(["2021-08-03", "2021-08-02"], dtype="datetime64[D]"),
+        )
+        with pytest.raises(ValueError, match="valid archive"):
+            UniverseArchive(str(tmp_path))
+
+    def test_when_shapes_mismatch(self, archive: UniverseArchive, tmp_path):
+        with open(tmp_path / "tickers.json", "w") as f:
+            json.dump(["AAPL"], f)
+        with pytest.raises(ValueError, match="valid archive"):
+            UniverseArchive(str(tmp_path))
+
+    def test_when_invalid_dates(self, archive: UniverseArchive, tmp_path):
+        np.save(
+            tmp_path / "dates.npy",
+            np.array(["0000-12-31", "2021-08-02"], dtype="datetime64[D]"),
+        )
+        np.save(tmp_path / "prices.npy", np.ones((2, 2)))
+        with pytest.raises(ValueError, match="valid archive"):
+            UniverseArchive(str(tmp_path))
+
+    def test_when_valid(self, archive: UniverseArchive, tmp_path):
+        UniverseArchive(str(tmp_path))  # does not raise
+
+
+class TestUniverseArchiveProperties:
+    def test_directory(self, archive: UniverseArchive, tmp_path):
+        assert archive.directory == str(tmp_path)
+
+    def test_dates(self, archive: UniverseArchive):
+        assert isinstance(archive.dates, np.memmap)
+        assert len(archive.dates) == 5
+
+    def test_dates_is_read_only(self, archive: UniverseArchive):
+        with pytest.raises(ValueError):
+            archive.dates[0] = archive.dates[1]
+
+    def test_tickers(self, archive: UniverseArchive):
+        assert archive.tickers == ("AAPL", "SQ")
+
+    def test_set_tickers(self, archive: UniverseArchive):
+        with pytest.raises(AttributeError):
+            archive.tickers = ()
+
+
+class TestUniverseArchiveSelect:
+    def test_when_one(self, archive: UniverseArchive):
+        dates, prices = archive.select(["SQ"], _RANGE)
+        assert dates.tolist() == list(
+            np.array(["2021-08-03", "2021-08-05"], dtype="datetime64[D]")
+        )
+        assert prices.tolist() == [[5.0, 6.0]]
+
+    def test_when_multiple(self, archive: UniverseArchive):
+        dates, prices = archive.select(["SQ", "AAPL"], _RANGE)
+        assert len(dates) == 2
+        assert prices.tolist() == [[5.0, 6.0], [2.0, 4.0]]
+
+    @pytest.mark.parametrize(
+        "tickers, expected",
+        [(["AAPL"], [[2.0]]), (["AAPL", "SQ"], [[2.0], [5.0]])],
+    )
+    def test_when_consecutive_and_available(
+        self,
+        archive: UniverseArchive,
+        tickers,
+        expected,
+    ):
+        range_ = DateRange.from_string("2021-08-03", "2021-08-03")
+        dates, prices = archive.select(tickers, range_)
+        assert np.shares_memory(dates, archive.dates)  # views!
+        assert isinstance(prices, np.memmap)
+        assert prices.tolist() == expected
+
+    def test_when_unknown(self, archive: UniverseArchive):
+        dates, prices = archive.select(["AAPL", "BATMAN"], _RANGE)
+        assert len(dates) == 0
+        assert prices.shape == (2, 0)
+
+    def test_when_outside(self, archive: UniverseArchive):
+        range_ = DateRange.from_string("2021-09-01", "2021-09-30")
+        dates, prices = archive.select(["AAPL"], range_)
+        assert len(dates) == 0
+        assert prices.shape == (1, 0)
+
+
+class TestArchiveSourceGet:
+    @pytest.mark.parametrize("ticker", ["AAPL", "SQ"])
+    def test(self, archive: UniverseArchive, ticker: str):
+        result = ArchiveSource(archive).get(ticker, _RANGE)
+        assert result == _PRICES[ticker].restrict(_RANGE)
+
+    def test_when_unknown(self, archive: UniverseArchive):
+        result = ArchiveSource(archive).get("BATMAN", _RANGE)
+        assert result == DatedPriceSeries([])
+
+    def test_when_invalid(self, archive: UniverseArchive, tmp_path):
+        np.save(tmp_path / "prices.npy", -np.ones((2, 5)))
+        source = ArchiveSource(UniverseArchive(str(tmp_path)))
+        with pytest.raises(SourceError):
+            source.get("AAPL", _RANGE)
+
+
+class TestArchiveMultipleSourceGet:
+    @pytest.mark.parametrize(
+        "tickers",
+        [["AAPL"], ["AAPL", "SQ"], ["SQ", "AAPL"], ["SQ", "SQ"]],
+    )
+    def test(self, archive: UniverseArchive, tickers):
+        result = ArchiveMultipleSource(archive).get(tickers, _RANGE)
+        expected = MultipleSource(ArchiveSource(archive)).get(tickers, _RANGE)
+        assert result == expected
+
+    def test_when_unknown(self, archive: UniverseArchive):
+        result = ArchiveMultipleSource(archive).get(["AAPL", "BATMAN"], _RANGE)
+        assert result == DatedPricesSeries([])
+
+    def test_when_invalid(self, archive: UniverseArchive, tmp_path):
+        np.save(tmp_path / "prices.npy", -np.ones((2, 5)))
+        source = ArchiveMultipleSource(UniverseArchive(str(tmp_path)))
+        with pytest.raises(SourceError):
+            source.get(["AAPL", "SQ"], _RANGE)
@@ -0,0 +1,231 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import Any, Dict, Iterator, List
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from portan.source import report
+from portan.source.chart import YahooChart
+from portan.source.date.range import DateRange
+from portan.source.dated.price.series import DatedPriceSeries
+from portan.source.exception import SourceError, TransientSourceError
+
+# response recorded from the chart endpoint (trimmed to a few days), where
+# the 2021-08-06 has a dividend without any price
+_RECORDED: Dict[str, Any] = {
+    "chart": {
+        "result": [
+            {
+                "meta": {
+                    "currency": "USD",
+                    "symbol": "AAPL",
+                    "exchangeName": "NMS",
+                    "instrumentType": "EQUITY",
+                    "gmtoffset": -14400,
+                    "timezone": "EDT",
+                    "exchangeTimezoneName": "America/New_York",
+                },
+                "timestamp": [
+                    1627911000,
+                    1627997400,
+                    1628083800,
+                    1628170200,
+                    1628256600,
+                ],
+                "events": {
+                    "dividends": {
+                        "1628256600": {"amount": 0.22, "date": 1628256600}
+                    }
+                },
+                "indicators": {
+                    "quote": [
+                        {
+                            "close": [145.52, 147.36, 146.95, 147.06, None],
+                            "volume": [
+                                62880000,
+                                64786600,
+                                56368300,
+                                46397700,
+                                None,
+                            ],
+                        }
+                    ],
+                    "adjclose": [
+                        {"adjclose": [144.01, 145.83, 145.42, 145.53, None]}
+                    ],
+                },
+            }
+        ],
+        "error": None,
+    }
+}
+_NOT_FOUND: Dict[str, Any] = {
+    "chart": {
+        "result": None,
+        "error": {
+            "code": "Not Found",
+            "description": "No data found, symbol may be delisted",
+        },
+    }
+}
+
+
+class _StandIn(BaseHTTPRequestHandler):
+    responses: Dict[str, Any] = {}
+    queries: List[Dict[str, List[str]]] = []
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.queries.append(parse_qs(url.query))
+        ticker = url.path.rsplit("/", 1)[-1]
+        status, body = self.responses.get(ticker, (404, _NOT_FOUND))
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass  # silent!
+
+
+@pytest.fixture(scope="module")
+def base_url() -> Iterator[str]:
+    _StandIn.responses = {
+        "AAPL": (200, _RECORDED),
+        "EMPTY": (200, {"chart": {"result": [{"meta": {}}], "error": None}}),
+        "BROKEN": (200, b"{not json"),
+        "DOWN": (500, b""),
+        "THROTTLED": (429, b""),
+    }
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="module")
+def source(base_url: str) -> YahooChart:
+    return YahooChart(base_url=base_url, timeout=5.0)
+
+
+@pytest.fixture(scope="module")
+def range_() -> DateRange:
+    return DateRange.from_string("2021-08-02", "2021-08-06")
+
+
+class TestYahooChartInvariants:
+    @pytest.mark.parametrize("timeout", [0.0, -1.0])
+    def test_when_timeout_is_negative_or_zero(self, timeout: float):
+        with pytest.raises(ValueError, match="timeout must be strictly"):
+            YahooChart(timeout=timeout)
+
+    def test_when_timeout_is_positive(self):
+        YahooChart(timeout=1.0)  # does not raise
+
+
+class TestYahooChartProperties:
+    def test_base_url(self):
+        source = YahooChart(base_url="http://localhost:8080/")
+        assert source.base_url == "http://localhost:8080"
+
+    def test_timeout(self):
+        assert YahooChart(timeout=1.0).timeout == 1.0
+
+    def test_set_base_url(self, source: YahooChart):
+        with pytest.raises(AttributeError):
+            source.base_url = "http://localhost"
+
+
+class TestYahooChartGet:
+    def test(self, source: YahooChart, range_: DateRange):
+        result = source.get("AAPL", range_)
+        expected = DatedPriceSeries.from_basic(
+            [
+                ("2021-08-02", 144.01),
+                ("2021-08-03", 145.83),
+                ("2021-08-04", 145.42),
+                ("2021-08-05", 145.53),
+            ]
+        )
+        assert result == expected
+
+    def test_when_restricted(self, source: YahooChart):
+        range_ = DateRange.from_string("2021-08-03", "2021-08-04")
+        result = source.get("AAPL", range_)
+        expected = DatedPriceSeries.from_basic(
+            [("2021-08-03", 145.83), ("2021-08-04", 145.42)]
+        )
+        assert result == expected
+
+    def test_requests_a_wider_period(
+        self,
+        source: YahooChart,
+        range_: DateRange,
+    ):
+        _StandIn.queries.clear()
+        source.get("AAPL", range_)
+        query = _StandIn.queries[-1]
+        assert int(query["period1"][0]) == 1627776000  # 2021-08-01
+        assert int(query["period2"][0]) == 1628380800  # 2021-08-08
+        assert query["events"] == ["dividends,splits"]
+
+    @pytest.mark.parametrize("ticker", ["BATMAN", "EMPTY"])
+    def test_when_no_prices(
+        self,
+        source: YahooChart,
+        range_: DateRange,
+        ticker: str,
+    ):
+        assert source.get(ticker, range_) == DatedPriceSeries([])
+
+    @pytest.mark.parametrize("ticker", ["BROKEN", "DOWN"])
+    def test_when_unexpected_error(
+        self,
+        source: YahooChart,
+        range_: DateRange,
+        ticker: str,
+    ):
+        with pytest.raises(SourceError, match="unexpected error"):
+            source.get(ticker, range_)
+
+    @pytest.mark.parametrize(
+        "ticker, transient",
+        [("BROKEN", False), ("DOWN", True), ("THROTTLED", True)],
+    )
+    def test_when_transient(
+        self,
+        source: YahooChart,
+        range_: DateRange,
+        ticker: str,
+        transient: bool,
+    ):
+        with pytest.raises(SourceError) as info:
+            source.get(ticker, range_)
+        assert isinstance(info.value, TransientSourceError) == transient
+
+    def test_when_missing_price(self, base_url: str, range_: DateRange):
+        recorded = json.loads(json.dumps(_RECORDED))
+        result = recorded["chart"]["result"][0]
+        result["indicators"]["adjclose"][0]["adjclose"][1] = None
+        _StandIn.responses["MISSING"] = (200, recorded)
+        source = YahooChart(base_url=base_url)
+        with pytest.raises(SourceError, match="unexpected format"):
+            source.get("MISSING", range_)
+
+    def test_when_unreachable(self, range_: DateRange):
+        source = YahooChart(base_url="http://127.0.0.1:9", timeout=1.0)
+        with pytest.raises(SourceError, match="unexpected error"):
+            source.get("AAPL", range_)
+
+    def test_reports_bytes(self, source: YahooChart, range_: DateRange):
+        with report.recording() as recorder:
+            source.get("AAPL", range_)
+        result = recorder.report()[0]
+        assert result.bytes_ == len(json.dumps(_RECORDED).encode())
+        assert set(result.phases) == {report.NETWORK, report.PARSE}
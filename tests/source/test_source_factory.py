@@ -1,7 +1,32 @@
+import os
+
 import pytest
+from requests import Session
 
-from portan.source.factory import PriceSourceFactory
-from portan.source.source.multiple import MultipleSource
+import portan.source.factory as factory_module
+from portan.source.chart import DEFAULT_BASE_URL, YahooChart
+from portan.source.date import Date
+from portan.source.date.range import DateRange
+from portan.source.factory import (
+    LOCAL_DIRECTORY_VARIABLE,
+    YAHOO_BASE_URL_VARIABLE,
+    PriceSourceFactory,
+)
+from portan.source.local import Local
+from portan.source.source.cache import CachedSource
+from portan.source.source.chunked import ChunkedSource
+from portan.source.source.coalescing import (
+    AsyncCoalescingSource,
+    CoalescingSource,
+)
+from portan.source.source.multiple import (
+    AsyncMultipleSource,
+    ConcurrentMultipleSource,
+    MultipleSource,
+)
+from portan.source.source.scheduler import ScheduledSource
+from portan.source.source.single import AsyncSingleSource
+from portan.source.synthetic import Synthetic
 from portan.source.yahoo import Yahoo
 
 
@@ -17,6 +42,297 @@ class TestPriceSourceFactory:
         assert isinstance(result.multiple, MultipleSource)
         assert isinstance(result.multiple.single, Yahoo)
 
+    def test_when_yahoo_chart(self, factory: PriceSourceFactory):
+        result = factory.get("yahoo-chart")
+        assert isinstance(result.single, YahooChart)
+        assert isinstance(result.multiple, MultipleSource)
+
+    def test_when_synthetic(self, factory: PriceSourceFactory):
+        result = factory.get("synthetic")
+        assert isinstance(result.single, Synthetic)
+        assert isinstance(result.multiple, MultipleSource)
+
     def test_when_unknown(self, factory: PriceSourceFactory):
         with pytest.raises(ValueError, match="unknown source"):
             factory.get("batman")
+
+
+class TestPriceSourceFactoryCache:
+    def test_when_yahoo(self, tmp_path):
+        factory = PriceSourceFactory(cache=str(tmp_path))
+        result = factory.get("yahoo")
+        assert isinstance(result.single, CachedSource)
+        assert isinstance(result.single.single, Yahoo)
+        assert isinstance(result.multiple, MultipleSource)
+        assert result.multiple.single is result.single
+
+    def test_when_unknown(self, tmp_path):
+        factory = PriceSourceFactory(cache=str(tmp_path))
+        with pytest.raises(ValueError, match="unknown source"):
+            factory.get("batman")
+
+
+class TestPriceSourceFactoryWorkers:
+    def test_when_yahoo(self):
+        factory = PriceSourceFactory(workers=4)
+        result = factory.get("yahoo")
+        assert isinstance(result.single, Yahoo)
+        assert isinstance(result.multiple, ConcurrentMultipleSource)
+        assert result.multiple.single is result.single
+        assert result.multiple.workers == 4
+        assert isinstance(result.single.session, Session)
+
+    def test_when_yahoo_is_shared(self):
+        factory = PriceSourceFactory(workers=4)
+        sessions = {id(factory.get("yahoo").single.session) for _ in range(2)}
+        assert len(sessions) == 1
+
+    def test_when_no_workers(self, factory: PriceSourceFactory):
+        assert factory.get("yahoo").single.session is None
+
+    def test_when_invalid_workers(self):
+        factory = PriceSourceFactory(workers=0)
+        with pytest.raises(ValueError, match="workers"):
+            factory.get("yahoo")
+
+
+class TestPriceSourceFactoryGetAsync:
+    def test_when_yahoo(self, factory: PriceSourceFactory):
+        result = factory.get_async("yahoo")
+        assert isinstance(result.single, AsyncSingleSource)
+        assert isinstance(result.single.single, Yahoo)
+        assert isinstance(result.multiple, AsyncMultipleSource)
+        assert result.multiple.single is result.single
+        assert result.multiple.concurrency is None
+
+    def test_when_workers(self):
+        result = PriceSourceFactory(workers=4).get_async("yahoo")
+        assert result.multiple.concurrency == 4
+
+    @pytest.mark.parametrize("workers", [0, -1])
+    def test_when_workers_is_negative_or_zero(self, workers: int):
+        with pytest.raises(ValueError, match="strictly positive"):
+            PriceSourceFactory(workers=workers).get_async("yahoo")
+
+    def test_when_cache(self, tmp_path):
+        factory = PriceSourceFactory(cache=str(tmp_path))
+        result = factory.get_async("yahoo")
+        assert isinstance(result.single.single, CachedSource)
+
+    def test_when_unknown(self, factory: PriceSourceFactory):
+        with pytest.raises(ValueError, match="unknown source"):
+            factory.get_async("batman")
+
+
+class TestPriceSourceFactoryCoalesce:
+    def test_when_yahoo(self):
+        result = PriceSourceFactory(coalesce=True).get("yahoo")
+        assert isinstance(result.single, CoalescingSource)
+        assert isinstance(result.single.single, Yahoo)
+        assert isinstance(result.multiple, MultipleSource)
+
+    def test_when_cache(self, tmp_path):
+        factory = PriceSourceFactory(cache=str(tmp_path), coalesce=True)
+        result = factory.get("yahoo")
+        assert isinstance(result.single.single, CachedSource)
+        assert result.multiple.single is result.single
+
+    def test_is_shared(self):
+        first = PriceSourceFactory(coalesce=True).get("yahoo")
+        second = PriceSourceFactory(coalesce=True).get("yahoo")
+        assert first.single is second.single
+
+    def test_is_not_shared_when_arguments_differ(self, tmp_path):
+        first = PriceSourceFactory(coalesce=True).get("yahoo")
+        factory = PriceSourceFactory(cache=str(tmp_path), coalesce=True)
+        second = factory.get("yahoo")
+        assert first.single is not second.single
+
+    def test_is_evicted_when_least_recently_used(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(factory_module, "_COALESCING_MAXIMUM", 1)
+        first = PriceSourceFactory(coalesce=True).get("yahoo")
+        PriceSourceFactory(cache=str(tmp_path), coalesce=True).get("yahoo")
+        second = PriceSourceFactory(coalesce=True).get("yahoo")
+        assert first.single is not second.single
+
+    def test_get_async(self):
+        first = PriceSourceFactory(coalesce=True).get_async("yahoo")
+        second = PriceSourceFactory(coalesce=True).get_async("yahoo")
+        assert isinstance(first.single, AsyncCoalescingSource)
+        assert first.single is second.single
+        assert (
+            first.single.single.single
+            is PriceSourceFactory(coalesce=True).get("yahoo").single
+        )
+
+    def test_when_unknown(self):
+        with pytest.raises(ValueError, match="unknown source"):
+            PriceSourceFactory(coalesce=True).get("batman")
+
+
+class TestPriceSourceFactoryRate:
+    def test_when_yahoo(self):
+        result = PriceSourceFactory(rate=2.0).get("yahoo")
+        assert isinstance(result.single, ScheduledSource)
+        assert isinstance(result.single.single, Yahoo)
+        assert isinstance(result.multiple, MultipleSource)
+        assert result.multiple.single is result.single
+
+    def test_when_cache(self, tmp_path):
+        factory = PriceSourceFactory(cache=str(tmp_path), rate=2.0)
+        result = factory.get("yahoo")
+        assert isinstance(result.single, CachedSource)  # hits are free!
+        assert isinstance(result.single.single, ScheduledSource)
+
+    def test_when_workers(self):
+        result = PriceSourceFactory(rate=2.0, workers=2).get("yahoo")
+        assert result.single.limiter.limit == 2
+
+    @pytest.mark.parametrize("rate", [0.0, -1.0])
+    def test_when_negative_or_zero(self, rate: float):
+        with pytest.raises(ValueError, match="strictly positive"):
+            PriceSourceFactory(rate=rate).get("yahoo")
+
+
+class TestPriceSourceFactoryLatency:
+    def test_when_rate(self):
+        result = PriceSourceFactory(rate=2.0, latency=1.5).get("yahoo")
+        assert isinstance(result.single, ScheduledSource)
+        assert result.single.limiter.latency == 1.5
+
+    def test_when_no_rate(self):
+        result = PriceSourceFactory(latency=1.5, workers=2).get("yahoo")
+        assert isinstance(result.single, ScheduledSource)
+        assert result.single.limiter.latency == 1.5
+        assert result.single.limiter.limit == 2
+
+    def test_when_no_latency(self):
+        result = PriceSourceFactory(rate=2.0).get("yahoo")
+        assert result.single.limiter.latency is None
+
+    @pytest.mark.parametrize("latency", [0.0, -1.0])
+    def test_when_negative_or_zero(self, latency: float):
+        with pytest.raises(ValueError, match="strictly positive"):
+            PriceSourceFactory(latency=latency).get("yahoo")
+
+    def test_when_coalesced(self):
+        first = PriceSourceFactory(coalesce=True, latency=1.0).get("yahoo")
+        second = PriceSourceFactory(coalesce=True, latency=2.0).get("yahoo")
+        assert first.single is not second.single
+
+
+class TestPriceSourceFactoryTTL:
+    def test_when_cache(self, tmp_path):
+        factory = PriceSourceFactory(cache=str(tmp_path), ttl=60.0)
+        result = factory.get("yahoo")
+        assert isinstance(result.single, CachedSource)
+
+    @pytest.mark.parametrize("cache", [None, "cache"])
+    def test_when_negative(self, tmp_path, cache):
+        directory = None if cache is None else str(tmp_path / cache)
+        factory = PriceSourceFactory(cache=directory, ttl=-1.0)
+        with pytest.raises(ValueError, match="ttl must be non-negative"):
+            factory.get("yahoo")
+        with pytest.raises(ValueError, match="ttl must be non-negative"):
+            factory.get_async("yahoo")
+
+
+class TestPriceSourceFactoryChunk:
+    def test_when_yahoo(self):
+        result = PriceSourceFactory(chunk=2).get("yahoo")
+        assert isinstance(result.single, ChunkedSource)
+        assert result.single.years == 2
+        assert isinstance(result.single.single, Yahoo)
+
+    def test_when_cache(self, tmp_path):
+        factory = PriceSourceFactory(cache=str(tmp_path), chunk=1)
+        result = factory.get("yahoo")
+        assert isinstance(result.single, ChunkedSource)
+        assert isinstance(result.single.single, CachedSource)  # by chunk!
+
+    @pytest.mark.parametrize("chunk", [0, -1])
+    def test_when_negative_or_zero(self, chunk: int):
+        with pytest.raises(ValueError, match="strictly positive"):
+            PriceSourceFactory(chunk=chunk).get("yahoo")
+
+
+class TestPriceSourceFactoryLocal:
+    def test_when_local(self, tmp_path):
+        factory = PriceSourceFactory(directory=str(tmp_path))
+        result = factory.get("local")
+        assert isinstance(result.single, Local)
+        assert result.single.directory == str(tmp_path)
+        assert isinstance(result.multiple, MultipleSource)
+        assert result.multiple.single is result.single
+
+    def test_when_environment_variable(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(LOCAL_DIRECTORY_VARIABLE, str(tmp_path))
+        result = PriceSourceFactory().get("local")
+        assert result.single.directory == str(tmp_path)
+
+    def test_when_no_directory(self, monkeypatch):
+        monkeypatch.delenv(LOCAL_DIRECTORY_VARIABLE, raising=False)
+        result = PriceSourceFactory().get("local")
+        assert result.single.directory == os.curdir
+
+
+class TestPriceSourceFactorySynthetic:
+    def test_when_settings(self):
+        range_ = DateRange(Date("2021-01-04"), Date("2021-03-31"))
+        settings = dict(seed=1, drift=0.5, volatility=0.1, gaps=0.1, gap=2)
+        result = PriceSourceFactory(**settings).get("synthetic")
+        assert isinstance(result.single, Synthetic)
+        expected = Synthetic(**settings).get("AAPL", range_)
+        assert result.single.get("AAPL", range_) == expected
+
+    def test_when_no_settings(self):
+        range_ = DateRange(Date("2021-01-04"), Date("2021-03-31"))
+        result = PriceSourceFactory().get("synthetic")
+        assert result.single.get("AAPL", range_) == Synthetic().get(
+            "AAPL", range_
+        )
+
+    @pytest.mark.parametrize(
+        "settings",
+        [
+            dict(volatility=-0.1),
+            dict(correlation=1.5),
+            dict(missing=1.0),
+            dict(gaps=-0.1),
+            dict(gap=0),
+        ],
+    )
+    def test_when_invalid(self, settings):
+        with pytest.raises(ValueError, match="cannot instantiate Synthetic"):
+            PriceSourceFactory(**settings).get("synthetic")
+
+    def test_when_coalesced(self):
+        first = PriceSourceFactory(coalesce=True).get("synthetic")
+        second = PriceSourceFactory(coalesce=True, drift=0.1).get("synthetic")
+        third = PriceSourceFactory(coalesce=True, drift=0.1).get("synthetic")
+        assert first.single is not second.single
+        assert second.single is third.single
+
+
+class TestPriceSourceFactoryBaseUrl:
+    def test_when_base_url(self):
+        factory = PriceSourceFactory(base_url="http://127.0.0.1:8080")
+        result = factory.get("yahoo-chart")
+        assert result.single.base_url == "http://127.0.0.1:8080"
+
+    def test_when_environment_variable(self, monkeypatch):
+        monkeypatch.setenv(YAHOO_BASE_URL_VARIABLE, "http://127.0.0.1:8080")
+        result = PriceSourceFactory().get("yahoo-chart")
+        assert result.single.base_url == "http://127.0.0.1:8080"
+
+    def test_when_no_base_url(self, monkeypatch):
+        monkeypatch.delenv(YAHOO_BASE_URL_VARIABLE, raising=False)
+        result = PriceSourceFactory().get("yahoo-chart")
+        assert result.single.base_url == DEFAULT_BASE_URL
+
+    def test_when_coalesced(self):
+        first = PriceSourceFactory(coalesce=True).get("yahoo-chart")
+        second = PriceSourceFactory(
+            coalesce=True, base_url="http://127.0.0.1:8080"
+        ).get("yahoo-chart")
+        assert first.single is not second.single
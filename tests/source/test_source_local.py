@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from portan.source.date.range import DateRange
+from portan.source.dated.price.series import DatedPriceSeries
+from portan.source.exception import SourceError
+from portan.source.local import Local
+
+_RANGE = DateRange.from_string("2021-08-03", "2021-08-05")
+_EXPECTED = DatedPriceSeries.from_basic(
+    [
+        ("2021-08-03", 2.0),
+        ("2021-08-04", 3.0),
+        ("2021-08-05", 4.0),
+    ]
+)
+_CSV = "2021-08-02,1.0\n2021-08-03,2.0\n2021-08-05,4.0\n2021-08-04,3.0\n"
+
+
+@pytest.fixture(scope="function")
+def source(tmp_path) -> Local:
+    return Local(str(tmp_path))
+
+
+def _save_numpy(path, dates, prices, dtype="datetime64[D]"):
+    records = np.empty(
+        len(dates),
+        dtype=[("date", dtype), ("price", np.float64)],
+    )
+    records["date"] = dates
+    records["price"] = prices
+    np.save(path, records)
+
+
+class TestLocalProperties:
+    def test_directory(self, tmp_path):
+        assert Local(str(tmp_path)).directory == str(tmp_path)
+
+    def test_directory_is_expanded(self):
+        assert Local("~").directory != "~"
+
+    def test_set_directory(self, source: Local, tmp_path):
+        with pytest.raises(AttributeError):
+            source.directory = str(tmp_path)
+
+
+class TestLocalGet:
+    def test_when_no_file(self, source: Local):
+        assert source.get("AAPL", _RANGE) == DatedPriceSeries([])
+
+    def test_when_csv(self, source: Local, tmp_path):
+        (tmp_path / "AAPL.csv").write_text(_CSV)
+        assert source.get("AAPL", _RANGE) == _EXPECTED
+
+    def test_when_csv_with_header(self, source: Local, tmp_path):
+        (tmp_path / "AAPL.csv").write_text(f"date,price\n{_CSV}")
+        assert source.get("AAPL", _RANGE) == _EXPECTED
+
+    @pytest.mark.parametrize("content", ["", "date,price\n"])
+    def test_when_csv_is_empty(self, source: Local, tmp_path, content: str):
+        (tmp_path / "AAPL.csv").write_text(content)
+        assert source.get("AAPL", _RANGE) == DatedPriceSeries([])
+
+    @pytest.mark.parametrize("dtype", ["datetime64[D]", "U10"])
+    def test_when_numpy(self, source: Local, tmp_path, dtype: str):
+        _save_numpy(
+            tmp_path / "AAPL.npy",
+            ["2021-08-02", "2021-08-03", "2021-08-05", "2021-08-04"],
+            [1.0, 2.0, 4.0, 3.0],
+            dtype=dtype,
+        )
+        assert source.get("AAPL", _RANGE) == _EXPECTED
+
+    def test_when_numpy_and_csv(self, source: Local, tmp_path):
+        (tmp_path / "AAPL.csv").write_text("2021-08-03,100.0\n")
+        _save_numpy(tmp_path / "AAPL.npy", ["2021-08-03"], [2.0])
+        assert source.get("AAPL", _RANGE) == _EXPECTED[:1]
+
+    def test_when_ticker_is_not_a_valid_file_name(
+        self,
+        source: Local,
+        tmp_path,
+    ):
+        (tmp_path / "A%2FB.csv").write_text(_CSV)
+        assert source.get("A/B", _RANGE) == _EXPECTED
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "2021-08-03\n",  # missing price
+            "2021-08-03,batman\n",  # invalid price
+            "2021-02-31,1.0\n",  # invalid date
+            "2021-08-03,nan\n",  # non-finite price
+            "2021-08-03,-1.0\n",  # negative price
+            "2021-08-03,1.0\n2021-08-03,2.0\n",  # duplicated date
+        ],
+    )
+    def test_when_csv_is_invalid(self, source: Local, tmp_path, content: str):
+        (tmp_path / "AAPL.csv").write_text(content)
+        with pytest.raises(SourceError):
+            source.get("AAPL", _RANGE)
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "2021-08-02,1.0\n2021-08,2.0\n",  # month only
+            "2021-08-02,1.0\n2021-8-3,2.0\n",  # not padded
+            "2021-08-02,1.0\n2021-08-03T00,2.0\n",  # with time
+        ],
+    )
+    def test_when_csv_date_is_malformed(
+        self, source: Local, tmp_path, content: str
+    ):
+        (tmp_path / "AAPL.csv").write_text(content)
+        with pytest.raises(SourceError, match="first offending row is 1"):
+            source.get("AAPL", _RANGE)
+
+    def test_when_numpy_is_invalid(self, source: Local, tmp_path):
+        np.save(tmp_path / "AAPL.npy", np.ones(3))
+        with pytest.raises(SourceError):
+            source.get("AAPL", _RANGE)
@@ -0,0 +1,150 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+import pytest
+
+from portan.source import report
+from portan.source.report import FetchRecorder, FetchReport, TickerReport
+
+
+@pytest.fixture(scope="function")
+def ticker() -> TickerReport:
+    return TickerReport(
+        "AAPL",
+        phases={report.NETWORK: 0.5},
+        rows=2,
+        dropped=1,
+        bytes_=64,
+        cache=report.MISS,
+        discarded=1,
+    )
+
+
+class TestTickerReportProperties:
+    def test_ticker(self, ticker: TickerReport):
+        assert ticker.ticker == "AAPL"
+
+    def test_phases(self, ticker: TickerReport):
+        assert ticker.phases == {report.NETWORK: 0.5}
+
+    def test_rows(self, ticker: TickerReport):
+        assert ticker.rows == 2
+
+    def test_dropped(self, ticker: TickerReport):
+        assert ticker.dropped == 1
+
+    def test_bytes(self, ticker: TickerReport):
+        assert ticker.bytes_ == 64
+
+    def test_cache(self, ticker: TickerReport):
+        assert ticker.cache == report.MISS
+
+    def test_discarded(self, ticker: TickerReport):
+        assert ticker.discarded == 1
+
+    def test_set_rows(self, ticker: TickerReport):
+        with pytest.raises(AttributeError):
+            ticker.rows = 3
+
+
+class TestTickerReportToBasic:
+    def test(self, ticker: TickerReport):
+        assert ticker.to_basic() == {
+            "phases": {"network": 0.5},
+            "rows": 2,
+            "dropped": 1,
+            "bytes": 64,
+            "cache": "miss",
+            "discarded": 1,
+        }
+
+
+class TestFetchReportToBasic:
+    def test(self, ticker: TickerReport):
+        result = FetchReport([ticker], phases={report.ALIGN: 0.25})
+        assert result.to_basic() == {
+            "phases": {"align": 0.25},
+            "tickers": {"AAPL": ticker.to_basic()},
+        }
+
+    def test_when_empty(self):
+        assert FetchReport([]).to_basic() == {"phases": {}, "tickers": {}}
+
+
+class TestFetchRecorderReport:
+    def test(self, ticker: TickerReport):
+        recorder = FetchRecorder()
+        recorder.add_time("AAPL", report.NETWORK, 0.25)
+        recorder.add_time("AAPL", report.NETWORK, 0.25)
+        recorder.add_rows("AAPL", 2)
+        recorder.add_dropped("AAPL", 1)
+        recorder.add_bytes("AAPL", 64)
+        recorder.set_cache("AAPL", report.MISS)
+        recorder.add_discarded("AAPL")
+        assert recorder.report() == FetchReport([ticker])
+
+    def test_when_whole_fetch(self):
+        recorder = FetchRecorder()
+        recorder.add_time(None, report.ALIGN, 0.25)
+        assert recorder.report() == FetchReport([], phases={"align": 0.25})
+
+    @pytest.mark.parametrize(
+        "statuses, expected",
+        [
+            ([report.HIT, report.HIT], report.HIT),
+            ([report.MISS, report.MISS], report.MISS),
+            ([report.HIT, report.MISS], report.PARTIAL),
+            ([report.PARTIAL, report.HIT], report.PARTIAL),
+        ],
+    )
+    def test_when_cache(self, statuses, expected: str):
+        recorder = FetchRecorder()
+        for status in statuses:
+            recorder.set_cache("AAPL", status)
+        assert recorder.report()[0].cache == expected
+
+    def test_is_thread_safe(self):
+        recorder = FetchRecorder()
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(lambda _: recorder.add_rows("A", 1), range(64)))
+        assert recorder.report()[0].rows == 64
+
+
+class TestRecording:
+    def test(self):
+        with report.recording() as recorder:
+            assert report.current() is recorder
+            with report.timed("AAPL", report.PARSE):
+                pass
+            report.count("AAPL", rows=2, bytes_=64)
+            report.cache("AAPL", report.HIT)
+            report.discard("AAPL")
+        result = recorder.report()[0]
+        assert set(result.phases) == {report.PARSE}
+        assert (result.rows, result.bytes_, result.cache) == (2, 64, "hit")
+        assert result.discarded == 1
+
+    def test_when_not_recording(self):
+        assert report.current() is None
+        with report.timed("AAPL", report.PARSE):
+            pass  # does not raise
+        report.count("AAPL", rows=2)
+        report.cache("AAPL", report.HIT)
+        report.discard("AAPL")
+
+    def test_when_nested(self):
+        with report.recording() as outer:
+            with report.recording() as inner:
+                report.count("AAPL", rows=1)
+            assert report.current() is outer
+        assert len(outer.report()) == 0
+        assert len(inner.report()) == 1
+
+    def test_when_thread(self):
+        with report.recording() as recorder:
+            with ThreadPoolExecutor(1) as executor:
+                executor.submit(report.count, "A", rows=1).result()
+                executor.submit(
+                    copy_context().run, report.count, "B", rows=1
+                ).result()
+        assert [value.ticker for value in recorder.report()] == ["B"]
@@ -0,0 +1,119 @@
+import time
+from typing import Iterator
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from portan.source.chart import YahooChart
+from portan.source.date.range import DateRange
+from portan.source.dated.price.series import DatedPriceSeries
+from portan.source.exception import SourceError, TransientSourceError
+from portan.source.standin import StandIn
+from portan.source.synthetic import Synthetic
+
+_RANGE = DateRange.from_string("2021-08-02", "2021-08-31")
+
+
+@pytest.fixture(scope="module")
+def stand_in() -> Iterator[StandIn]:
+    recorded = {"BROKEN": b"{not json", "EMPTY": {"chart": {"result": []}}}
+    with StandIn(Synthetic(missing=0.1), recorded=recorded) as stand_in:
+        yield stand_in
+
+
+@pytest.fixture(scope="module")
+def source(stand_in: StandIn) -> YahooChart:
+    return YahooChart(base_url=stand_in.base_url, timeout=5.0)
+
+
+class TestStandInInvariants:
+    @pytest.mark.parametrize(
+        "keywords",
+        [{"latency": -1.0}, {"throttle": 1.1}, {"errors": -0.1}],
+    )
+    def test_when_invalid(self, keywords):
+        with pytest.raises(ValueError, match="latency must be"):
+            StandIn(**keywords)
+
+    def test_when_valid(self):
+        StandIn(latency=0.0, throttle=1.0, errors=0.0)  # does not raise
+
+
+class TestStandInBaseUrl:
+    def test_when_stopped(self):
+        with pytest.raises(RuntimeError, match="must start"):
+            StandIn().base_url
+
+    def test_when_started(self, stand_in: StandIn):
+        assert stand_in.base_url.startswith("http://127.0.0.1:")
+
+
+class TestStandInStart:
+    def test_when_started(self, stand_in: StandIn):
+        with pytest.raises(RuntimeError, match="already started"):
+            stand_in.start()
+
+    def test_when_restarted(self):
+        stand_in = StandIn()
+        stand_in.start()
+        stand_in.stop()
+        stand_in.start()  # does not raise
+        stand_in.stop()
+
+
+class TestStandInAnswer:
+    def test_when_synthetic(self, source: YahooChart):
+        result = source.get("AAPL", _RANGE)
+        assert result == Synthetic(missing=0.1).get("AAPL", _RANGE)
+
+    def test_when_recorded(self, source: YahooChart):
+        assert source.get("EMPTY", _RANGE) == DatedPriceSeries([])
+        with pytest.raises(SourceError, match="unexpected error"):
+            source.get("BROKEN", _RANGE)
+
+    def test_when_unknown_path(self, stand_in: StandIn):
+        with pytest.raises(HTTPError) as info:
+            urlopen(f"{stand_in.base_url}/batman")
+        assert info.value.code == 404
+
+    def test_when_invalid_query(self, stand_in: StandIn):
+        with pytest.raises(HTTPError) as info:
+            urlopen(f"{stand_in.base_url}/v8/finance/chart/AAPL")
+        assert info.value.code == 400
+
+    def test_counts_requests(self, stand_in: StandIn, source: YahooChart):
+        before = stand_in.requests
+        source.get("AAPL", _RANGE)
+        assert stand_in.requests == before + 1
+
+    def test_when_latency(self):
+        with StandIn(latency=0.05) as stand_in:
+            source = YahooChart(base_url=stand_in.base_url)
+            begin = time.perf_counter()
+            source.get("AAPL", _RANGE)
+            assert time.perf_counter() - begin >= 0.05
+
+    @pytest.mark.parametrize("keyword", ["throttle", "errors"])
+    def test_when_injected(self, keyword: str):
+        with StandIn(**{keyword: 1.0}) as stand_in:
+            source = YahooChart(base_url=stand_in.base_url)
+            with pytest.raises(TransientSourceError):
+                source.get("AAPL", _RANGE)
+
+    def test_when_injected_is_deterministic(self):
+        def statuses(seed: int):
+            with StandIn(errors=0.5, seed=seed) as stand_in:
+                source = YahooChart(base_url=stand_in.base_url)
+                result = []
+                for _ in range(8):
+                    try:
+                        source.get("AAPL", _RANGE)
+                        result.append(True)
+                    except TransientSourceError:
+                        result.append(False)
+                return result
+
+        first = statuses(1)
+        assert first == statuses(1)
+        assert True in first and False in first
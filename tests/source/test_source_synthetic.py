@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from portan.source.date import Date
+from portan.source.date.range import DateRange
+from portan.source.dated.price.series import DatedPriceSeries
+from portan.source.exception import SourceError
+from portan.source.synthetic import Synthetic
+
+_RANGE = DateRange.from_string("2001-01-01", "2020-12-31")
+
+
+def _returns(dated: DatedPriceSeries) -> np.ndarray:
+    return np.diff(np.log(dated.to_arrays()[1]))
+
+
+class TestSyntheticInvariants:
+    @pytest.mark.parametrize(
+        "keywords",
+        [
+            {"volatility": -0.1},
+            {"correlation": -0.1},
+            {"correlation": 1.1},
+            {"missing": 1.0},
+            {"gaps": -0.1},
+            {"gap": 0},
+            {"initial": 0.0},
+        ],
+    )
+    def test_when_invalid(self, keywords):
+        with pytest.raises(ValueError, match="volatility must be"):
+            Synthetic(**keywords)
+
+    def test_when_valid(self):
+        Synthetic(correlation=1.0, missing=0.5, gaps=0.5)  # does not raise
+
+
+class TestSyntheticProperties:
+    def test_seed(self):
+        assert Synthetic(7).seed == 7
+
+
+class TestSyntheticGet:
+    def test(self):
+        range_ = DateRange.from_string("2021-08-02", "2021-08-08")
+        result = Synthetic().get("AAPL", range_)
+        dates = tuple(str(date) for date in result.dates)
+        assert dates == (
+            "2021-08-02",
+            "2021-08-03",
+            "2021-08-04",
+            "2021-08-05",
+            "2021-08-06",
+        )  # business days only!
+
+    def test_is_deterministic(self):
+        assert Synthetic(1).get("AAPL", _RANGE) == Synthetic(1).get(
+            "AAPL", _RANGE
+        )
+
+    @pytest.mark.parametrize("seed, ticker", [(2, "AAPL"), (1, "SQ")])
+    def test_when_other(self, seed: int, ticker: str):
+        assert Synthetic(1).get("AAPL", _RANGE) != Synthetic(seed).get(
+            ticker, _RANGE
+        )
+
+    def test_is_independent_of_range(self):
+        source = Synthetic(missing=0.1, gaps=0.01)
+        inside = DateRange.from_string("2010-03-01", "2010-06-30")
+        result = source.get("AAPL", inside)
+        assert result == source.get("AAPL", _RANGE).restrict(inside)
+
+    def test_when_origin(self):
+        source = Synthetic(origin=Date("2021-08-02"), initial=50.0)
+        range_ = DateRange.from_string("2021-07-01", "2021-08-03")
+        result = source.get("AAPL", range_)
+        assert str(result[0].date) == "2021-08-02"
+        assert float(result[0].value) == 50.0
+
+    def test_when_before_origin(self):
+        range_ = DateRange.from_string("1999-01-01", "1999-12-31")
+        assert Synthetic().get("AAPL", range_) == DatedPriceSeries([])
+
+    def test_moments(self):
+        source = Synthetic(drift=0.0, volatility=0.3, correlation=0.5)
+        a = _returns(source.get("A", _RANGE))
+        b = _returns(source.get("B", _RANGE))
+        assert np.isclose(np.std(a) * np.sqrt(252), 0.3, rtol=0.05)
+        assert np.isclose(np.corrcoef(a, b)[0, 1], 0.5, atol=0.05)
+
+    def test_when_missing(self):
+        complete = Synthetic().get("AAPL", _RANGE)
+        result = Synthetic(missing=0.2).get("AAPL", _RANGE)
+        assert np.isclose(len(result) / len(complete), 0.8, atol=0.02)
+
+    def test_when_gaps(self):
+        result = Synthetic(gaps=0.01, gap=10).get("AAPL", _RANGE)
+        dates = result.to_arrays()[0]
+        assert np.max(np.diff(dates).astype(int)) >= 14  # at least a gap!
+
+    def test_when_overflow(self):
+        with pytest.raises(SourceError, match="overflow"):
+            Synthetic(drift=1e6).get("AAPL", _RANGE)
@@ -1,9 +1,16 @@
+from typing import List
+
 import pytest
+from numpy import nan
+from pandas import DataFrame, DatetimeIndex
+from requests import exceptions as requests_exceptions
 
+import portan.source.yahoo as yahoo
 from portan.source.date import MAX_YEAR
 from portan.source.date.range import DateRange
 from portan.source.date.sequence import DateSequence
-from portan.source.exception import SourceError
+from portan.source.dated.price.series import DatedPriceSeries
+from portan.source.exception import SourceError, TransientSourceError
 from portan.source.yahoo import Yahoo
 
 
@@ -100,3 +107,87 @@ class TestYahooVerbose:
             assert captured.out != ""
         else:
             assert captured.out == ""
+
+
+_DATES = ("2021-08-03", "2021-08-04", "2021-08-05")
+
+
+class _TickerStub:
+    def __init__(self, data: DataFrame):
+        self._data = data
+
+    def __call__(self, ticker: str, **kwargs) -> "_TickerStub":
+        return self
+
+    def history(self, **kwargs) -> DataFrame:
+        return self._data
+
+
+class _FailingTickerStub:
+    def __init__(self, err: Exception):
+        self._err = err
+
+    def __call__(self, ticker: str, **kwargs) -> "_FailingTickerStub":
+        return self
+
+    def history(self, **kwargs) -> DataFrame:
+        raise self._err
+
+
+class TestYahooGet:
+    @pytest.fixture(scope="class")
+    def range_(self) -> DateRange:
+        return DateRange.from_string("2021-08-01", "2021-08-31")
+
+    @staticmethod
+    def _get_data(closes: List[float], tz: str = "Asia/Tokyo") -> DataFrame:
+        return DataFrame(
+            {"Close": closes, "Dividends": 0.0, "Stock Splits": 0.0},
+            index=DatetimeIndex(_DATES[: len(closes)], tz=tz),
+        )
+
+    def test_keeps_local_dates(self, monkeypatch, range_: DateRange):
+        data = self._get_data([1.0, 2.0, 3.0])  # previous day in UTC!
+        monkeypatch.setattr(yahoo, "Ticker", _TickerStub(data))
+        result = Yahoo().get("AAPL", range_)
+        expected = DatedPriceSeries.from_basic(zip(_DATES, [1.0, 2.0, 3.0]))
+        assert result == expected
+
+    def test_when_unsorted(self, monkeypatch, range_: DateRange):
+        data = self._get_data([1.0, 2.0, 3.0]).iloc[::-1]
+        monkeypatch.setattr(yahoo, "Ticker", _TickerStub(data))
+        result = Yahoo().get("AAPL", range_)
+        expected = DatedPriceSeries.from_basic(zip(_DATES, [1.0, 2.0, 3.0]))
+        assert result == expected
+
+    @pytest.mark.parametrize("price", [nan, -1.0, 0.0])
+    def test_when_invalid(self, monkeypatch, range_: DateRange, price: float):
+        data = self._get_data([1.0, price, 3.0])
+        monkeypatch.setattr(yahoo, "Ticker", _TickerStub(data))
+        with pytest.raises(SourceError, match="unexpected format"):
+            Yahoo().get("AAPL", range_)
+
+    @pytest.mark.parametrize(
+        "err",
+        [
+            requests_exceptions.ConnectionError("unreachable"),
+            requests_exceptions.ReadTimeout("timed out"),
+            requests_exceptions.JSONDecodeError(
+                "Expecting value", "Too Many Requests\r\n", 0
+            ),
+            RuntimeError("*** YAHOO! FINANCE IS CURRENTLY DOWN! ***"),
+        ],
+    )
+    def test_when_transient(
+        self, monkeypatch, range_: DateRange, err: Exception
+    ):
+        monkeypatch.setattr(yahoo, "Ticker", _FailingTickerStub(err))
+        with pytest.raises(TransientSourceError):
+            Yahoo().get("AAPL", range_)
+
+    def test_when_not_transient(self, monkeypatch, range_: DateRange):
+        err = KeyError("chart")
+        monkeypatch.setattr(yahoo, "Ticker", _FailingTickerStub(err))
+        with pytest.raises(SourceError) as info:
+            Yahoo().get("AAPL", range_)
+        assert not isinstance(info.value, TransientSourceError)
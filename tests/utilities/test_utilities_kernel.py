@@ -0,0 +1,54 @@
+import statistics as stats
+from math import isclose
+
+import numpy as np
+import pytest
+
+from portan.utilities import kernel
+
+
+@pytest.fixture(scope="module")
+def values():
+    rng = np.random.default_rng(0)
+    return rng.normal(0.0005, 0.01, size=1000).tolist()
+
+
+class TestMean:
+    def test_when_one(self):
+        assert kernel.mean([0.01]) == 0.01
+
+    def test_when_multiple(self, values):
+        result = kernel.mean(values)
+        assert isclose(result, stats.mean(values), rel_tol=2**-52)
+
+    def test_when_exact(self, values):
+        assert kernel.mean(values, exact=True) == stats.mean(values)
+
+    def test_when_sum_overflows(self):
+        values = [1e308, 1e308, -1e308]
+        assert kernel.mean(values) == stats.mean(values)
+
+    def test_when_empty(self):
+        with pytest.raises(stats.StatisticsError):
+            kernel.mean([])
+
+
+class TestStdev:
+    def test_when_multiple(self, values):
+        result = kernel.stdev(values)
+        assert isclose(result, stats.stdev(values), rel_tol=1e-14)
+
+    def test_when_exact(self, values):
+        assert kernel.stdev(values, exact=True) == stats.stdev(values)
+
+    @pytest.mark.parametrize("value", [0.0, 0.1, -0.07, 1e300])
+    def test_when_equal(self, value: float):
+        assert kernel.stdev([value] * 7) == 0.0
+
+    def test_when_squares_overflow(self):
+        values = [1e200, -1e200, 1e200]
+        assert kernel.stdev(values) == stats.stdev(values)
+
+    def test_when_one(self):
+        with pytest.raises(stats.StatisticsError):
+            kernel.stdev([0.01])